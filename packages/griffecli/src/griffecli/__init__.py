@@ -28,11 +28,12 @@ This package provides command-line tools for interacting with griffe.
 - [`griffecli.check`][]: Check for API breaking changes in two versions of the same package.
 - [`griffecli.dump`][]: Load packages data and dump it as JSON.
 - [`griffecli.get_parser`][]: Get the argument parser for the CLI.
+- [`griffecli.watch`][]: Load packages data, dump it, and dump it again each time source files change.
 """
 
 from __future__ import annotations
 
-from griffecli._internal.cli import DEFAULT_LOG_LEVEL, check, dump, get_parser, main
+from griffecli._internal.cli import DEFAULT_LOG_LEVEL, check, dump, get_parser, main, watch
 
 __all__ = [
     "DEFAULT_LOG_LEVEL",
@@ -40,4 +41,5 @@ __all__ = [
     "dump",
     "get_parser",
     "main",
+    "watch",
 ]
@@ -34,8 +34,9 @@ import logging
 import os
 import re
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
+from time import perf_counter_ns
 from typing import IO, TYPE_CHECKING, Any
 
 import colorama
@@ -67,14 +68,64 @@ class _DebugInfo(argparse.Action):
         sys.exit(0)
 
 
-def _print_data(data: str, output_file: str | IO | None) -> None:
+def _dump_data(data: Any, output_file: str | IO | None, output_format: str = "json", **kwargs: Any) -> None:
+    from griffe._internal.encoders import BinaryEncoder, JSONEncoder  # noqa: PLC0415
+
+    if output_format == "binary":
+        binary_data = BinaryEncoder().encode(data)
+        if isinstance(output_file, str):
+            with open(output_file, "wb") as fd:  # noqa: PTH123
+                fd.write(binary_data)
+        else:
+            if output_file is None:
+                output_file = sys.stdout
+            getattr(output_file, "buffer", output_file).write(binary_data)
+        return
+
+    # Stream JSON chunks to the output, instead of building the whole string in memory.
     if isinstance(output_file, str):
         with open(output_file, "w", encoding="utf8") as fd:  # noqa: PTH123
-            print(data, file=fd)
+            json.dump(data, fd, cls=JSONEncoder, **kwargs)
+            print(file=fd)
     else:
         if output_file is None:
             output_file = sys.stdout
-        print(data, file=output_file)
+        json.dump(data, output_file, cls=JSONEncoder, **kwargs)
+        print(file=output_file)
+
+
+def _dump_packages(
+    data_packages: dict[str, Any],
+    output: str | IO | None,
+    output_format: str = "json",
+    *,
+    full: bool = False,
+) -> None:
+    if isinstance(output, str) and output.format(package="package") != output:
+        for package_name, data in data_packages.items():
+            _dump_data(
+                data,
+                output.format(package=package_name),
+                output_format,
+                indent=2,
+                full=full,
+                sort_keys=True,
+            )
+    else:
+        _dump_data(data_packages, output, output_format, indent=2, full=full, sort_keys=True)
+
+
+def _watched_files(roots: Sequence[Path]) -> dict[Path, int]:
+    files = {}
+    for root in roots:
+        paths = root.rglob("*.py*") if root.is_dir() else [root.with_suffix(".py"), root.with_suffix(".pyi")]
+        for path in paths:
+            if path.suffix in {".py", ".pyi"}:
+                try:
+                    files[path] = path.stat().st_mtime_ns
+                except OSError:
+                    continue
+    return files
 
 
 def _load_packages(
@@ -91,6 +142,9 @@ def _load_packages(
     force_inspection: bool = False,
     store_source: bool = True,
     find_stubs_package: bool = False,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
 ) -> GriffeLoader:
     from griffe._internal.loader import GriffeLoader  # noqa: PLC0415
     from griffe._internal.logger import logger  # noqa: PLC0415
@@ -104,20 +158,17 @@ def _load_packages(
         allow_inspection=allow_inspection,
         force_inspection=force_inspection,
         store_source=store_source,
+        workers=workers,
+        cache_dir=cache_dir,
+        profile=profile,
     )
 
-    # Load each package.
-    for package in packages:
-        if not package:
-            logger.debug("Empty package name, continuing")
-            continue
-        logger.info("Loading package %s", package)
-        try:
-            loader.load(package, try_relative_path=True, find_stubs_package=find_stubs_package)
-        except ModuleNotFoundError as error:
-            logger.error("Could not find package %s: %s", package, error)
-        except ImportError:
-            logger.exception("Tried but could not import package %s", package)
+    # Load all packages at once, visiting their modules in a shared pool of workers.
+    if "" in packages:
+        logger.debug("Empty package name, continuing")
+    packages = [package for package in packages if package]
+    logger.info("Loading packages %s", ", ".join(packages))
+    loader.load_many(packages, try_relative_path=True, find_stubs_package=find_stubs_package)
     logger.info("Finished loading packages")
 
     # Resolve aliases.
@@ -215,6 +266,22 @@ def get_parser() -> argparse.ArgumentParser:
             default=False,
             help="Force inspection of everything, even when sources are found.",
         )
+        loading_options.add_argument(
+            "-j",
+            "--workers",
+            metavar="N",
+            type=int,
+            default=None,
+            help="Number of worker processes used to visit modules in parallel.",
+        )
+        loading_options.add_argument(
+            "-C",
+            "--cache-dir",
+            metavar="PATH",
+            type=Path,
+            default=None,
+            help="Directory in which to cache visited and inspected modules.",
+        )
         debug_options = subparser.add_argument_group(title="Debugging options")
         debug_options.add_argument(
             "-L",
@@ -226,6 +293,73 @@ def get_parser() -> argparse.ArgumentParser:
             help="Set the log level: `DEBUG`, `INFO`, `WARNING`, `ERROR`, `CRITICAL`.",
         )
 
+    def add_dump_options(options: argparse._ArgumentGroup) -> None:
+        options.add_argument(
+            "-f",
+            "--full",
+            action="store_true",
+            default=False,
+            help="Whether to dump full data in JSON.",
+        )
+        options.add_argument(
+            "-F",
+            "--format",
+            dest="output_format",
+            choices=("json", "binary"),
+            default="json",
+            help="Output format. The binary format is more compact and faster to load, but can only be loaded by Griffe.",
+        )
+        options.add_argument(
+            "-o",
+            "--output",
+            default=sys.stdout,
+            help="Output file. Supports templating to output each package in its own file, with `{package}`.",
+        )
+        options.add_argument(
+            "-d",
+            "--docstyle",
+            dest="docstring_parser",
+            default=None,
+            type=Parser,
+            help="The docstring style to parse.",
+        )
+        options.add_argument(
+            "-D",
+            "--docopts",
+            dest="docstring_options",
+            default={},
+            type=json.loads,
+            help="The options for the docstring parser.",
+        )
+        options.add_argument(
+            "-r",
+            "--resolve-aliases",
+            action="store_true",
+            help="Whether to resolve aliases.",
+        )
+        options.add_argument(
+            "-I",
+            "--resolve-implicit",
+            action="store_true",
+            help="Whether to resolve implicitly exported aliases as well. "
+            "Aliases are explicitly exported when defined in `__all__`.",
+        )
+        options.add_argument(
+            "-U",
+            "--resolve-external",
+            dest="resolve_external",
+            action="store_true",
+            help="Always resolve aliases pointing to external/unknown modules (not loaded directly)."
+            "Default is to resolve only from one module to its private sibling (`ast` -> `_ast`).",
+        )
+        options.add_argument(
+            "--no-resolve-external",
+            dest="resolve_external",
+            action="store_false",
+            help="Never resolve aliases pointing to external/unknown modules (not loaded directly)."
+            "Default is to resolve only from one module to its private sibling (`ast` -> `_ast`).",
+        )
+
     # ========= SUBPARSERS ========= #
     subparsers = parser.add_subparsers(
         dest="subcommand",
@@ -239,74 +373,40 @@ def get_parser() -> argparse.ArgumentParser:
         return subparsers.add_parser(command, add_help=False, help=text, description=text, **kwargs)
 
     # ========= DUMP PARSER ========= #
-    dump_parser = add_subparser("dump", "Load package-signatures and dump them as JSON.")
+    dump_parser = add_subparser("dump", "Load package-signatures and dump them as JSON or in binary format.")
     dump_options = dump_parser.add_argument_group(title="Dump options")
     dump_options.add_argument("packages", metavar="PACKAGE", nargs="+", help="Packages to find, load and dump.")
-    dump_options.add_argument(
-        "-f",
-        "--full",
-        action="store_true",
-        default=False,
-        help="Whether to dump full data in JSON.",
-    )
-    dump_options.add_argument(
-        "-o",
-        "--output",
-        default=sys.stdout,
-        help="Output file. Supports templating to output each package in its own file, with `{package}`.",
-    )
-    dump_options.add_argument(
-        "-d",
-        "--docstyle",
-        dest="docstring_parser",
-        default=None,
-        type=Parser,
-        help="The docstring style to parse.",
-    )
-    dump_options.add_argument(
-        "-D",
-        "--docopts",
-        dest="docstring_options",
-        default={},
-        type=json.loads,
-        help="The options for the docstring parser.",
-    )
-    dump_options.add_argument(
-        "-r",
-        "--resolve-aliases",
-        action="store_true",
-        help="Whether to resolve aliases.",
-    )
-    dump_options.add_argument(
-        "-I",
-        "--resolve-implicit",
-        action="store_true",
-        help="Whether to resolve implicitly exported aliases as well. "
-        "Aliases are explicitly exported when defined in `__all__`.",
-    )
-    dump_options.add_argument(
-        "-U",
-        "--resolve-external",
-        dest="resolve_external",
-        action="store_true",
-        help="Always resolve aliases pointing to external/unknown modules (not loaded directly)."
-        "Default is to resolve only from one module to its private sibling (`ast` -> `_ast`).",
-    )
-    dump_options.add_argument(
-        "--no-resolve-external",
-        dest="resolve_external",
-        action="store_false",
-        help="Never resolve aliases pointing to external/unknown modules (not loaded directly)."
-        "Default is to resolve only from one module to its private sibling (`ast` -> `_ast`).",
-    )
+    add_dump_options(dump_options)
     dump_options.add_argument(
         "-S",
         "--stats",
         action="store_true",
         help="Show statistics at the end.",
     )
+    dump_options.add_argument(
+        "--stats-format",
+        choices=("text", "json"),
+        default="text",
+        help="Format of statistics. JSON statistics are written on standard error, "
+        "and include the time spent in each loading phase for each module, and in each hook of each extension.",
+    )
     add_common_options(dump_parser)
 
+    # ========= WATCH PARSER ========= #
+    watch_parser = add_subparser("watch", "Dump package-signatures, and dump them again when sources change.")
+    watch_options = watch_parser.add_argument_group(title="Watch options")
+    watch_options.add_argument("packages", metavar="PACKAGE", nargs="+", help="Packages to find, load and watch.")
+    add_dump_options(watch_options)
+    watch_options.add_argument(
+        "-i",
+        "--interval",
+        metavar="SECONDS",
+        type=float,
+        default=1.0,
+        help="Interval between two checks of source files, in seconds.",
+    )
+    add_common_options(watch_parser)
+
     # ========= CHECK PARSER ========= #
     check_parser = add_subparser("check", "Check for API breakages or possible improvements.")
     check_options = check_parser.add_argument_group(title="Check options")
@@ -349,6 +449,7 @@ def dump(
     packages: Sequence[str],
     *,
     output: str | IO | None = None,
+    output_format: str = "json",
     full: bool = False,
     docstring_parser: DocstringStyle | Parser | None = None,
     docstring_options: DocstringOptions | None = None,
@@ -361,14 +462,18 @@ def dump(
     append_sys_path: bool = False,
     allow_inspection: bool = True,
     force_inspection: bool = False,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
     stats: bool = False,
+    stats_format: str = "text",
 ) -> int:
-    """Load packages data and dump it as JSON.
+    """Load packages data and dump it as JSON or in binary format.
 
     Parameters:
         packages: The packages to load and dump.
-        output: Where to output the JSON-serialized data.
-        full: Whether to output full or minimal data.
+        output: Where to output the serialized data.
+        output_format: The output format, `json` or `binary`.
+        full: Whether to output full or minimal data. Only supported by the JSON format.
         docstring_parser: The docstring parser to use. By default, no parsing is done.
         docstring_options: Docstring parsing options.
         resolve_aliases: Whether to resolve aliases (indirect objects references).
@@ -383,20 +488,22 @@ def dump(
         append_sys_path: Whether to append the contents of `sys.path` to the search paths.
         allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
         force_inspection: Whether to force using dynamic analysis when loading data.
+        workers: The number of worker processes used to visit modules in parallel.
+        cache_dir: A directory in which to cache visited and inspected modules.
         stats: Whether to compute and log stats about loading.
+        stats_format: The format of stats, `text` or `json`.
 
     Returns:
         `0` for success, `1` for failure.
     """
-    from griffe._internal.encoders import JSONEncoder  # noqa: PLC0415
     from griffe._internal.exceptions import ExtensionError  # noqa: PLC0415
     from griffe._internal.extensions.base import load_extensions  # noqa: PLC0415
     from griffe._internal.logger import logger  # noqa: PLC0415
 
     # Prepare options.
-    per_package_output = False
-    if isinstance(output, str) and output.format(package="package") != output:
-        per_package_output = True
+    if full and output_format != "json":
+        logger.error("Full data can only be dumped in JSON format")
+        return 1
 
     search_paths = list(search_paths) if search_paths else []
     if append_sys_path:
@@ -407,6 +514,7 @@ def dump(
     except ExtensionError:
         logger.exception("Could not load extensions")
         return 1
+    loaded_extensions.profile = stats
 
     # Load packages.
     loader = _load_packages(
@@ -422,28 +530,154 @@ def dump(
         force_inspection=force_inspection,
         store_source=False,
         find_stubs_package=find_stubs_package,
+        workers=workers,
+        cache_dir=cache_dir,
+        profile=stats,
     )
     data_packages = loader.modules_collection.members
 
     # Serialize and dump packages.
-    started = datetime.now(tz=timezone.utc)
-    if per_package_output:
-        for package_name, data in data_packages.items():
-            serialized = data.as_json(indent=2, full=full, sort_keys=True)
-            _print_data(serialized, output.format(package=package_name))  # ty:ignore[unresolved-attribute]
-    else:
-        serialized = json.dumps(data_packages, cls=JSONEncoder, indent=2, full=full, sort_keys=True)
-        _print_data(serialized, output)
-    elapsed = datetime.now(tz=timezone.utc) - started
+    started = perf_counter_ns()
+    _dump_packages(data_packages, output, output_format, full=full)
+    elapsed = perf_counter_ns() - started
 
     if stats:
         loader_stats = loader.stats()
-        loader_stats.time_spent_serializing = elapsed.microseconds
-        logger.info(loader_stats.as_text())
+        loader_stats.time_spent_serializing = elapsed // 1000
+        if stats_format == "json":
+            json.dump(loader_stats.as_dict(), sys.stderr, indent=2)
+            print(file=sys.stderr)
+        else:
+            logger.info(loader_stats.as_text())
 
     return 0 if len(data_packages) == len(packages) else 1
 
 
+def watch(
+    packages: Sequence[str],
+    *,
+    output: str | IO | None = None,
+    output_format: str = "json",
+    full: bool = False,
+    docstring_parser: DocstringStyle | Parser | None = None,
+    docstring_options: DocstringOptions | None = None,
+    extensions: Sequence[str | dict[str, Any] | Extension | type[Extension]] | None = None,
+    resolve_aliases: bool = False,
+    resolve_implicit: bool = False,
+    resolve_external: bool | None = None,
+    search_paths: Sequence[str | Path] | None = None,
+    find_stubs_package: bool = False,
+    append_sys_path: bool = False,
+    allow_inspection: bool = True,
+    force_inspection: bool = False,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
+    interval: float = 1.0,
+) -> int:
+    """Load packages data, dump it, and dump it again each time source files change.
+
+    Packages are loaded once, then only the modules whose files changed
+    (and the modules depending on them) are reloaded, see [`GriffeLoader.reload`][griffe.GriffeLoader.reload].
+    Stop watching with ++ctrl+c++.
+
+    Parameters:
+        packages: The packages to load, dump and watch.
+        output: Where to output the serialized data.
+        output_format: The output format, `json` or `binary`.
+        full: Whether to output full or minimal data. Only supported by the JSON format.
+        docstring_parser: The docstring parser to use. By default, no parsing is done.
+        docstring_options: Docstring parsing options.
+        resolve_aliases: Whether to resolve aliases (indirect objects references).
+        resolve_implicit: Whether to resolve every alias or only the explicitly exported ones.
+        resolve_external: Whether to load additional, unspecified modules to resolve aliases.
+            Default is to resolve only from one module to its private sibling (`ast` -> `_ast`).
+        extensions: The extensions to use.
+        search_paths: The paths to search into.
+        find_stubs_package: Whether to search for stubs-only packages.
+            If both the package and its stubs are found, they'll be merged together.
+            If only the stubs are found, they'll be used as the package itself.
+        append_sys_path: Whether to append the contents of `sys.path` to the search paths.
+        allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
+        force_inspection: Whether to force using dynamic analysis when loading data.
+        workers: The number of worker processes used to visit modules in parallel.
+        cache_dir: A directory in which to cache visited and inspected modules.
+        interval: The interval between two checks of source files, in seconds.
+
+    Returns:
+        `0` for success, `1` for failure.
+    """
+    from griffe._internal.exceptions import ExtensionError  # noqa: PLC0415
+    from griffe._internal.extensions.base import load_extensions  # noqa: PLC0415
+    from griffe._internal.logger import logger  # noqa: PLC0415
+
+    # Prepare options.
+    if full and output_format != "json":
+        logger.error("Full data can only be dumped in JSON format")
+        return 1
+
+    search_paths = list(search_paths) if search_paths else []
+    if append_sys_path:
+        search_paths.extend(sys.path)
+
+    try:
+        loaded_extensions = load_extensions(*(extensions or ()))
+    except ExtensionError:
+        logger.exception("Could not load extensions")
+        return 1
+
+    # Load packages, resolving aliases only once we know which packages to watch.
+    loader = _load_packages(
+        packages,
+        extensions=loaded_extensions,
+        search_paths=search_paths,
+        docstring_parser=docstring_parser,
+        docstring_options=docstring_options,
+        resolve_aliases=False,
+        allow_inspection=allow_inspection,
+        force_inspection=force_inspection,
+        store_source=False,
+        find_stubs_package=find_stubs_package,
+        workers=workers,
+        cache_dir=cache_dir,
+    )
+    data_packages = dict(loader.modules_collection.members)
+    if len(data_packages) != len(packages):
+        return 1
+
+    roots = []
+    for package in data_packages.values():
+        if isinstance(package.filepath, list):
+            roots.extend(package.filepath)
+        elif package.filepath is not None:
+            roots.append(package.filepath.parent if package.filepath.stem == "__init__" else package.filepath)
+    files = _watched_files(roots)
+
+    # Dump packages, then reload and dump them again each time files change.
+    try:
+        while True:
+            if resolve_aliases:
+                loader.resolve_aliases(implicit=resolve_implicit, external=resolve_external)
+            _dump_packages(
+                {name: loader.modules_collection.members[name] for name in data_packages},
+                output,
+                output_format,
+                full=full,
+            )
+            while True:
+                time.sleep(interval)
+                new_files = _watched_files(roots)
+                changed = [path for path in files.keys() | new_files.keys() if files.get(path) != new_files.get(path)]
+                files = new_files
+                if changed:
+                    break
+            started = perf_counter_ns()
+            reloaded = loader.reload(changed)
+            elapsed = perf_counter_ns() - started
+            logger.info("Reloaded %s modules in %.0fms", len(reloaded), elapsed / 1_000_000)
+    except KeyboardInterrupt:
+        return 0
+
+
 def check(
     package: str | Path,
     against: str | None = None,
@@ -456,6 +690,8 @@ def check(
     find_stubs_package: bool = False,
     allow_inspection: bool = True,
     force_inspection: bool = False,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
     verbose: bool = False,
     color: bool | None = None,
     style: str | ExplanationStyle | None = None,
@@ -472,6 +708,8 @@ def check(
         append_sys_path: Whether to append the contents of `sys.path` to the search paths.
         allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
         force_inspection: Whether to force using dynamic analysis when loading data.
+        workers: The number of worker processes used to visit modules in parallel.
+        cache_dir: A directory in which to cache visited and inspected modules.
         verbose: Use a verbose output.
 
     Returns:
@@ -508,6 +746,8 @@ def check(
             search_paths=search_paths,
             allow_inspection=allow_inspection,
             force_inspection=force_inspection,
+            workers=workers,
+            cache_dir=cache_dir,
             find_stubs_package=find_stubs_package,
             resolve_aliases=True,
             resolve_external=None,
@@ -529,6 +769,8 @@ def check(
             search_paths=search_paths,
             allow_inspection=allow_inspection,
             force_inspection=force_inspection,
+            workers=workers,
+            cache_dir=cache_dir,
             find_stubs_package=find_stubs_package,
             resolve_aliases=True,
             resolve_external=None,
@@ -552,6 +794,7 @@ def check(
             search_paths=search_paths,
             allow_inspection=allow_inspection,
             force_inspection=force_inspection,
+            workers=workers,
             find_stubs_package=find_stubs_package,
             resolve_aliases=True,
             resolve_external=None,
@@ -566,6 +809,7 @@ def check(
                 search_paths=search_paths,
                 allow_inspection=allow_inspection,
                 force_inspection=force_inspection,
+                workers=workers,
                 find_stubs_package=find_stubs_package,
                 resolve_aliases=True,
                 resolve_external=None,
@@ -578,6 +822,8 @@ def check(
                 search_paths=search_paths,
                 allow_inspection=allow_inspection,
                 force_inspection=force_inspection,
+                workers=workers,
+                cache_dir=cache_dir,
                 find_stubs_package=find_stubs_package,
                 resolve_aliases=True,
                 resolve_external=None,
@@ -639,5 +885,5 @@ def main(args: list[str] | None = None) -> int:
     sys.setrecursionlimit(max(2000, sys.getrecursionlimit()))
 
     # Run subcommand.
-    commands: dict[str, Callable[..., int]] = {"check": check, "dump": dump}
+    commands: dict[str, Callable[..., int]] = {"check": check, "dump": dump, "watch": watch}
     return commands[subcommand](**opts_dict)
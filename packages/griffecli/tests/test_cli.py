@@ -18,13 +18,19 @@
 
 from __future__ import annotations
 
+import json
 import sys
+from typing import TYPE_CHECKING
 
 import pytest
 
+from griffe import Module, binary_decoder, temporary_pypackage
 from griffe._internal import debug
 from griffecli._internal import cli
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_main() -> None:
     """Basic CLI test."""
@@ -34,6 +40,62 @@ def test_main() -> None:
         assert cli.main(["dump", "griffe", "-s", "src", "-o/dev/null"]) == 0
 
 
+def test_dump_binary_format(tmp_path: Path) -> None:
+    """Dump packages in binary format.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    output = tmp_path / "griffe.bin"
+    assert cli.main(["dump", "griffe", "-s", "src", "-F", "binary", "-o", str(output)]) == 0
+    data = binary_decoder(output.read_bytes())
+    assert isinstance(data["griffe"], Module)
+    assert cli.main(["dump", "griffe", "-s", "src", "-F", "binary", "-f", "-o", str(output)]) == 1
+
+
+def test_dump_stats_as_json(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Write stats as JSON on standard error.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        capsys: Pytest fixture to capture output.
+    """
+    output = str(tmp_path / "griffe.json")
+    assert cli.main(["dump", "griffe", "-s", "src", "-o", output, "-S", "--stats-format", "json"]) == 0
+    stats = json.loads(capsys.readouterr().err)
+    assert stats["time_spent_by_module"]["griffe"]["exports"] >= 0
+    assert "visiting" in stats["time_spent_by_phase"]
+    assert stats["time_spent_by_extension"]["griffe._internal.extensions.dataclasses.DataclassesExtension"]
+
+
+def test_watch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Dump packages again when their sources change.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    output = tmp_path / "package.json"
+    dumps = []
+
+    with temporary_pypackage("package", {"__init__.py": "a = 0", "b.py": "b = 0"}) as tmp_package:
+
+        def sleep(interval: float) -> None:  # noqa: ARG001
+            if dumps:
+                raise KeyboardInterrupt
+            dumps.append(json.loads(output.read_text(encoding="utf8")))
+            tmp_package.path.joinpath("__init__.py").write_text("a = 1", encoding="utf8")
+
+        monkeypatch.setattr(cli.time, "sleep", sleep)
+        args = ["watch", "package", "-s", str(tmp_package.tmpdir), "-o", str(output), "-i", "0"]
+        assert cli.main(args) == 0
+
+    dumps.append(json.loads(output.read_text(encoding="utf8")))
+    assert dumps[0]["package"]["members"]["a"]["value"] == "0"
+    assert dumps[1]["package"]["members"]["a"]["value"] == "1"
+    assert "b" in dumps[1]["package"]["members"]
+
+
 def test_show_help(capsys: pytest.CaptureFixture) -> None:
     """Show help.
 
@@ -70,12 +70,17 @@ However most of the time you will only need to use the loaders above.
 
 ## Serializers
 
-Griffe can serizalize data to dictionary and JSON.
+Griffe can serizalize data to dictionary, JSON, and a compact binary format.
 
 - [`griffe.Object.as_json`][griffe.Object.as_json]
 - [`griffe.Object.from_json`][griffe.Object.from_json]
+- [`griffe.Object.as_bytes`][griffe.Object.as_bytes]
+- [`griffe.Object.from_bytes`][griffe.Object.from_bytes]
 - [`griffe.JSONEncoder`][]: JSON encoder for Griffe objects.
 - [`griffe.json_decoder`][]: JSON decoder for Griffe objects.
+- [`griffe.lazy_json_decoder`][]: Lazy JSON decoder for Griffe objects.
+- [`griffe.BinaryEncoder`][]: Binary encoder for Griffe objects.
+- [`griffe.binary_decoder`][]: Binary decoder for Griffe objects.
 
 ## API checks
 
@@ -104,6 +109,7 @@ Docstring section and element classes all start with `Docstring`.
 Docstring parsers:
 
 - [`griffe.parse`][]: Parse the docstring.
+- [`griffe.parse_all`][]: Parse the docstrings of an object and all its members, recursively.
 - [`griffe.parse_auto`][]: Parse a docstring by automatically detecting the style it uses.
 - [`griffe.parse_google`][]: Parse a Google-style docstring.
 - [`griffe.parse_numpy`][]: Parse a Numpydoc-style docstring.
@@ -217,6 +223,7 @@ from griffe._internal.docstrings.auto import (
     infer_docstring_style,
     parse_auto,
 )
+from griffe._internal.docstrings.batch import parse_all
 from griffe._internal.docstrings.google import GoogleOptions, parse_google
 from griffe._internal.docstrings.models import (
     DocstringAdmonition,
@@ -258,12 +265,14 @@ from griffe._internal.docstrings.numpy import NumpyOptions, parse_numpy
 from griffe._internal.docstrings.parsers import (
     DocstringOptions,
     DocstringStyle,
+    ParsedDocstringsCache,
     parse,
+    parsed_docstrings_cache,
     parsers,
 )
 from griffe._internal.docstrings.sphinx import SphinxOptions, parse_sphinx
 from griffe._internal.docstrings.utils import docstring_warning, parse_docstring_annotation
-from griffe._internal.encoders import JSONEncoder, json_decoder
+from griffe._internal.encoders import BinaryEncoder, JSONEncoder, binary_decoder, json_decoder, lazy_json_decoder
 from griffe._internal.enumerations import (
     BreakageKind,
     DocstringSectionKind,
@@ -399,6 +408,7 @@ __all__ = [
     "AttributeChangedTypeBreakage",
     "AttributeChangedValueBreakage",
     "AutoOptions",
+    "BinaryEncoder",
     "Breakage",
     "BreakageKind",
     "BuiltinModuleError",
@@ -529,6 +539,7 @@ __all__ = [
     "ParameterRemovedBreakage",
     "Parameters",
     "ParametersType",
+    "ParsedDocstringsCache",
     "Parser",
     "PerStyleOptions",
     "ReturnChangedTypeBreakage",
@@ -555,6 +566,7 @@ __all__ = [
     "ast_previous",
     "ast_previous_siblings",
     "ast_siblings",
+    "binary_decoder",
     "builtin_decorators",
     "builtin_extensions",
     "c3linear_merge",
@@ -578,6 +590,7 @@ __all__ = [
     "infer_docstring_style",
     "inspect",
     "json_decoder",
+    "lazy_json_decoder",
     "load",
     "load_extensions",
     "load_git",
@@ -586,11 +599,13 @@ __all__ = [
     "merge_stubs",
     "module_vtree",
     "parse",
+    "parse_all",
     "parse_auto",
     "parse_docstring_annotation",
     "parse_google",
     "parse_numpy",
     "parse_sphinx",
+    "parsed_docstrings_cache",
     "parsers",
     "patch_loggers",
     "relative_to_absolute",
@@ -626,6 +641,7 @@ except ImportError:
         "dump",
         "get_parser",
         "main",
+        "watch",
     }
 
     def __getattr__(attr: str) -> object:
@@ -78,6 +78,7 @@ def inspect(
     docstring_options: DocstringOptions | None = None,
     lines_collection: LinesCollection | None = None,
     modules_collection: ModulesCollection | None = None,
+    names: dict[str, str] | None = None,
 ) -> Module:
     """Inspect a module.
 
@@ -113,6 +114,7 @@ def inspect(
         docstring_options: Docstring parsing options.
         lines_collection: A collection of source code lines.
         modules_collection: A collection of modules.
+        names: A table of interned names and paths, to share equal strings between modules.
 
     Returns:
         The module, with its members populated.
@@ -126,6 +128,7 @@ def inspect(
         docstring_options=docstring_options,
         lines_collection=lines_collection,
         modules_collection=modules_collection,
+        names=names,
     ).get_module(import_paths)
 
 
@@ -145,6 +148,7 @@ class Inspector:
         docstring_options: DocstringOptions | None = None,
         lines_collection: LinesCollection | None = None,
         modules_collection: ModulesCollection | None = None,
+        names: dict[str, str] | None = None,
     ) -> None:
         """Initialize the inspector.
 
@@ -157,6 +161,7 @@ class Inspector:
             docstring_options: Docstring parsing options.
             lines_collection: A collection of source code lines.
             modules_collection: A collection of modules.
+            names: A table of interned names and paths, to share equal strings between modules.
         """
         super().__init__()
 
@@ -187,6 +192,15 @@ class Inspector:
         self.modules_collection: ModulesCollection = modules_collection or ModulesCollection()
         """A collection of modules."""
 
+        self.names: dict[str, str] = {} if names is None else names
+        """A table of interned names and paths, to share equal strings between modules.
+
+        Target paths of aliases are computed at runtime and are therefore not interned by Python.
+        """
+
+    def _intern(self, string: str) -> str:
+        return self.names.setdefault(string, string)
+
     def _get_docstring(self, node: ObjectNode) -> Docstring | None:
         try:
             # Access `__doc__` directly to avoid taking the `__doc__` attribute from a parent class.
@@ -301,12 +315,13 @@ class Inspector:
                             docstring_options=self.docstring_options,
                             lines_collection=self.lines_collection,
                             modules_collection=self.modules_collection,
+                            names=self.names,
                         )
                         inspector.inspect_module(child)
                         self.current.set_member(child.name, inspector.current.module)
                 # Otherwise, alias the object.
                 else:
-                    alias = Alias(child.name, target_path, analysis="dynamic")
+                    alias = Alias(child.name, self._intern(target_path), analysis="dynamic")
                     self.current.set_member(child.name, alias)
                     self.extensions.call("on_alias_instance", alias=alias, node=node, agent=self)
             else:
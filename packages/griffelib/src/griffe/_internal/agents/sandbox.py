@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# This module contains a pool of sandboxed worker processes used to inspect modules.
+# Importing modules runs arbitrary code and pollutes `sys.modules`:
+# workers isolate the main process from crashes, hangs and excessive memory usage.
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from griffe._internal.agents.inspector import inspect
+from griffe._internal.collections import LinesCollection
+from griffe._internal.extensions.base import Extensions
+from griffe._internal.importer import _package_paths
+from griffe._internal.logger import _record_messages, _replay_messages, logger
+from griffe._internal.models import Module, _iter_modules
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from pathlib import Path
+
+    from griffe._internal.docstrings.parsers import DocstringOptions, DocstringStyle
+    from griffe._internal.enumerations import Parser
+
+
+class _InspectionPool:
+    """Pool of worker processes inspecting modules."""
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        import_paths: Sequence[str | Path] = (),
+        docstring_parser: DocstringStyle | Parser | None = None,
+        docstring_options: DocstringOptions | None = None,
+        store_source: bool = True,
+    ) -> None:
+        self.workers: int = workers
+        self.timeout: float | None = timeout
+        self.memory_limit: int | None = memory_limit
+        if memory_limit and sys.platform == "win32":
+            logger.debug("Memory limits of inspection workers are not supported on Windows")
+        # Sent along each module to inspect.
+        self._options: tuple = (list(import_paths), docstring_parser, docstring_options or {}, store_source)
+        # Spawned processes start with a clean `sys.modules`.
+        self._context = multiprocessing.get_context("spawn")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="griffe-inspection")
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        weakref.finalize(self, _stop_workers, self._idle, self._executor)
+
+    def submit(self, module_name: str, filepath: Path | None, parent_path: str | None) -> Future:
+        """Submit a module to inspect, to retrieve later with `result`."""
+        module_path = f"{parent_path}.{module_name}" if parent_path else module_name
+        request = (module_path, _inspect_in_worker, (module_name, filepath, parent_path, *self._options))
+        return self._executor.submit(self._run, request)
+
+    def result(self, future: Future) -> tuple[Module, int]:
+        """Wait for an inspection and return the module (without parent and collections) and the time spent, in nanoseconds.
+
+        Messages logged by the worker while inspecting the module are logged again, in order.
+        """
+        return self._result(future)
+
+    def package_paths(self, module_name: str) -> list[str]:
+        """Import a top-level module in a worker and return its paths (`__path__`), empty if it is not a package."""
+        request = (module_name, _package_paths, (module_name, self._options[0]))
+        return self._result(self._executor.submit(self._run, request))[0]
+
+    def _result(self, future: Future) -> tuple[Any, int]:
+        module_path, ok, payload, duration, records = future.result()
+        _replay_messages(records)
+        if not ok:
+            raise ImportError(payload)
+        try:
+            return pickle.loads(payload), duration  # noqa: S301
+        except Exception as error:
+            raise ImportError(f"Could not deserialize inspected module '{module_path}': {error}") from error
+
+    def _run(self, request: tuple) -> tuple:
+        with self._lock:
+            worker = self._idle.pop() if self._idle else _Worker(self._context, self.memory_limit)
+        try:
+            result = worker.run(request, self.timeout)
+        except BaseException:
+            worker.stop()
+            raise
+        with self._lock:
+            self._idle.append(worker)
+        return request[0], *result
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        _stop_workers(self._idle, self._executor)
+
+
+def _stop_workers(idle: list[_Worker], executor: ThreadPoolExecutor) -> None:
+    executor.shutdown(wait=True)
+    while idle:
+        idle.pop().stop()
+
+
+class _Worker:
+    def __init__(self, context: Any, memory_limit: int | None) -> None:
+        self._connection, child_connection = context.Pipe()
+        self._process: BaseProcess = context.Process(
+            target=_serve,
+            args=(child_connection, memory_limit),
+            daemon=True,
+            name="griffe-inspection-worker",
+        )
+        self._process.start()
+        child_connection.close()
+
+    def run(self, request: tuple, timeout: float | None) -> tuple:
+        module_name = request[0]
+        try:
+            self._connection.send(request)
+            if not self._connection.poll(timeout):
+                raise ImportError(f"Inspecting '{module_name}' timed out after {timeout} seconds")
+            return self._connection.recv()
+        except (EOFError, OSError):
+            self._process.join()
+            raise ImportError(
+                f"Inspecting '{module_name}' crashed the worker process (exit code {self._process.exitcode})",
+            ) from None
+
+    def stop(self) -> None:
+        self._connection.close()
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+
+
+def _serve(connection: Connection, memory_limit: int | None) -> None:
+    # Entry point of worker processes: inspect modules until the connection is closed.
+    # Requests hold the path of a module, a function importing and inspecting it, and the function arguments.
+    if memory_limit:
+        _limit_memory(memory_limit)
+    records = _record_messages()
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, OSError):
+            return
+        module_name, function, args = request
+        start = perf_counter_ns()
+        try:
+            payload = pickle.dumps(function(*args), protocol=pickle.HIGHEST_PROTOCOL)
+        except MemoryError:
+            message = f"Inspecting '{module_name}' exceeded the memory limit"
+            connection.send((False, message, 0, records.pop()))
+        except BaseException as error:  # noqa: BLE001
+            message = f"Importing '{module_name}' raised an exception: {type(error).__name__}: {error}"
+            connection.send((False, message, 0, records.pop()))
+        else:
+            connection.send((True, payload, perf_counter_ns() - start, records.pop()))
+
+
+def _limit_memory(limit: int) -> None:
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = limit if hard == resource.RLIM_INFINITY else min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _inspect_in_worker(  # noqa: PLR0917
+    module_name: str,
+    filepath: Path | None,
+    parent_path: str | None,
+    import_paths: list[str | Path],
+    docstring_parser: DocstringStyle | Parser | None,
+    docstring_options: DocstringOptions,
+    store_source: bool,  # noqa: FBT001
+) -> Module:
+    # Parents are only used to compute import paths,
+    # so we build bare placeholders that the loader replaces with the real ones.
+    parent = None
+    for part in parent_path.split(".") if parent_path else ():
+        parent = Module(part, parent=parent)
+    lines_collection = LinesCollection()
+    if store_source and filepath and filepath.suffix in {".py", ".pyi"}:
+        # Line numbers are only computed for modules with stored sources.
+        lines_collection[filepath] = filepath.read_text(encoding="utf-8-sig").splitlines(keepends=False)
+    module = inspect(
+        module_name,
+        filepath=filepath,
+        import_paths=import_paths,
+        extensions=Extensions(),
+        parent=parent,
+        docstring_parser=docstring_parser,
+        docstring_options=docstring_options,
+        lines_collection=lines_collection,
+    )
+    module.parent = None
+    for submodule in _iter_modules(module):
+        # Submodules inherit the collections of the module, attached by the loader.
+        submodule._lines_collection = submodule._modules_collection = None
+    return module
@@ -104,6 +104,7 @@ def visit(
     docstring_options: DocstringOptions | None = None,
     lines_collection: LinesCollection | None = None,
     modules_collection: ModulesCollection | None = None,
+    names: dict[str, str] | None = None,
 ) -> Module:
     """Parse and visit a module file.
 
@@ -127,6 +128,7 @@ def visit(
         docstring_options: Docstring parsing options.
         lines_collection: A collection of source code lines.
         modules_collection: A collection of modules.
+        names: A table of interned names and paths, to share equal strings between modules.
 
     Returns:
         The module, with its members populated.
@@ -141,6 +143,7 @@ def visit(
         docstring_options=docstring_options,
         lines_collection=lines_collection,
         modules_collection=modules_collection,
+        names=names,
     ).get_module()
 
 
@@ -161,6 +164,7 @@ class Visitor:
         docstring_options: DocstringOptions | None = None,
         lines_collection: LinesCollection | None = None,
         modules_collection: ModulesCollection | None = None,
+        names: dict[str, str] | None = None,
     ) -> None:
         """Initialize the visitor.
 
@@ -174,6 +178,7 @@ class Visitor:
             docstring_options: Docstring parsing options.
             lines_collection: A collection of source code lines.
             modules_collection: A collection of modules.
+            names: A table of interned names and paths, to share equal strings between modules.
         """
         super().__init__()
 
@@ -207,9 +212,19 @@ class Visitor:
         self.modules_collection: ModulesCollection = modules_collection or ModulesCollection()
         """A collection of modules."""
 
+        self.names: dict[str, str] = {} if names is None else names
+        """A table of interned names and paths, to share equal strings between modules.
+
+        Identifiers coming from the AST are already interned by Python,
+        but paths built by agents (import targets) and string constants (exports) are not.
+        """
+
         self.type_guarded: bool = False
         """Whether the current code branch is type-guarded."""
 
+    def _intern(self, string: str) -> str:
+        return self.names.setdefault(string, string)
+
     def _get_docstring(self, node: ast.AST, *, strict: bool = False) -> Docstring | None:
         value, lineno, endlineno = get_docstring(node, strict=strict)
         if value is None:
@@ -267,11 +282,13 @@ class Visitor:
         Returns:
             A module instance.
         """
+        self.visit(self._compile())
+        return self.current.module
+
+    def _compile(self) -> ast.Module:
         # Optimization: equivalent to `ast.parse`, but with `optimize=1` to remove assert statements.
         # TODO: With options, could use `optimize=2` to remove docstrings.
-        top_node = compile(self.code, mode="exec", filename=str(self.filepath), flags=ast.PyCF_ONLY_AST, optimize=1)
-        self.visit(top_node)
-        return self.current.module
+        return compile(self.code, mode="exec", filename=str(self.filepath), flags=ast.PyCF_ONLY_AST, optimize=1)
 
     def visit(self, node: ast.AST) -> None:
         """Extend the base visit with extensions.
@@ -576,7 +593,7 @@ class Visitor:
             node: The node to visit.
         """
         for name in node.names:
-            alias_path = name.name if name.asname else name.name.split(".", 1)[0]
+            alias_path = self._intern(name.name if name.asname else name.name.split(".", 1)[0])
             alias_name = name.asname or alias_path.split(".", 1)[0]
             self.current.imports[alias_name] = alias_path
             alias = Alias(
@@ -604,10 +621,10 @@ class Visitor:
                 # have the same name and can be accessed the same way.
                 continue
 
-            alias_path = relative_to_absolute(node, name, self.current.module)
+            alias_path = self._intern(relative_to_absolute(node, name, self.current.module))
             if name.name == "*":
                 alias_name = alias_path.replace(".", "/")
-                alias_path = alias_path.replace(".*", "")
+                alias_path = self._intern(alias_path.replace(".*", ""))
             else:
                 alias_name = name.asname or name.name
                 self.current.imports[alias_name] = alias_path
@@ -727,7 +744,7 @@ class Visitor:
             if name == "__all__":
                 with suppress(AttributeError):
                     parent.exports = [
-                        name if isinstance(name, str) else ExprName(name.name, parent=name.parent)
+                        self._intern(name) if isinstance(name, str) else ExprName(name.name, parent=name.parent)
                         for name in safe_get__all__(node, self.current)  # ty:ignore[invalid-argument-type]
                     ]
             self.extensions.call("on_instance", node=node, obj=attribute, agent=self)
@@ -765,7 +782,7 @@ class Visitor:
                 # We assume `exports` is not `None` at this point.
                 self.current.exports.extend(  # ty:ignore[unresolved-attribute]
                     [
-                        name if isinstance(name, str) else ExprName(name.name, parent=name.parent)
+                        self._intern(name) if isinstance(name, str) else ExprName(name.name, parent=name.parent)
                         for name in safe_get__all__(node, self.current)  # ty:ignore[invalid-argument-type]
                     ],
                 )
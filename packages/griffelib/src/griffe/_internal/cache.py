@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# This module contains the on-disk cache used by the loader
+# to avoid visiting modules again when their sources did not change,
+# and inspecting modules again when their installed distribution did not change.
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sys
+import tempfile
+from contextlib import suppress
+from functools import cached_property
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from griffe._internal.debug import _get_version
+from griffe._internal.logger import logger
+from griffe._internal.models import _iter_modules
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griffe._internal.docstrings.parsers import DocstringOptions, DocstringStyle
+    from griffe._internal.enumerations import Parser
+    from griffe._internal.extensions.base import Extensions
+    from griffe._internal.models import Module
+
+
+def _extensions_fingerprint(extensions: Extensions) -> str:
+    # Extensions are identified by their class and their options (instance attributes).
+    # Options with unstable representations (default object reprs) only lead to cache misses.
+    return "\n".join(
+        f"{type(extension).__module__}.{type(extension).__qualname__}:{sorted(vars(extension).items())!r}"
+        for extension in extensions._extensions
+    )
+
+
+class _ModulesCache:
+    """On-disk cache of visited and inspected modules."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory: Path = Path(directory)
+        self._version: str = _get_version()
+
+    def key(
+        self,
+        module_path: str,
+        filepath: Path,
+        code: str,
+        *,
+        docstring_parser: DocstringStyle | Parser | None,
+        docstring_options: DocstringOptions,
+        extensions: Extensions,
+    ) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            self._version,
+            module_path,
+            str(filepath),
+            str(docstring_parser),
+            repr(sorted(docstring_options.items())),
+            _extensions_fingerprint(extensions),
+            code,
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def inspection_key(
+        self,
+        module_path: str,
+        filepath: Path | None,
+        *,
+        import_paths: Sequence[str | Path],
+        docstring_parser: DocstringStyle | Parser | None,
+        docstring_options: DocstringOptions,
+        extensions: Extensions,
+    ) -> str:
+        # Inspecting the same module gives the same result as long as the interpreter,
+        # the import paths, the installed distribution providing it and its file did not change:
+        # these stand in for the source code of visited modules.
+        mtime = ""
+        if filepath is not None:
+            with suppress(OSError):
+                mtime = str(filepath.stat().st_mtime_ns)
+        origin = "\n".join(
+            (
+                "inspection",
+                sys.version,
+                *map(str, import_paths),
+                self._distribution(module_path.split(".", 1)[0]),
+                mtime,
+            ),
+        )
+        return self.key(
+            module_path,
+            filepath or Path(),
+            origin,
+            docstring_parser=docstring_parser,
+            docstring_options=docstring_options,
+            extensions=extensions,
+        )
+
+    @cached_property
+    def _distributions(self) -> dict[str, list[str]]:
+        # Mapping of top-level module names to the names of the distributions providing them.
+        try:
+            return metadata.packages_distributions()
+        except Exception:  # noqa: BLE001
+            return {}
+
+    def _distribution(self, top_module: str) -> str:
+        versions = []
+        for name in sorted(set(self._distributions.get(top_module, ()))):
+            try:
+                versions.append(f"{name}=={metadata.version(name)}")
+            except metadata.PackageNotFoundError:
+                versions.append(name)
+        return ",".join(versions)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key: str) -> Module | None:
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                return pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not load cached module from %s", path)
+            return None
+
+    def set(self, key: str, module: Module) -> None:
+        # Parents and collections are attached again by the loader:
+        # we detach them temporarily to only serialize the module's own subtree.
+        # Inspected modules can contain submodules, which then inherit the collections of the module.
+        # We detach through the private attribute, as the `parent` setter invalidates memoized data.
+        parent = module._parent
+        modules = list(_iter_modules(module))
+        collections = [(submodule._lines_collection, submodule._modules_collection) for submodule in modules]
+        module._parent = None
+        for submodule in modules:
+            submodule._lines_collection = submodule._modules_collection = None
+        try:
+            data = pickle.dumps(module, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not cache module %s", module.name)
+            return
+        finally:
+            module._parent = parent
+            for submodule, (lines_collection, modules_collection) in zip(modules, collections, strict=True):
+                submodule._lines_collection, submodule._modules_collection = lines_collection, modules_collection
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically, in case several processes share the same cache.
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+                file.write(data)
+            Path(file.name).replace(path)
+        except OSError as error:
+            logger.debug("Could not write cached module to %s: %s", path, error)
@@ -26,8 +26,9 @@ from griffe._internal.mixins import DelMembersMixin, GetMembersMixin, SetMembers
 if TYPE_CHECKING:
     from collections.abc import ItemsView, KeysView, ValuesView
     from pathlib import Path
+    from weakref import WeakSet
 
-    from griffe._internal.models import Module
+    from griffe._internal.models import Class, Module
 
 
 class LinesCollection:
@@ -88,6 +89,8 @@ class ModulesCollection(GetMembersMixin, SetMembersMixin, DelMembersMixin):
         """Initialize the collection."""
         self.members: dict[str, Module] = {}
         """Members (modules) of the collection."""
+        # Classes whose memoized data depend on this collection, see `griffe._internal.mixins._depend_on`.
+        self._dependents: dict[str | None, WeakSet[Class]] | None = None
 
     def __bool__(self) -> bool:
         """A modules collection is always true-ish."""
@@ -97,6 +100,13 @@ class ModulesCollection(GetMembersMixin, SetMembersMixin, DelMembersMixin):
         """Check if a module is in the collection."""
         return item in self.members
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Dependents are neither pickled nor copied: they register again when needed.
+        return {**self.__dict__, "_dependents": None}
+
+    def _forget_memoized(self) -> None:
+        pass
+
     @property
     def all_members(self) -> dict[str, Module]:
         """Members of the collection.
@@ -122,6 +122,24 @@ _patterns = {
     ),
 }
 
+# One alternation pattern per style, compiled once.
+_detectors = {
+    style: re.compile(
+        pattern.format(f"(?:{'|'.join(map(re.escape, replacements))})"),
+        re.IGNORECASE | re.MULTILINE,
+    )
+    for style, (pattern, replacements) in _patterns.items()
+}
+
+# Lines that could start something else than text in any style, following the rules of each parser:
+# Sphinx fields (`:field:`), Google sections and admonitions (`Title:` or `Type: Title`),
+# and Numpy section underlines (lines made of dashes only, whatever their number).
+# When none are found, every parser returns the same single text section.
+_markers = re.compile(
+    r"^(?::|[ \t\f\v\r-]*-[ \t\f\v\r-]*$|\w[\w \t\f\v\r-]*:(?:[ \t\f\v\r]|$))",
+    re.MULTILINE,
+)
+
 
 class PerStyleOptions(TypedDict, total=False):
     """Per-style options for docstring parsing."""
@@ -172,23 +190,29 @@ def infer_docstring_style(
 
     if method == "heuristics":
         for style in style_order:
-            pattern, replacements = _patterns[style]
-            patterns = [
-                re.compile(pattern.format(replacement), re.IGNORECASE | re.MULTILINE) for replacement in replacements
-            ]
-            if any(pattern.search(docstring.value) for pattern in patterns):
+            if _detectors[style].search(docstring.value):
                 return style, None
         return default if default is None or isinstance(default, Parser) else Parser(default), None
 
     if method == "max_sections":
-        style_sections = {}
-        for style in style_order:
-            style_sections[style] = parsers[style](docstring, **per_style_options.get(style, {}))
-        style_lengths = {style: len(section) for style, section in style_sections.items()}
-        max_sections = max(style_lengths.values())
+        # Plain text docstrings are parsed the same by every parser,
+        # unless summaries of `__init__` methods are ignored by some of them.
+        if not _markers.search(docstring.value) and not any(
+            options.get("ignore_init_summary") for options in per_style_options.values()
+        ):
+            style = style_order[0]
+            return style, parsers[style](docstring, **per_style_options.get(style, {}))
+        # Each section spans at least one non-blank line: once a parser reaches this number
+        # of sections, no other parser can find more, and earlier styles win ties.
+        max_possible = sum(1 for line in docstring.lines if line.strip())
+        best_style, best_sections = None, None
         for style in style_order:
-            if style_lengths[style] == max_sections:
-                return style, style_sections[style]
+            sections = parsers[style](docstring, **per_style_options.get(style, {}))
+            if best_sections is None or len(sections) > len(best_sections):
+                best_style, best_sections = style, sections
+                if len(sections) >= max_possible:
+                    break
+        return best_style, best_sections
 
     raise ValueError(f"Invalid method '{method}'.")
 
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# This module contains the batch docstring parsing API,
+# which parses all the docstrings of a tree of objects, possibly in parallel.
+
+from __future__ import annotations
+
+import io
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from griffe._internal.logger import _record_messages, _RecordsHandler, _replay_messages, logger
+from griffe._internal.models import Alias, Object
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griffe._internal.docstrings.models import DocstringSection
+    from griffe._internal.docstrings.parsers import DocstringStyle
+    from griffe._internal.enumerations import Parser
+    from griffe._internal.models import Docstring
+
+
+def parse_all(
+    obj: Object,
+    parser: DocstringStyle | Parser | None = None,
+    *,
+    workers: int | None = None,
+    **options: Any,
+) -> int:
+    """Parse the docstrings of an object and all its members, recursively.
+
+    Parsed sections are stored on each docstring,
+    so that [`Docstring.parsed`][griffe.Docstring.parsed] returns them without parsing again.
+    With several workers, docstrings are parsed in subprocesses which only send back sections,
+    and warnings emitted while parsing are logged again in the current process.
+
+    Parameters:
+        obj: The object to parse docstrings of. Aliases are skipped.
+        parser: The docstring parser to use. If None, use the parser of each docstring.
+        workers: The number of worker processes to use. None or less than 2 parses docstrings in the current process.
+        **options: The options accepted by the parser. If empty, use the options of each docstring.
+
+    Returns:
+        The number of parsed docstrings.
+    """
+    docstrings = dict(_iter_docstrings(obj))
+    if workers and workers >= 2 and len(docstrings) >= 2:  # noqa: PLR2004
+        try:
+            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not serialize %s, parsing docstrings sequentially", obj.path)
+        else:
+            _parse_in_parallel(obj, data, docstrings, parser=parser, options=options, workers=workers)
+            return len(docstrings)
+    for docstring in docstrings.values():
+        if parser or options:
+            docstring.parsed = docstring.parse(parser, **options)
+        else:
+            docstring.parsed  # noqa: B018
+    return len(docstrings)
+
+
+def _iter_docstrings(obj: Object) -> Iterator[tuple[str, Docstring]]:
+    if obj.docstring is not None:
+        yield obj.path, obj.docstring
+    for member in obj.members.values():
+        if not member.is_alias:
+            yield from _iter_docstrings(member)  # ty:ignore[invalid-argument-type]
+
+
+def _parse_in_parallel(
+    obj: Object,
+    data: bytes,
+    docstrings: dict[str, Docstring],
+    *,
+    parser: DocstringStyle | Parser | None,
+    options: dict[str, Any],
+    workers: int,
+) -> None:
+    # Workers receive the serialized tree once, then chunks of object paths.
+    # They send back sections only, with references to objects replaced by their paths,
+    # so that expressions found in sections are bound to the objects of the current process.
+    paths = list(docstrings)
+    size = -(-len(paths) // (workers * 4))
+    chunks = [paths[index : index + size] for index in range(0, len(paths), size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as executor:
+        for chunk, (sections_data, records) in zip(
+            chunks,
+            executor.map(_parse_in_worker, chunks, [parser] * len(chunks), [options] * len(chunks)),
+            strict=True,
+        ):
+            all_sections = _SectionsUnpickler(io.BytesIO(sections_data), obj).load()
+            for path, sections in zip(chunk, all_sections, strict=True):
+                docstrings[path].parsed = sections
+            _replay_messages(records)
+
+
+def _get_object(root: Object, path: str) -> Object | Alias | None:
+    if path == root.path:
+        return root
+    if not path.startswith(f"{root.path}."):
+        return None
+    try:
+        return root[path[len(root.path) + 1 :]]
+    except KeyError:
+        return None
+
+
+class _SectionsPickler(pickle.Pickler):
+    def persistent_id(self, obj: Any) -> str | None:
+        if isinstance(obj, (Object, Alias)):
+            return obj.path
+        return None
+
+
+class _SectionsUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, root: Object) -> None:
+        super().__init__(file)
+        self._root = root
+
+    def persistent_load(self, pid: str) -> Object | Alias | str:
+        # Unknown objects are replaced by their path, like unbound names in expressions.
+        return _get_object(self._root, pid) or pid
+
+
+_worker_root: Object | None = None
+_worker_records: _RecordsHandler | None = None
+
+
+def _init_worker(data: bytes) -> None:
+    global _worker_root, _worker_records  # noqa: PLW0603
+    _worker_root = pickle.loads(data)  # noqa: S301
+    _worker_records = _record_messages()
+
+
+def _parse_in_worker(
+    paths: list[str],
+    parser: DocstringStyle | Parser | None,
+    options: dict[str, Any],
+) -> tuple[bytes, list[tuple[int, str]]]:
+    all_sections: list[list[DocstringSection]] = []
+    for path in paths:
+        obj = _get_object(_worker_root, path)  # ty:ignore[invalid-argument-type]
+        all_sections.append(obj.docstring.parse(parser, **options))  # ty:ignore[possibly-missing-attribute]
+    file = io.BytesIO()
+    _SectionsPickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(all_sections)
+    return file.getvalue(), _worker_records.pop()  # ty:ignore[possibly-missing-attribute]
@@ -19,19 +19,22 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Literal
 
 from griffe._internal.docstrings.auto import AutoOptions, parse_auto
 from griffe._internal.docstrings.google import GoogleOptions, parse_google
-from griffe._internal.docstrings.models import DocstringSection, DocstringSectionText
+from griffe._internal.docstrings.models import DocstringElement, DocstringSection, DocstringSectionText
 from griffe._internal.docstrings.numpy import NumpyOptions, parse_numpy
 from griffe._internal.docstrings.sphinx import SphinxOptions, parse_sphinx
 from griffe._internal.enumerations import Parser
+from griffe._internal.exceptions import AliasResolutionError, CyclicAliasError
+from griffe._internal.expressions import Expr
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from griffe._internal.models import Docstring
+    from griffe._internal.models import Docstring, Object
 
 
 DocstringStyle = Literal["google", "numpy", "sphinx", "auto"]
@@ -68,3 +71,112 @@ def parse(
             parser = Parser(parser)
         return parsers[parser](docstring, **options)
     return [DocstringSectionText(docstring.value)] if docstring.value else []
+
+
+class ParsedDocstringsCache:
+    """A process-wide, least-recently-used cache of parsed docstrings.
+
+    The cache is disabled by default: set its [`maxsize`][griffe.ParsedDocstringsCache.maxsize] to enable it.
+
+    Identical docstrings (same text, parser, options, and parent signature) are parsed only once,
+    and share the same list of sections: do not mutate the sections of [`Docstring.parsed`][griffe.Docstring.parsed].
+    Sections holding expressions are never shared, since expressions are bound to the scope
+    of the object whose docstring was parsed. Warnings are only emitted when parsing,
+    not when a docstring is found in the cache.
+
+    Only [`Docstring.parsed`][griffe.Docstring.parsed] uses this cache,
+    [`Docstring.parse`][griffe.Docstring.parse] always parses docstrings again.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            maxsize: The maximum number of parsed docstrings to keep. Zero disables the cache.
+        """
+        self.maxsize: int = maxsize
+        """The maximum number of parsed docstrings to keep. Zero disables the cache."""
+        self.hits: int = 0
+        """The number of times parsed sections were found in the cache."""
+        self.misses: int = 0
+        """The number of times docstrings had to be parsed."""
+        self._entries: OrderedDict[tuple, list[DocstringSection]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all parsed docstrings from the cache, and reset counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def get(self, docstring: Docstring) -> list[DocstringSection]:
+        """Return the parsed sections of a docstring, parsing it only if it is not cached.
+
+        Parameters:
+            docstring: The docstring to parse.
+
+        Returns:
+            A list of docstring sections.
+        """
+        if not docstring.parser or self.maxsize <= 0:
+            return docstring.parse()
+        try:
+            fingerprint = _fingerprint(docstring.parent)
+        except (AliasResolutionError, CyclicAliasError):
+            return docstring.parse()
+        key = (docstring.value, Parser(docstring.parser), repr(sorted(docstring.parser_options.items())), fingerprint)
+        try:
+            sections = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            sections = docstring.parse()
+            if _holds_expressions(sections):
+                return sections
+            self._entries[key] = sections
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return sections
+
+
+def _fingerprint(obj: Object | None) -> tuple | None:
+    # Everything parsers read from the parent object of docstrings:
+    # its scope, signature, annotations, labels, and annotations of its attributes.
+    if obj is None:
+        return None
+    return (
+        obj.kind,
+        obj.name,
+        obj.module.path,
+        tuple(sorted(obj.labels)),
+        obj.parent.kind if obj.parent is not None else None,
+        tuple(
+            (parameter.name, parameter.kind, str(parameter.annotation), str(parameter.default))
+            for parameter in getattr(obj, "parameters", ())
+        ),
+        tuple((param.name, str(param.annotation), str(param.default)) for param in obj.type_parameters),
+        str(getattr(obj, "returns", None)),
+        str(getattr(obj, "annotation", None)),
+        tuple(
+            (name, str(member.annotation))
+            for name, member in obj.members.items()
+            if not member.is_alias and member.is_attribute
+        ),
+    )
+
+
+def _holds_expressions(sections: list[DocstringSection]) -> bool:
+    # Expressions are bound to their scope (and keep the whole tree alive): they must not be shared.
+    for section in sections:
+        values = section.value if isinstance(section.value, list) else (section.value,)
+        for value in values:
+            if isinstance(value, DocstringElement) and any(isinstance(attr, Expr) for attr in vars(value).values()):
+                return True
+    return False
+
+
+parsed_docstrings_cache: ParsedDocstringsCache = ParsedDocstringsCache()
+"""The cache of parsed docstrings used by [`Docstring.parsed`][griffe.Docstring.parsed]."""
@@ -15,11 +15,12 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 # This module contains data encoders/serializers and decoders/deserializers.
-# We only support JSON for now, but might want to add more formats in the future.
+# We support JSON, and a compact binary format for faster reloading.
 
 from __future__ import annotations
 
 import json
+import marshal
 from pathlib import Path, PosixPath, WindowsPath
 from typing import TYPE_CHECKING, Any
 
@@ -43,7 +44,7 @@ from griffe._internal.models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, ItemsView, Iterator, ValuesView
 
 _json_encoder_map: dict[type, Callable[[Any], Any]] = {
     Path: str,
@@ -99,8 +100,11 @@ class JSONEncoder(json.JSONEncoder):
         Returns:
             A serializable representation.
         """
+        # Members of objects are returned as objects too, so that they get serialized
+        # one at a time when the encoder reaches them. With `json.dump`,
+        # this lets us write the tree to a file without holding it all in memory.
         try:
-            return obj.as_dict(full=self.full)
+            return obj.as_dict(full=self.full, lazy_members=True)
         except AttributeError:
             return _json_encoder_map.get(type(obj), super().default)(obj)
 
@@ -118,14 +122,16 @@ def _load_decorators(obj_dict: dict) -> list[Decorator]:
 def _load_expression(expression: dict) -> expressions.Expr:
     # The expression class name is stored in the `cls` key-value.
     cls = getattr(expressions, expression.pop("cls"))
-    expr = cls(**expression)
+    return _link_attribute_names(cls(**expression))
 
+
+def _link_attribute_names(expr: expressions.Expr) -> expressions.Expr:
     # For attributes, we need to re-attach names (`values`) together,
     # as a single linked list, from right to left:
     # in `a.b.c`, `c` links to `b` which links to `a`.
     # In `(a or b).c` however, `c` does not link to `(a or b)`,
     # as `(a or b)` is not a name and wouldn't allow to resolve `c`.
-    if cls is expressions.ExprAttribute:
+    if isinstance(expr, expressions.ExprAttribute):
         previous = None
         for value in expr.values:
             if previous is not None:
@@ -354,6 +360,8 @@ _loader_map: dict[Kind, Callable[[dict[str, Any]], Object | Alias]] = {
 
 def json_decoder(
     obj_dict: dict[str, Any],
+    *,
+    names: dict[str, str] | None = None,
 ) -> dict[str, Any] | Object | Alias | Parameter | TypeParameter | str | expressions.Expr:
     """Decode dictionaries as data classes.
 
@@ -361,15 +369,24 @@ def json_decoder(
 
     Examples:
         >>> import json
+        >>> from functools import partial
         >>> from griffe import json_decoder
         >>> json.loads(..., object_hook=json_decoder)
 
+        Share equal names and paths between decoded objects:
+
+        >>> json.loads(..., object_hook=partial(json_decoder, names={}))
+
     Parameters:
         obj_dict: The dictionary to decode.
+        names: A table of interned names and paths, to share equal strings between decoded objects.
 
     Returns:
         An instance of a data class.
     """
+    if names is not None:
+        _intern_strings(obj_dict, names)
+
     # Load expressions.
     if "cls" in obj_dict:
         return _load_expression(obj_dict)
@@ -388,3 +405,615 @@ def json_decoder(
 
     # Return dict as is.
     return obj_dict
+
+
+def _intern_strings(obj_dict: dict[str, Any], names: dict[str, str]) -> None:
+    # JSON decoding shares object keys, but not values: paths and names are decoded again each time.
+    for key in ("name", "target_path"):
+        if isinstance(value := obj_dict.get(key), str):
+            obj_dict[key] = names.setdefault(value, value)
+    if imports := obj_dict.get("imports"):
+        obj_dict["imports"] = {
+            names.setdefault(name, name): names.setdefault(path, path) for name, path in imports.items()
+        }
+    if exports := obj_dict.get("exports"):
+        obj_dict["exports"] = [
+            names.setdefault(export, export) if isinstance(export, str) else export for export in exports
+        ]
+
+
+class _LazyMembers(dict):
+    # Members of an object, indexed by name, and decoded only when accessed.
+    # Encoded members are replaced by their decoded object on first access.
+    # Iterating on names, checking for a name or counting members doesn't decode anything.
+
+    def __init__(self, owner: Object, encoded: dict[str, Any], decode: Callable[[Any, Object], Object | Alias]) -> None:
+        super().__init__(encoded)
+        self._owner = owner
+        self._decode = decode
+        self._encoded = set(encoded)
+
+    def _decode_member(self, name: str) -> Object | Alias:
+        member = self._decode(dict.__getitem__(self, name), self._owner)
+        # Decoding a member doesn't change the tree:
+        # we don't use the `parent` setter, which would invalidate caches.
+        member._parent = self._owner
+        dict.__setitem__(self, name, member)
+        self._encoded.discard(name)
+        return member
+
+    def _decode_members(self) -> None:
+        for name in [name for name in dict.__iter__(self) if name in self._encoded]:
+            self._decode_member(name)
+
+    def __getitem__(self, name: str) -> Object | Alias:
+        if name in self._encoded:
+            return self._decode_member(name)
+        return dict.__getitem__(self, name)
+
+    def __setitem__(self, name: str, value: Object | Alias) -> None:
+        self._encoded.discard(name)
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name: str) -> None:
+        self._encoded.discard(name)
+        dict.__delitem__(self, name)
+
+    # Overriding `__iter__` makes `dict(...)`, `{**...}` and `update(...)`
+    # go through `keys()` and `__getitem__` instead of reading encoded values.
+    def __iter__(self) -> Iterator[str]:
+        return dict.__iter__(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_members()
+        return dict.__eq__(self, other)
+
+    __hash__ = None  # ty:ignore[invalid-assignment]
+
+    def __repr__(self) -> str:
+        self._decode_members()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self.items()),))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default  # noqa: SIM401
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name in self:
+            value = self[name]
+            del self[name]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(name)
+
+    def popitem(self) -> tuple[str, Object | Alias]:
+        self._decode_members()
+        return dict.popitem(self)
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def values(self) -> ValuesView[Object | Alias]:  # ty:ignore[invalid-method-override]
+        self._decode_members()
+        return dict.values(self)
+
+    def items(self) -> ItemsView[str, Object | Alias]:  # ty:ignore[invalid-method-override]
+        self._decode_members()
+        return dict.items(self)
+
+    def copy(self) -> dict[str, Object | Alias]:
+        return dict(self.items())
+
+
+def _decode_json_value(value: Any) -> Any:
+    # Apply the JSON decoder from bottom to top, like `json.loads` does with object hooks.
+    if isinstance(value, list):
+        return [_decode_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return json_decoder({key: _decode_json_value(item) for key, item in value.items()})
+    return value
+
+
+def _load_lazy_object(obj_dict: dict[str, Any], parent: Object | None = None) -> Object | Alias:
+    obj = _loader_map[obj_dict["kind"]](
+        {key: _decode_json_value(value) for key, value in obj_dict.items() if key != "members"},
+    )
+    if parent is not None:
+        _attach_parent_to_exprs(obj, parent)  # ty:ignore[invalid-argument-type]
+    if members := obj_dict.get("members"):
+        obj.members = _LazyMembers(obj, members, _load_lazy_object)  # ty:ignore[invalid-argument-type]
+    return obj
+
+
+def lazy_json_decoder(data: Any) -> Any:
+    """Decode JSON data lazily.
+
+    Unlike the [`json_decoder`][griffe.json_decoder], which decodes everything while the JSON is parsed,
+    this decoder only decodes the top-level objects of already parsed JSON data.
+    Members of objects are indexed by name and decoded only when they are accessed,
+    for example through [`get_member`][griffe.Object.get_member] or [`members`][griffe.Object.members].
+
+    Examples:
+        >>> import json
+        >>> from griffe import lazy_json_decoder
+        >>> lazy_json_decoder(json.loads(...))
+
+    Parameters:
+        data: The parsed JSON data, loaded without the `json_decoder` object hook.
+
+    Returns:
+        The decoded Griffe object, or dictionary or list of Griffe objects.
+    """
+    if isinstance(data, dict):
+        if data.get("kind") in _loader_map:
+            return _load_lazy_object(data)
+        return {key: lazy_json_decoder(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [lazy_json_decoder(item) for item in data]
+    return data
+
+
+# Griffe's binary format is a marshalled tuple of tables followed by the encoded tree:
+# a table of dotted paths (each path being the index of its parent path and a name),
+# and a table of expression classes with their field names.
+# Strings are interned while encoding, so that marshal writes each of them only once.
+# Griffe objects, parameters, docstrings and expressions are encoded as typed records
+# (tuples with fields in a fixed order), which lets the decoder build them directly,
+# without inspecting dictionaries like the JSON decoder does.
+_BINARY_MAGIC = b"GRIFFE"
+_BINARY_VERSION = 1
+_MARSHAL_VERSION = 4
+
+_binary_kinds = (Kind.MODULE, Kind.CLASS, Kind.FUNCTION, Kind.ATTRIBUTE, Kind.TYPE_ALIAS, Kind.ALIAS)
+_binary_tags = {kind: tag for tag, kind in enumerate(_binary_kinds)}
+
+
+class BinaryEncoder:
+    """Binary encoder.
+
+    The binary format is more compact and faster to load than JSON,
+    but is only meant to be loaded back by Griffe,
+    using the [`binary_decoder`][griffe.binary_decoder].
+
+    Examples:
+        >>> from griffe import BinaryEncoder
+        >>> BinaryEncoder().encode(...)
+    """
+
+    def encode(self, obj: Any) -> bytes:
+        """Return the binary representation of the given object.
+
+        Parameters:
+            obj: The object to serialize. It can be a Griffe object,
+                or a dictionary or list of Griffe objects.
+
+        Returns:
+            Binary data.
+        """
+        writer = _BinaryWriter()
+        tree = writer.value(obj)
+        payload = (_BINARY_VERSION, tuple(writer.path_table), tuple(writer.expression_table), tree)
+        return _BINARY_MAGIC + marshal.dumps(payload, _MARSHAL_VERSION)
+
+
+class _BinaryWriter:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.paths: dict[str, int] = {}
+        self.path_table: list[tuple[int, str]] = []
+        self.expression_schemas: dict[type, tuple[int, tuple[str, ...]]] = {}
+        self.expression_table: list[tuple[str, tuple[str, ...]]] = []
+
+    def string(self, string: str) -> str:
+        try:
+            return self.strings[string]
+        except KeyError:
+            # Enumeration members are stored as plain strings.
+            interned = self.strings[string] = str.__str__(string)
+            return interned
+
+    def path(self, path: str) -> int:
+        if (index := self.paths.get(path)) is not None:
+            return index
+        parent, _, name = path.rpartition(".")
+        if parent and name and not parent.startswith(".") and ".." not in parent:
+            entry = (self.path(parent), self.string(name))
+        else:
+            # Top-level names, and relative or malformed paths, are stored as is.
+            entry = (-1, self.string(path))
+        index = self.paths[path] = len(self.path_table)
+        self.path_table.append(entry)
+        return index
+
+    def expression(self, value: Any) -> Any:
+        if isinstance(value, expressions.Expr):
+            cls = type(value)
+            if (schema := self.expression_schemas.get(cls)) is None:
+                names = tuple(field.name for field in expressions.getfields(cls))
+                schema = self.expression_schemas[cls] = (len(self.expression_table), names)
+                self.expression_table.append((self.string(cls.__name__), tuple(map(self.string, names))))
+            tag, names = schema
+            # Parents of names are attached again by the decoder.
+            return (tag, *(None if name == "parent" else self.expression(getattr(value, name)) for name in names))
+        if isinstance(value, str):
+            return self.string(value)
+        if isinstance(value, (list, tuple)):
+            return [self.expression(item) for item in value]
+        return value
+
+    def docstring(self, docstring: Docstring | None) -> tuple | None:
+        if not docstring:
+            return None
+        return (self.string(docstring.value), docstring.lineno, docstring.endlineno)
+
+    def decorators(self, decorators: list[Decorator]) -> list[tuple]:
+        return [(self.expression(dec.value), dec.lineno, dec.endlineno) for dec in decorators]
+
+    def type_parameters(self, type_parameters: TypeParameters | None) -> list[tuple]:
+        return [
+            (
+                self.string(type_param.name),
+                self.string(type_param.kind),
+                self.expression(type_param.annotation),
+                self.expression(type_param.default),
+            )
+            for type_param in type_parameters or ()
+        ]
+
+    def parameters(self, parameters: Parameters) -> list[tuple]:
+        return [
+            (
+                self.string(param.name),
+                self.expression(param.annotation),
+                self.string(param.kind),  # ty:ignore[invalid-argument-type]
+                self.expression(param.default),
+                self.docstring(param.docstring),
+            )
+            for param in parameters
+        ]
+
+    def exports(self, exports: list[str | expressions.ExprName] | None) -> list | None:
+        if exports is None:
+            return None
+        # Names (like `submodule.__all__`) are stored as lists of names, from the last one to the first one.
+        # The first name's parent is the module itself, and is attached again by the decoder.
+        records: list[str | list[str]] = []
+        for export in exports:
+            if isinstance(export, str):
+                records.append(self.string(export))
+                continue
+            names = []
+            name: Any = export
+            while isinstance(name, expressions.ExprName):
+                names.append(self.string(name.name))
+                name = name.parent
+            records.append(names)
+        return records
+
+    def object(self, obj: Object | Alias) -> tuple:
+        if isinstance(obj, Alias):
+            return (
+                _binary_tags[Kind.ALIAS],
+                self.string(obj.name),
+                self.path(obj.target_path),
+                obj.alias_lineno,
+                obj.alias_endlineno,
+                obj.runtime,
+                obj.inherited,
+                obj.public,
+                obj.deprecated,
+                obj.analysis,
+            )
+        # Fields common to all objects come first (see `_BinaryReader._finish`),
+        # followed by fields specific to each kind of object.
+        git_info = obj._git_info
+        record = [
+            _binary_tags[obj.kind],
+            self.string(obj.name),
+            obj.lineno,
+            obj.endlineno,
+            self.docstring(obj.docstring),
+            obj.runtime,
+            obj.public,
+            obj.deprecated,
+            obj.analysis,
+            [self.string(label) for label in sorted(obj.labels)],
+            self.exports(obj.exports),
+            {self.string(name): self.path(path) for name, path in obj.imports.items()},
+            [self.object(member) for member in obj.members.values()],
+            self.type_parameters(obj.type_parameters),
+            git_info and (str(git_info.repository), git_info.service, git_info.remote_url, git_info.commit_hash),
+            obj._source_link,
+        ]
+        if isinstance(obj, Module):
+            filepath = obj._filepath
+            record.append([*map(str, filepath)] if isinstance(filepath, list) else filepath and str(filepath))
+        elif isinstance(obj, Class):
+            record.extend((self.expression(obj.bases), self.decorators(obj.decorators)))
+        elif isinstance(obj, Function):
+            record.extend(
+                (self.parameters(obj.parameters), self.expression(obj.returns), self.decorators(obj.decorators)),
+            )
+        elif isinstance(obj, Attribute):
+            record.extend((self.expression(obj.value), self.expression(obj.annotation)))
+        elif isinstance(obj, TypeAlias):
+            record.append(self.expression(obj.value))
+        return tuple(record)
+
+    def value(self, value: Any) -> Any:
+        if isinstance(value, (Object, Alias)):
+            return self.object(value)
+        if isinstance(value, dict):
+            return {self.string(key): self.value(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.value(item) for item in value]
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable in binary format")
+
+
+def _read_export(record: str | list[str], module: Object) -> str | expressions.ExprName:
+    if isinstance(record, str):
+        return record
+    parent: Any = module
+    for name in reversed(record):
+        parent = expressions.ExprName(name, parent)
+    return parent
+
+
+class _BinaryReader:
+    def __init__(
+        self,
+        path_table: tuple[tuple[int, str], ...],
+        expression_table: tuple[tuple[str, tuple[str, ...]], ...],
+        *,
+        lazy: bool = False,
+    ) -> None:
+        self.lazy = lazy
+        # Parents always appear before their children in the path table.
+        self.paths: list[str] = []
+        for parent, name in path_table:
+            self.paths.append(name if parent < 0 else f"{self.paths[parent]}.{name}")
+        self.expressions: list[type[expressions.Expr]] = []
+        for name, fields in expression_table:
+            cls = getattr(expressions, name, None)
+            if cls is None or tuple(field.name for field in expressions.getfields(cls)) != fields:
+                raise ValueError(f"Binary data contains an incompatible expression: {name}")
+            self.expressions.append(cls)
+        # Names found in the expressions of the object being read.
+        # They are attached to the object's parent once it is read.
+        self.names: list[expressions.ExprName] = []
+        self.readers = (
+            self.module,
+            self.class_,
+            self.function,
+            self.attribute,
+            self.type_alias,
+            self.alias,
+        )
+
+    def expression(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type is tuple:
+            cls = self.expressions[value[0]]
+            expr = cls(*map(self.expression, value[1:]))
+            if cls is expressions.ExprName:
+                self.names.append(expr)  # ty:ignore[invalid-argument-type]
+            elif cls is expressions.ExprAttribute:
+                _link_attribute_names(expr)
+            return expr
+        if value_type is list:
+            return [*map(self.expression, value)]
+        return value
+
+    def docstring(self, record: tuple | None) -> Docstring | None:
+        if record is None:
+            return None
+        # Values are stored cleaned already, and cleaning them again could change them.
+        docstring = Docstring("", lineno=record[1], endlineno=record[2])
+        docstring.value = record[0]
+        return docstring
+
+    def decorators(self, records: list[tuple]) -> list[Decorator]:
+        return [
+            Decorator(self.expression(value), lineno=lineno, endlineno=endlineno)
+            for value, lineno, endlineno in records
+        ]
+
+    def type_parameters(self, records: list[tuple]) -> TypeParameters:
+        return TypeParameters(
+            *(
+                TypeParameter(
+                    name,
+                    kind=TypeParameterKind(kind),
+                    bound=self.expression(annotation),
+                    default=self.expression(default),
+                )
+                for name, kind, annotation, default in records
+            ),
+        )
+
+    def parameters(self, records: list[tuple]) -> Parameters:
+        return Parameters(
+            *(
+                Parameter(
+                    name,
+                    annotation=self.expression(annotation),
+                    kind=ParameterKind(kind),
+                    default=self.expression(default),
+                    docstring=self.docstring(docstring),
+                )
+                for name, annotation, kind, default, docstring in records
+            ),
+        )
+
+    def object(self, record: tuple) -> Object | Alias:
+        return self.readers[record[0]](record)
+
+    def member(self, record: tuple, parent: Object) -> Object | Alias:
+        outer_names = self.names
+        self.names = []
+        member = self.object(record)
+        for name in self.names:
+            # Names that are part of attributes are already linked together.
+            if name.parent is None:
+                name.parent = parent
+        self.names = outer_names
+        return member
+
+    def _finish(self, obj: Object, record: tuple) -> None:
+        if self.lazy and record[12]:
+            obj.members = _LazyMembers(obj, {member[1]: member for member in record[12]}, self.member)
+        else:
+            for member_record in record[12]:
+                member = self.member(member_record, obj)
+                obj.set_member(member.name, member)
+        obj.exports = None if record[10] is None else [_read_export(export, obj) for export in record[10]]
+        obj.imports = {name: self.paths[path] for name, path in record[11].items()}
+        obj.labels |= set(record[9])
+        obj.deprecated = record[7]
+        obj.public = record[6]
+        obj.source_link = record[15]
+        if git_info := record[14]:
+            obj.git_info = GitInfo(
+                repository=Path(git_info[0]),
+                service=git_info[1],
+                remote_url=git_info[2],
+                commit_hash=git_info[3],
+            )
+
+    def module(self, record: tuple) -> Module:
+        filepath = record[16]
+        module = Module(
+            name=record[1],
+            filepath=[*map(Path, filepath)] if isinstance(filepath, list) else filepath and Path(filepath),
+            docstring=self.docstring(record[4]),
+            runtime=record[5],
+            analysis=record[8],
+        )
+        self._finish(module, record)
+        return module
+
+    def class_(self, record: tuple) -> Class:
+        class_ = Class(
+            name=record[1],
+            lineno=record[2],
+            endlineno=record[3],
+            docstring=self.docstring(record[4]),
+            decorators=self.decorators(record[17]),
+            type_parameters=self.type_parameters(record[13]),
+            bases=self.expression(record[16]),
+            runtime=record[5],
+            analysis=record[8],
+        )
+        self._finish(class_, record)
+        return class_
+
+    def function(self, record: tuple) -> Function:
+        function = Function(
+            name=record[1],
+            parameters=self.parameters(record[16]),
+            returns=self.expression(record[17]),
+            decorators=self.decorators(record[18]),
+            type_parameters=self.type_parameters(record[13]),
+            lineno=record[2],
+            endlineno=record[3],
+            docstring=self.docstring(record[4]),
+            runtime=record[5],
+            analysis=record[8],
+        )
+        self._finish(function, record)
+        return function
+
+    def attribute(self, record: tuple) -> Attribute:
+        attribute = Attribute(
+            name=record[1],
+            lineno=record[2],
+            endlineno=record[3],
+            docstring=self.docstring(record[4]),
+            value=self.expression(record[16]),
+            annotation=self.expression(record[17]),
+            runtime=record[5],
+            analysis=record[8],
+        )
+        self._finish(attribute, record)
+        return attribute
+
+    def type_alias(self, record: tuple) -> TypeAlias:
+        type_alias = TypeAlias(
+            name=record[1],
+            value=self.expression(record[16]),
+            type_parameters=self.type_parameters(record[13]),
+            lineno=record[2],
+            endlineno=record[3],
+            docstring=self.docstring(record[4]),
+            runtime=record[5],
+            analysis=record[8],
+        )
+        self._finish(type_alias, record)
+        return type_alias
+
+    def alias(self, record: tuple) -> Alias:
+        _, name, target_path, lineno, endlineno, runtime, inherited, public, deprecated, analysis = record
+        alias = Alias(
+            name,
+            self.paths[target_path],
+            lineno=lineno,
+            endlineno=endlineno,
+            runtime=runtime,
+            inherited=inherited,
+            analysis=analysis,
+        )
+        alias.public = public
+        alias.deprecated = deprecated
+        return alias
+
+    def value(self, value: Any) -> Any:
+        if type(value) is tuple:
+            obj = self.object(value)
+            # Names of a top-level module or class are attached to the object itself.
+            if isinstance(obj, (Module, Class)):
+                for name in self.names:
+                    if name.parent is None:
+                        name.parent = obj
+            self.names = []
+            return obj
+        if type(value) is dict:
+            return {key: self.value(item) for key, item in value.items()}
+        return [self.value(item) for item in value]
+
+
+def binary_decoder(data: bytes, *, lazy: bool = False) -> Any:
+    """Decode binary data produced by the [`BinaryEncoder`][griffe.BinaryEncoder].
+
+    Only decode data you trust: like [`marshal`][], which it is built upon,
+    the binary format is not secure against maliciously constructed data.
+
+    Examples:
+        >>> from griffe import BinaryEncoder, binary_decoder
+        >>> binary_decoder(BinaryEncoder().encode(...))
+
+    Parameters:
+        data: The binary data to decode.
+        lazy: Whether to decode members of objects only when they are accessed,
+            for example through [`get_member`][griffe.Object.get_member] or [`members`][griffe.Object.members].
+
+    Returns:
+        The decoded Griffe object, or dictionary or list of Griffe objects.
+
+    Raises:
+        ValueError: When the data is not in Griffe's binary format,
+            or was written by an incompatible version of Griffe.
+    """
+    if not data.startswith(_BINARY_MAGIC):
+        raise ValueError("Data is not in Griffe's binary format")
+    try:
+        version, path_table, expression_table, tree = marshal.loads(data[len(_BINARY_MAGIC) :])  # noqa: S302
+    except (EOFError, TypeError, ValueError) as error:
+        raise ValueError("Data is not in Griffe's binary format") from error
+    if version != _BINARY_VERSION:
+        raise ValueError(f"Unsupported binary format version {version} (expected {_BINARY_VERSION})")
+    return _BinaryReader(path_table, expression_table, lazy=lazy).value(tree)
@@ -21,9 +21,12 @@ from __future__ import annotations
 
 import os
 import sys
+from collections import defaultdict
+from functools import wraps
 from importlib.util import module_from_spec, spec_from_file_location
 from inspect import isclass
 from pathlib import Path
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
 from griffe._internal.agents.nodes.ast import ast_children, ast_kind
@@ -32,6 +35,7 @@ from griffe._internal.importer import dynamic_import
 
 if TYPE_CHECKING:
     import ast
+    from collections.abc import Callable
     from types import ModuleType
 
     from griffe._internal.agents.inspector import Inspector
@@ -458,15 +462,45 @@ LoadableExtensionType = str | dict[str, Any] | Extension | type[Extension]
 class Extensions:
     """This class helps iterating on extensions that should run at different times."""
 
-    def __init__(self, *extensions: Extension) -> None:
+    def __init__(self, *extensions: Extension, profile: bool = False) -> None:
         """Initialize the extensions container.
 
         Parameters:
             *extensions: The extensions to add.
+            profile: Whether to record the time spent in each hook of each extension, and their number of calls.
         """
         self._extensions: list[Extension] = []
+        # Hooks to call for each event, only for extensions overriding them.
+        self._hooks: dict[str, list[Callable[..., None]]] = {}
+        self._profile = profile
+        # Number of calls and durations in nanoseconds, by extension then by event.
+        self._timings: defaultdict[str, defaultdict[str, list[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
         self.add(*extensions)
 
+    @property
+    def profile(self) -> bool:
+        """Whether to record the time spent in each hook of each extension, and their number of calls.
+
+        See also: [`timings`][griffe.Extensions.timings].
+        """
+        return self._profile
+
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self._profile = value
+        self._hooks = {event: self._find_hooks(event) for event in _events}
+
+    @property
+    def timings(self) -> dict[str, dict[str, tuple[int, int]]]:
+        """Number of calls and time spent (in nanoseconds) in hooks, by extension then by event.
+
+        Only recorded when [`profile`][griffe.Extensions.profile] is enabled.
+        """
+        return {
+            extension: {event: (calls, duration) for event, (calls, duration) in events.items()}
+            for extension, events in self._timings.items()
+        }
+
     def add(self, *extensions: Extension) -> None:
         """Add extensions to this container.
 
@@ -475,9 +509,55 @@ class Extensions:
         """
         for extension in extensions:
             self._extensions.append(extension)
+        # Events that are not known hooks of the base class are added on the fly, when called.
+        self._hooks = {event: self._find_hooks(event) for event in _events}
 
-    def _noop(self, **kwargs: Any) -> None:
-        """No-op method for extension hooks."""
+    def _find_hooks(self, event: str) -> list[Callable[..., None]]:
+        hooks = []
+        for extension in self._extensions:
+            hook = getattr(extension, event, None)
+            if hook is None:
+                continue
+            # Skip hooks that are not overridden, since they do nothing.
+            # Functions assigned on instances have no `__func__` and are always kept.
+            base_hook = getattr(Extension, event, None)
+            if getattr(hook, "__func__", None) is base_hook is not None and not (
+                event == "on_alias_instance" and getattr(extension, "__old_on_alias", False)
+            ):
+                continue
+            hooks.append(self._timed(extension, event, hook) if self._profile else hook)
+        return hooks
+
+    def _timed(self, extension: Extension, event: str, hook: Callable[..., None]) -> Callable[..., None]:
+        timings = self._timings[f"{type(extension).__module__}.{type(extension).__qualname__}"][event]
+
+        @wraps(hook)
+        def timed_hook(**kwargs: Any) -> None:
+            start = perf_counter_ns()
+            try:
+                hook(**kwargs)
+            finally:
+                timings[0] += 1
+                timings[1] += perf_counter_ns() - start
+
+        return timed_hook
+
+    def listens_to(self, event: str) -> bool:
+        """Tell whether at least one extension hooks onto the given event.
+
+        This can be used to avoid preparing data for events that nobody listens to.
+
+        Parameters:
+            event: The event name, for example `on_class`.
+
+        Returns:
+            Whether the event has at least one listener.
+        """
+        try:
+            return bool(self._hooks[event])
+        except KeyError:
+            hooks = self._hooks[event] = self._find_hooks(event)
+            return bool(hooks)
 
     def call(self, event: str, **kwargs: Any) -> None:
         """Call the extension hook for the given event.
@@ -486,8 +566,15 @@ class Extensions:
             event: The triggered event.
             **kwargs: Arguments passed to the hook.
         """
-        for extension in self._extensions:
-            getattr(extension, event, self._noop)(**kwargs)
+        try:
+            hooks = self._hooks[event]
+        except KeyError:
+            hooks = self._hooks[event] = self._find_hooks(event)
+        for hook in hooks:
+            hook(**kwargs)
+
+
+_events = tuple(name for name in vars(Extension) if name.startswith("on_"))
 
 
 builtin_extensions: set[str] = {
@@ -34,8 +34,11 @@ from __future__ import annotations
 
 import ast
 import os
+import pickle
 import re
 import sys
+import tempfile
+import time
 from collections import defaultdict
 from contextlib import suppress
 from dataclasses import dataclass
@@ -115,13 +118,29 @@ class ModuleFinder:
     extensions_set: ClassVar[set[str]] = set(accepted_py_module_extensions)
     """Set of extensions supported by the finder."""
 
-    def __init__(self, search_paths: Sequence[str | Path] | None = None) -> None:
+    def __init__(
+        self,
+        search_paths: Sequence[str | Path] | None = None,
+        *,
+        index_path: str | Path | None = None,
+    ) -> None:
         """Initialize the finder.
 
         Parameters:
             search_paths: Optional paths to search into.
+            index_path: Optional file in which to persist the contents of scanned directories
+                and the directories listed in `.pth` files, see [`save_index`][griffe.ModuleFinder.save_index].
         """
-        self._paths_contents: dict[Path, list[Path]] = {}
+        self.index_path: Path | None = Path(index_path) if index_path else None
+        """The file in which the contents of scanned directories are persisted."""
+        # Contents of scanned directories (entry names, and whether they are directories),
+        # with the modification times of directories when they were scanned.
+        self._index: dict[Path, tuple[int, dict[str, bool]]] = {}
+        # Parsed `.pth` files used by this finder or read from the index, to persist them in the index.
+        self._pth_files: dict[Path, _PthFile] = {}
+        self._load_index()
+        self._index_changed: bool = False
+        self._paths_contents: dict[Path, dict[str, bool]] = {}
         self.search_paths: list[Path] = []
         """The finder search paths."""
 
@@ -271,19 +290,24 @@ class ModuleFinder:
             path_contents = self._contents(path)
             if path_contents:
                 for choice in filepaths:
-                    abs_path = path / choice
-                    if abs_path in path_contents:
+                    if choice.name in path_contents:
+                        abs_path = path / choice
                         if abs_path.suffix:
-                            stubs = abs_path.with_suffix(".pyi")
-                            return Package(real_module_name, abs_path, stubs if stubs.exists() else None)
+                            stubs = f"{module_name}.pyi" in path_contents
+                            return Package(real_module_name, abs_path, abs_path.with_suffix(".pyi") if stubs else None)
+                        # Directory contents are scanned once, instead of checking if each file exists.
+                        package_contents = self._listing(abs_path)
                         init_module = abs_path / "__init__.py"
-                        if init_module.exists() and not _is_pkg_style_namespace(init_module):
-                            stubs = init_module.with_suffix(".pyi")
-                            return Package(real_module_name, init_module, stubs if stubs.exists() else None)
-                        init_module = abs_path / "__init__.pyi"
-                        if init_module.exists():
+                        if "__init__.py" in package_contents and not _is_pkg_style_namespace(init_module):
+                            stubs = "__init__.pyi" in package_contents
+                            return Package(
+                                real_module_name,
+                                init_module,
+                                init_module.with_suffix(".pyi") if stubs else None,
+                            )
+                        if "__init__.pyi" in package_contents:
                             # Stubs package.
-                            return Package(real_module_name, init_module, None)
+                            return Package(real_module_name, abs_path / "__init__.pyi", None)
                         namespace_dirs.append(abs_path)
 
         if namespace_dirs:
@@ -333,29 +357,23 @@ class ModuleFinder:
         # from another part of the namespace.
         skip = set(seen or ())
 
-        for subpath in self._filter_py_modules(path):
-            rel_subpath = subpath.relative_to(path)
-            if rel_subpath.parent in skip:
+        for parent_parts, filename, subpath in self._filter_py_modules(path):
+            if parent_parts in skip:
                 logger.debug("Skip %s, another module took precedence", subpath)
                 continue
-            py_file = rel_subpath.suffix == ".py"
-            stem = rel_subpath.stem
-            if not py_file:
+            stem, extension = os.path.splitext(filename)  # noqa: PTH122
+            if extension != ".py":
                 # `.py[cod]` and `.so` files look like `name.cpython-38-x86_64-linux-gnu.ext`.
                 stem = stem.split(".", 1)[0]
             if stem == "__init__":
-                # Optimization: since it's a relative path, if it has only one part
-                # and is named __init__, it means it's the starting path
-                # (no need to compare it against starting path).
-                if len(rel_subpath.parts) == 1:
+                # The `__init__` module of the starting path is the module itself.
+                if not parent_parts:
                     continue
-                yield rel_subpath.parts[:-1], subpath
+                yield parent_parts, subpath
                 if seen is not None:
-                    seen.add(rel_subpath.parent)
-            elif py_file:
-                yield rel_subpath.with_suffix("").parts, subpath
+                    seen.add(parent_parts)
             else:
-                yield rel_subpath.with_name(stem).parts, subpath
+                yield (*parent_parts, stem), subpath
 
     def submodules(self, module: Module) -> list[NamePartsAndPathType]:
         """Return the list of a module's submodules.
@@ -389,30 +407,130 @@ class ModuleFinder:
             return path.stem, path
         raise FileNotFoundError
 
-    def _contents(self, path: Path) -> list[Path]:
+    def _contents(self, path: Path) -> dict[str, bool]:
+        # Contents of search paths are scanned once per finder.
         if path not in self._paths_contents:
-            try:
-                self._paths_contents[path] = list(path.iterdir())
-            except (FileNotFoundError, NotADirectoryError):
-                self._paths_contents[path] = []
+            self._paths_contents[path] = self._listing(path)
         return self._paths_contents[path]
 
+    def _listing(self, path: Path) -> dict[str, bool]:
+        # Names of the entries of a directory, and whether they are directories.
+        # Directories are scanned again only when their modification time changed,
+        # which happens when entries are added, removed or renamed.
+        key = path if path.is_absolute() else path.absolute()
+        try:
+            mtime = os.stat(path).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            if self._index.pop(key, None) is not None:
+                self._index_changed = True
+            return {}
+        if (indexed := self._index.get(key)) is not None and indexed[0] == mtime:
+            return indexed[1]
+        listing = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        listing[entry.name] = entry.is_dir()
+                    except OSError:
+                        listing[entry.name] = False
+        except OSError:
+            return {}
+        # Entries could still be added during the same clock tick as recent modifications:
+        # in that case we record an invalid time so that the directory is scanned again next time.
+        self._index[key] = (-1 if _is_racy(mtime) else mtime, listing)
+        self._index_changed = True
+        return listing
+
+    def _load_index(self) -> None:
+        if self.index_path is None:
+            return
+        try:
+            with self.index_path.open("rb") as file:
+                version, index, pth_files = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not load finder index from %s", self.index_path)
+            return
+        if version == _INDEX_VERSION:
+            self._index = index
+            self._pth_files = pth_files
+            # Parsed `.pth` files from the current process take precedence.
+            for path, pth_file in pth_files.items():
+                _pth_files_cache.setdefault(path, pth_file)
+
+    def save_index(self) -> None:
+        """Persist the contents of scanned directories, if an index path was given and contents changed.
+
+        Persisted contents are reused by finders created later with the same index path,
+        as long as the modification times of directories did not change.
+        Directories listed in `.pth` files and editable modules are persisted too,
+        and reused as long as these files did not change.
+        """
+        if self.index_path is None or not self._index_changed:
+            return
+        # Directories and `.pth` files that were deleted since they were indexed are forgotten.
+        self._index = {path: entry for path, entry in self._index.items() if path.is_dir()}
+        self._pth_files = {path: pth_file for path, pth_file in self._pth_files.items() if path.exists()}
+        data = pickle.dumps((_INDEX_VERSION, self._index, self._pth_files), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically, in case several processes share the same index.
+            with tempfile.NamedTemporaryFile(dir=self.index_path.parent, delete=False) as file:
+                file.write(data)
+            Path(file.name).replace(self.index_path)
+        except OSError as error:
+            logger.debug("Could not write finder index to %s: %s", self.index_path, error)
+            return
+        self._index_changed = False
+
     def _extend_from_pth_files(self) -> None:
         for path in self.search_paths:
-            for item in self._contents(path):
-                if item.suffix == ".pth":
-                    for directory in _handle_pth_file(item):
+            for name in self._contents(path):
+                if name.endswith(".pth"):
+                    for directory in self._pth_directories(path / name):
                         if scan := directory.always_scan_for:
                             self._always_scan_for[scan].append(directory.path.joinpath(scan))
                         self.append_search_path(directory.path)
 
-    def _filter_py_modules(self, path: Path) -> Iterator[Path]:
-        for root, dirs, files in os.walk(path, topdown=True, followlinks=True):
-            # Optimization: modify dirs in-place to exclude `__pycache__` directories.
-            dirs[:] = [dir for dir in dirs if dir != "__pycache__"]
-            for relfile in files:
-                if os.path.splitext(relfile)[1] in self.extensions_set:  # noqa: PTH122
-                    yield Path(root, relfile)
+    def _pth_directories(self, path: Path) -> list[_SP]:
+        # Parsing `.pth` files and the editable modules they import is cached for the whole process,
+        # as long as these files keep the same modification times and sizes.
+        pth_file = _pth_files_cache.get(path)
+        if pth_file is None or not pth_file.is_valid():
+            editable_modules: list[Path] = []
+            directories = _handle_pth_file(path, editable_modules)
+            pth_file = _PthFile(
+                files=tuple((file, _file_signature(file)) for file in (path, *editable_modules)),
+                directories=directories,
+            )
+            # Files modified recently could still change without their signature changing.
+            if all(signature is not None and not _is_racy(signature[0]) for _, signature in pth_file.files):
+                _pth_files_cache[path] = self._pth_files[path] = pth_file
+                self._index_changed = True
+            return directories
+        if self._pth_files.get(path) != pth_file:
+            # Parsed by another finder of the current process, and not persisted in the index yet.
+            self._pth_files[path] = pth_file
+            self._index_changed = True
+        return pth_file.directories
+
+    def _filter_py_modules(
+        self,
+        path: Path,
+        parent_parts: NamePartsType = (),
+    ) -> Iterator[tuple[NamePartsType, str, Path]]:
+        # Yield the parts of the relative parent directory, the name, and the path of each module file.
+        # Like `os.walk`, files of a directory come before the ones of its subdirectories,
+        # symbolic links to directories are followed, and unreadable directories are skipped.
+        listing = self._listing(path)
+        for name, is_dir in listing.items():
+            if not is_dir and os.path.splitext(name)[1] in self.extensions_set:  # noqa: PTH122
+                yield parent_parts, name, path / name
+        for name, is_dir in listing.items():
+            if is_dir and name != "__pycache__":
+                yield from self._filter_py_modules(path / name, (*parent_parts, name))
 
     def _top_module_name(self, path: Path) -> str:
         # First find if a parent is in search paths.
@@ -431,6 +549,9 @@ class ModuleFinder:
         return parent_path.name
 
 
+_INDEX_VERSION = 2
+_RACY_DELAY_NS = 2_000_000_000
+
 _re_pkgresources = re.compile(r"(?:__import__\([\"']pkg_resources[\"']\).declare_namespace\(__name__\))")
 _re_pkgutil = re.compile(r"(?:__path__ = __import__\([\"']pkgutil[\"']\).extend_path\(__path__, __name__\))")
 _re_import_line = re.compile(r"^import[ \t]+\w+$")
@@ -453,7 +574,33 @@ class _SP:
     always_scan_for: str = ""
 
 
-def _handle_pth_file(path: Path) -> list[_SP]:
+@dataclass
+class _PthFile:
+    # Signatures of the `.pth` file and of the editable modules it imports.
+    files: tuple[tuple[Path, tuple[int, int] | None], ...]
+    directories: list[_SP]
+
+    def is_valid(self) -> bool:
+        return all(_file_signature(file) == signature for file, signature in self.files)
+
+
+# Parsed `.pth` files, shared by all finders of the process.
+_pth_files_cache: dict[Path, _PthFile] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _is_racy(mtime: int) -> bool:
+    return time.time_ns() - mtime < _RACY_DELAY_NS
+
+
+def _handle_pth_file(path: Path, editable_modules: list[Path] | None = None) -> list[_SP]:
     # Support for .pth files pointing to directories.
     # From https://docs.python.org/3/library/site.html:
     # A path configuration file is a file whose name has the form name.pth
@@ -476,6 +623,8 @@ def _handle_pth_file(path: Path) -> list[_SP]:
         line = line.strip()  # noqa: PLW2901
         if _re_import_line.match(line):
             editable_module = path.parent / f"{line[len('import') :].lstrip()}.py"
+            if editable_modules is not None:
+                editable_modules.append(editable_module)
             with suppress(UnhandledEditableModuleError):
                 return _handle_editable_module(editable_module)
         if line and not line.startswith("#") and os.path.exists(line):  # noqa: PTH110
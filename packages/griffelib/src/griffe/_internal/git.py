@@ -24,18 +24,20 @@ import os
 import re
 import shutil
 import subprocess
+import threading
 import unicodedata
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from pathlib import Path
+from functools import cached_property
+from pathlib import Path, PurePosixPath
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Literal
+from typing import IO, TYPE_CHECKING, Literal
 from urllib.parse import urlsplit, urlunsplit
 
 from griffe._internal.exceptions import BuiltinModuleError, GitError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
 
     from griffe._internal.models import Module
 
@@ -116,38 +118,93 @@ def _get_repo_root(repo: str | Path) -> Path:
     return Path(_git("-C", str(repo), "rev-parse", "--show-toplevel"))
 
 
-@contextmanager
-def _tmp_worktree(repo: str | Path = ".", ref: str = "HEAD") -> Iterator[Path]:
-    """Deprecated. Context manager that checks out the given reference in the given repository to a temporary worktree.
-
-    Parameters:
-        repo: Path to the repository (i.e. the directory *containing* the `.git` directory)
-        ref: A Git reference such as a commit, tag or branch.
+# File modes of regular files and symbolic links in Git trees.
+_BLOB_MODES = {"100644", "100755", "120000"}
+_SOURCE_SUFFIXES = {".py", ".pyi"}
 
-    Yields:
-        The path to the temporary worktree.
 
-    Raises:
-        OSError: If `repo` is not a valid `.git` repository
-        RuntimeError: If the `git` executable is unavailable, or if it cannot create a worktree
-    """
+@contextmanager
+def _tmp_sources(repo: str | Path = ".", ref: str = "HEAD", paths: Sequence[str | Path] = (".",)) -> Iterator[Path]:
+    # Nothing is checked out and no branch is created:
+    # Python files under the given paths are listed from the tree of the reference,
+    # and their contents are streamed from the object database by a single Git process,
+    # then written to a temporary directory mirroring the repository layout.
     _assert_git_repo(repo)
+    try:
+        entries = _list_sources(repo, ref, paths)
+    except GitError as error:
+        raise RuntimeError(f"Could not read git reference {ref}: {error}") from error
     repo_name = Path(repo).resolve().name
-    normref = _normalize(ref)  # Branch names can contain slashes.
+    normref = _normalize(ref)
     with TemporaryDirectory(prefix=f"{_WORKTREE_PREFIX}{repo_name}-{normref}-") as tmp_dir:
-        location = os.path.join(tmp_dir, normref)  # noqa: PTH118
-        tmp_branch = f"griffe-{normref}"  # Temporary branch name must not already exist.
-        try:
-            _git("-C", str(repo), "worktree", "add", "-b", tmp_branch, location, ref)
-        except GitError as error:
-            raise RuntimeError(f"Could not create git worktree: {error}") from error
-
-        try:
-            yield Path(location)
-        finally:
-            _git("-C", str(repo), "worktree", "remove", location, check=False)
-            _git("-C", str(repo), "worktree", "prune", check=False)
-            _git("-C", str(repo), "branch", "-D", tmp_branch, check=False)
+        location = Path(tmp_dir, normref)
+        for (mode, _, path), content in zip(entries, _read_blobs(repo, [oid for _, oid, _ in entries]), strict=True):
+            filepath = location.joinpath(path)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            if mode == "120000":
+                with suppress(OSError):
+                    filepath.symlink_to(os.fsdecode(content))
+            else:
+                filepath.write_bytes(content)
+        location.mkdir(exist_ok=True)
+        yield location
+
+
+def _list_sources(repo: str | Path, ref: str, paths: Sequence[str | Path]) -> list[tuple[str, str, str]]:
+    prefixes = {PurePosixPath(Path(path).as_posix()).as_posix() for path in paths}
+    everything = "." in prefixes or any(PurePosixPath(prefix).is_absolute() for prefix in prefixes)
+    output = _git("-C", str(repo), "ls-tree", "-r", "-z", "--full-tree", ref)
+    entries = []
+    for entry in output.split("\0"):
+        if not entry:
+            continue
+        info, path = entry.split("\t", 1)
+        mode, _, oid = info.split(" ")
+        if mode not in _BLOB_MODES or PurePosixPath(path).suffix not in _SOURCE_SUFFIXES:
+            continue
+        if everything or any(path == prefix or path.startswith(f"{prefix}/") for prefix in prefixes):
+            entries.append((mode, oid, path))
+    return entries
+
+
+def _read_blobs(repo: str | Path, oids: list[str]) -> Iterator[bytes]:
+    if not oids:
+        return
+    with subprocess.Popen(
+        ["git", "-C", str(repo), "cat-file", "--batch", "--buffer"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as process:
+        # Requests are written from another thread so that Git never blocks on a full output pipe.
+        writer = threading.Thread(target=_write_lines, args=(process.stdin, oids), daemon=True)
+        writer.start()
+        for _ in oids:
+            header = process.stdout.readline().split()  # ty:ignore[possibly-missing-attribute]
+            if len(header) != 3:  # noqa: PLR2004
+                process.kill()
+                raise GitError(f"Could not read object {header[0].decode() if header else ''} from the object database")
+            content = process.stdout.read(int(header[2]))  # ty:ignore[possibly-missing-attribute]
+            process.stdout.read(1)  # ty:ignore[possibly-missing-attribute]
+            yield content
+        writer.join()
+
+
+def _write_lines(stream: IO[bytes], lines: list[str]) -> None:
+    with suppress(BrokenPipeError), stream:
+        stream.write("".join(f"{line}\n" for line in lines).encode())
+
+
+def _get_git_info(repo: str | Path, ref: str, location: Path) -> GitInfo | None:
+    # Git information of sources extracted to a temporary location.
+    try:
+        remote_url = _get_git_remote_url(repo)
+        if not (service := _get_git_known_service(remote_url)):
+            return None
+        commit_hash = os.getenv("GRIFFE_GIT_COMMIT_HASH") or _git("-C", str(repo), "rev-parse", f"{ref}^{{commit}}")
+    except GitError:
+        return None
+    return GitInfo(repository=location, service=service, remote_url=remote_url, commit_hash=commit_hash)
 
 
 def _get_git_remote_url(repo: str | Path = ".") -> str:
@@ -155,7 +212,10 @@ def _get_git_remote_url(repo: str | Path = ".") -> str:
         return git_url
 
     remote = "remote." + os.getenv("GRIFFE_GIT_REMOTE", "origin") + ".url"
-    git_url = _git("-C", str(repo), "config", "--default", "", "--get", remote)
+    return _clean_git_remote_url(_git("-C", str(repo), "config", "--default", "", "--get", remote))
+
+
+def _clean_git_remote_url(git_url: str) -> str:
     if git_url.startswith("git@"):
         git_url = git_url.replace(":", "/", 1).replace("git@", "https://", 1)
     git_url = git_url.removesuffix(".git")
@@ -231,14 +291,120 @@ def _get_source_link(
     return _service_to_url[service](remote_url, commit_hash, filepath, lineno, endlineno)
 
 
-def _get_git_commit_hash(repo: str | Path = ".") -> str:
-    if commit_hash := os.getenv("GRIFFE_GIT_COMMIT_HASH"):
-        return commit_hash
-    return _git("-C", str(repo), "rev-parse", "HEAD")
-
+class _Repository:
+    """Facts about a Git repository, each fetched with a single Git command, once."""
+
+    def __init__(self, root: Path) -> None:
+        self.root: Path = root
+
+    @cached_property
+    def commit_hash(self) -> str:
+        return _git("-C", str(self.root), "rev-parse", "HEAD")
+
+    @cached_property
+    def remote_urls(self) -> dict[str, str]:
+        output = _git("-C", str(self.root), "config", "--get-regexp", r"^remote\..*\.url$", check=False)
+        return dict(line.split(" ", 1) for line in output.splitlines() if " " in line)
+
+    @cached_property
+    def _files(self) -> tuple[set[str], set[str], set[str]]:
+        # Files that are not ignored (tracked, or untracked but not ignored), their parent directories,
+        # and untracked directories that are not ignored (listed as a whole, without their files).
+        output = _git(
+            "-C",
+            str(self.root),
+            "ls-files",
+            "-z",
+            "--cached",
+            "--others",
+            "--exclude-standard",
+            "--directory",
+        )
+        files, directories, untracked_directories = set(), set(), set()
+        for path in output.split("\0"):
+            if path.endswith("/"):
+                untracked_directories.add(path.rstrip("/"))
+            elif path:
+                files.add(path)
+                directories.update(parent.as_posix() for parent in PurePosixPath(path).parents)
+        return files, directories, untracked_directories
+
+    def remote_url(self) -> str:
+        if git_url := os.getenv("GRIFFE_GIT_REMOTE_URL"):
+            return git_url
+        remote = "remote." + os.getenv("GRIFFE_GIT_REMOTE", "origin") + ".url"
+        return _clean_git_remote_url(self.remote_urls.get(remote, ""))
+
+    def is_tracked(self, path: PurePosixPath) -> bool:
+        # Tracked paths are paths that are not ignored.
+        files, directories, untracked_directories = self._files
+        if path.as_posix() in files or path.as_posix() in directories:
+            return True
+        return any(parent.as_posix() in untracked_directories for parent in (path, *path.parents))
+
+
+class _GitRepositories:
+    """Git repositories of loaded packages, and their facts, cached to run as few Git commands as possible."""
+
+    def __init__(self) -> None:
+        self._roots: dict[Path, Path | None] = {}
+        self._repositories: dict[Path, _Repository] = {}
+        self._git_infos: dict[tuple, GitInfo] = {}
+
+    def _root(self, directory: Path) -> Path | None:
+        # Repositories are found by looking for `.git` entries (directories, or files for worktrees and submodules)
+        # in parent directories, instead of running `git rev-parse --show-toplevel` for each package.
+        if directory not in self._roots:
+            if os.getenv("GIT_DIR"):
+                try:
+                    self._roots[directory] = Path(_git("-C", str(directory), "rev-parse", "--show-toplevel"))
+                except GitError:
+                    self._roots[directory] = None
+            elif directory.joinpath(".git").exists():
+                self._roots[directory] = directory
+            elif directory.parent == directory:
+                self._roots[directory] = None
+            else:
+                self._roots[directory] = self._root(directory.parent)
+        return self._roots[directory]
+
+    def repository(self, path: Path) -> _Repository | None:
+        """Return the repository containing the given path, if any."""
+        path = path.absolute()
+        if (root := self._root(path if path.is_dir() else path.parent)) is None:
+            return None
+        if root not in self._repositories:
+            self._repositories[root] = _Repository(root)
+        return self._repositories[root]
 
-def _is_tracked(filepath: str | Path, repo: str | Path = ".") -> bool:
-    return not _git("-C", str(repo), "check-ignore", str(filepath), check=False)
+    def git_info(self, package: Module) -> GitInfo | None:
+        """Return Git information for a package, shared by packages of the same repository."""
+        try:
+            path = package.filepath[0] if isinstance(package.filepath, list) else package.filepath
+        except BuiltinModuleError:
+            return None
+        try:
+            if (repository := self.repository(path)) is None:
+                return None
+            if not repository.is_tracked(PurePosixPath(path.absolute().relative_to(repository.root).as_posix())):
+                return None
+            remote_url = repository.remote_url()
+            if not (service := _get_git_known_service(remote_url)):
+                return None
+            commit_hash = os.getenv("GRIFFE_GIT_COMMIT_HASH") or repository.commit_hash
+        except (GitError, ValueError, OSError):
+            # `ValueError` can happen if `path` is not relative to `repo`.
+            # `OSError` is caught just to be safe.
+            return None
+        key = (repository.root, service, remote_url, commit_hash)
+        if key not in self._git_infos:
+            self._git_infos[key] = GitInfo(
+                repository=repository.root,
+                service=service,
+                remote_url=remote_url,
+                commit_hash=commit_hash,
+            )
+        return self._git_infos[key]
 
 
 @dataclass
@@ -261,23 +427,7 @@ class GitInfo:
         Returns:
             The GitInfo instance, or None if unknown.
         """
-        try:
-            path = package.filepath[0] if isinstance(package.filepath, list) else package.filepath
-        except BuiltinModuleError:
-            return None
-        try:
-            repo = _get_repo_root(path)
-            if not _is_tracked(path.relative_to(repo), repo):
-                return None
-            remote_url = _get_git_remote_url(repo)
-            if not (service := _get_git_known_service(remote_url)):
-                return None
-            commit_hash = _get_git_commit_hash(repo)
-        except (GitError, ValueError, OSError):
-            # `ValueError` can happen if `path` is not relative to `repo`.
-            # `OSError` is caught just to be safe.
-            return None
-        return cls(repository=repo, service=service, remote_url=remote_url, commit_hash=commit_hash)
+        return _GitRepositories().git_info(package)
 
     def get_source_link(self, filepath: str | Path, lineno: int, endlineno: int) -> str | None:
         """Get the source link for the file at the given line numbers.
@@ -137,3 +137,9 @@ def dynamic_import(import_path: str, import_paths: Sequence[str | Path] | None =
                 raise ImportError("; ".join(errors))  # noqa: B904
 
     return value
+
+
+def _package_paths(module_name: str, import_paths: Sequence[str | Path] | None = None) -> list[str]:
+    # Paths of a dynamically imported package (its `__path__`), empty for modules that are not packages.
+    module = dynamic_import(module_name, import_paths)
+    return [str(path) for path in getattr(module, "__path__", None) or ()]
@@ -23,15 +23,19 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
-from datetime import datetime, timezone
 from functools import cached_property
 from importlib.util import find_spec
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, cast
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from griffe._internal.agents.inspector import inspect
-from griffe._internal.agents.visitor import visit
+from griffe._internal.agents.sandbox import _InspectionPool
+from griffe._internal.agents.visitor import Visitor
+from griffe._internal.cache import _ModulesCache
 from griffe._internal.collections import LinesCollection, ModulesCollection
 from griffe._internal.enumerations import Kind
 from griffe._internal.exceptions import (
@@ -43,15 +47,16 @@ from griffe._internal.exceptions import (
 from griffe._internal.expressions import ExprName
 from griffe._internal.extensions.base import Extensions, load_extensions
 from griffe._internal.finder import ModuleFinder, NamespacePackage, Package
-from griffe._internal.git import GitInfo, _tmp_worktree
-from griffe._internal.importer import dynamic_import
+from griffe._internal.git import _get_git_info, _GitRepositories, _tmp_sources
+from griffe._internal.importer import _package_paths
 from griffe._internal.logger import logger
 from griffe._internal.merger import merge_stubs
-from griffe._internal.models import Alias, Module, Object
-from griffe._internal.stats import Stats
+from griffe._internal.models import Alias, Module, Object, _iter_modules
+from griffe._internal.stats import Stats, _Profiler
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
 
     from griffe._internal.docstrings.parsers import DocstringOptions, DocstringStyle
     from griffe._internal.enumerations import Parser
@@ -78,6 +83,12 @@ class GriffeLoader:
         allow_inspection: bool = True,
         force_inspection: bool = False,
         store_source: bool = True,
+        workers: int | None = None,
+        cache_dir: str | Path | None = None,
+        inspection_workers: int | None = None,
+        inspection_timeout: float | None = None,
+        inspection_memory_limit: int | None = None,
+        profile: bool = False,
     ) -> None:
         """Initialize the loader.
 
@@ -90,6 +101,17 @@ class GriffeLoader:
             modules_collection: A collection of modules.
             allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
             store_source: Whether to store code source in the lines collection.
+            workers: The number of worker processes used to visit submodules in parallel.
+                By default, submodules are visited one after the other in the current process.
+            cache_dir: A directory in which to cache visited and inspected modules, to avoid visiting them again
+                when their sources did not change, and inspecting them again when their file, installed distribution
+                and Python version did not change. By default, modules are not cached.
+            inspection_workers: The number of sandboxed worker processes used to inspect modules.
+                By default, modules are inspected (imported) in the current process.
+            inspection_timeout: The maximum number of seconds spent inspecting each module in worker processes.
+            inspection_memory_limit: The maximum memory size, in bytes, of each inspection worker process.
+                Not supported on Windows.
+            profile: Whether to record the time spent in each loading phase of each module.
         """
         self.extensions: Extensions = extensions or load_extensions()
         """Loaded Griffe extensions."""
@@ -107,16 +129,71 @@ class GriffeLoader:
         """Whether to force inspecting (importing) modules, even when sources were found."""
         self.store_source: bool = store_source
         """Whether to store source code in the lines collection."""
+        self.workers: int | None = workers
+        """The number of worker processes used to visit submodules in parallel."""
+        self.cache_dir: Path | None = Path(cache_dir) if cache_dir else None
+        """The directory in which visited and inspected modules are cached."""
+        self.inspection_workers: int | None = inspection_workers
+        """The number of sandboxed worker processes used to inspect modules."""
+        self.inspection_timeout: float | None = inspection_timeout
+        """The maximum number of seconds spent inspecting each module in worker processes."""
+        self.inspection_memory_limit: int | None = inspection_memory_limit
+        """The maximum memory size, in bytes, of each inspection worker process."""
+        self._modules_cache: _ModulesCache | None = _ModulesCache(cache_dir) if cache_dir else None
         self._search_paths: Sequence[str | Path] | None = search_paths
-        self._time_stats: dict = {
-            "time_spent_visiting": 0,
-            "time_spent_inspecting": 0,
-        }
+        # Paths of modules expanding exports or wildcard imports from each module.
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        self._profiler: _Profiler = _Profiler(enabled=profile)
+        # Inspections submitted in advance, by module path.
+        self._inspections: dict[str, Future] = {}
+        # Visits submitted in advance, by file path.
+        self._visits: dict[Path, Future] = {}
+        # Source code and cache keys of modules found in the cache before submitting visits, by file path.
+        self._cached_sources: dict[Path, tuple[str, str]] = {}
+        # Git facts shared by all packages of a same repository.
+        self._git_repositories: _GitRepositories = _GitRepositories()
+        # Interned names and paths, shared by all visitors and inspectors of this loader.
+        self._names: dict[str, str] = {}
+
+    @property
+    def profile(self) -> bool:
+        """Whether to record the time spent in each loading phase of each module.
+
+        Only the time spent visiting and inspecting modules is recorded otherwise.
+
+        See also: [`stats`][griffe.GriffeLoader.stats].
+        """
+        return self._profiler.enabled
+
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self._profiler.enabled = value
 
     @cached_property
     def finder(self) -> ModuleFinder:
         """The module source finder."""
-        return ModuleFinder(search_paths=self._search_paths)
+        # Contents of scanned directories are persisted alongside cached modules.
+        index_path = self.cache_dir / "finder.index" if self.cache_dir else None
+        return ModuleFinder(search_paths=self._search_paths, index_path=index_path)
+
+    @cached_property
+    def _inspection_pool(self) -> _InspectionPool | None:
+        if not self.inspection_workers:
+            return None
+        # Hooks triggered during inspections receive runtime objects and the inspector itself,
+        # which only exist in the worker processes: we can't run them there.
+        if _hooks_onto_visits(self.extensions):
+            logger.debug("Some extensions hook onto dynamic analysis events, inspecting modules in the current process")
+            return None
+        return _InspectionPool(
+            self.inspection_workers,
+            timeout=self.inspection_timeout,
+            memory_limit=self.inspection_memory_limit,
+            import_paths=self.finder.search_paths,
+            docstring_parser=self.docstring_parser,
+            docstring_options=self.docstring_options,
+            store_source=self.store_source,
+        )
 
     def load(
         self,
@@ -154,6 +231,26 @@ class GriffeLoader:
         Returns:
             A Griffe object.
         """
+        try:
+            return self._load(
+                objspec,
+                submodules=submodules,
+                try_relative_path=try_relative_path,
+                find_stubs_package=find_stubs_package,
+            )
+        finally:
+            # Inspection workers are only kept alive while loading.
+            self.close()
+            self.finder.save_index()
+
+    def _load(
+        self,
+        objspec: str | Path | None,
+        *,
+        submodules: bool,
+        try_relative_path: bool,
+        find_stubs_package: bool,
+    ) -> Object | Alias:
         obj_path: str
         package = None
         top_module = None
@@ -178,13 +275,13 @@ class GriffeLoader:
             obj_path = str(objspec)
             top_module_name = obj_path.split(".", 1)[0]
             logger.debug("Trying to dynamically import %s", top_module_name)
-            top_module_object = dynamic_import(top_module_name, self.finder.search_paths)
+            if (pool := self._inspection_pool) is not None:
+                # Keep the current process's `sys.modules` untouched.
+                top_module_path = pool.package_paths(top_module_name)
+            else:
+                top_module_path = _package_paths(top_module_name, self.finder.search_paths)
 
-            try:
-                top_module_path = top_module_object.__path__
-                if not top_module_path:
-                    raise ValueError(f"Module {top_module_name} has no paths set")  # noqa: TRY301
-            except (AttributeError, ValueError):
+            if not top_module_path:
                 # If the top-level module has no `__path__`, we inspect it as-is,
                 # and do not try to recurse into submodules (there shouldn't be any in builtin/compiled modules).
                 logger.debug("Module %s has no paths set (built-in module?). Inspecting it as-is.", top_module_name)
@@ -194,11 +291,11 @@ class GriffeLoader:
 
             # We found paths, and use them to build our intermediate Package or NamespacePackage struct.
             logger.debug("Module %s has paths set: %s", top_module_name, top_module_path)
-            top_module_path = [Path(path) for path in top_module_path]
-            if len(top_module_path) > 1:
-                package = NamespacePackage(top_module_name, top_module_path)
+            package_paths = [Path(path) for path in top_module_path]
+            if len(package_paths) > 1:
+                package = NamespacePackage(top_module_name, package_paths)
             else:
-                package = Package(top_module_name, top_module_path[0])
+                package = Package(top_module_name, package_paths[0])
 
         # We have an intermediate package, and an object path: we're ready to load.
         logger.debug("Found %s: loading", objspec)
@@ -210,11 +307,264 @@ class GriffeLoader:
 
         return self._post_load(top_module, obj_path)
 
-    def _fire_load_events(self, obj: Object) -> None:
+    def load_many(
+        self,
+        objspecs: Iterable[str | Path],
+        /,
+        *,
+        submodules: bool = True,
+        try_relative_path: bool = True,
+        find_stubs_package: bool = False,
+        workers: int | None = None,
+    ) -> dict[str | Path, Object | Alias]:
+        """Load several objects as Griffe objects, given their Python or file paths.
+
+        Packages of all objects are searched first, then their modules are visited
+        by a single pool of worker processes. Exports and wildcard imports
+        are only expanded once all packages are loaded, so that they can be expanded
+        across loaded packages, whatever the order in which they were given.
+
+        Objects that cannot be found or loaded are logged as errors and skipped.
+
+        Examples:
+            >>> loader.load_many(["griffe.Module", "griffe.Class"], workers=4)
+            {'griffe.Module': Alias('Module', 'griffe._internal.models.Module'), 'griffe.Class': Alias('Class', 'griffe._internal.models.Class')}
+
+        Parameters:
+            objspecs: The Python paths of objects, or file paths to modules.
+            submodules: Whether to recurse on the submodules.
+            try_relative_path: Whether to try finding the modules as relative paths.
+            find_stubs_package: Whether to search for stubs-only packages.
+            workers: The number of worker processes used to visit modules.
+                Defaults to the [`workers`][griffe.GriffeLoader.workers] of the loader.
+
+        Returns:
+            The loaded Griffe objects, by object specification.
+        """
+        workers = self.workers if workers is None else workers
+        found: list[tuple[str | Path, str, Package | NamespacePackage]] = []
+        not_found: list[str | Path] = []
+        for objspec in objspecs:
+            logger.debug("Searching path(s) for %s", objspec)
+            try:
+                obj_path, package = self.finder.find_spec(
+                    objspec,  # ty:ignore[invalid-argument-type]
+                    try_relative_path=try_relative_path,
+                    find_stubs_package=find_stubs_package,
+                )
+            except ModuleNotFoundError:
+                # Loaded afterwards with `load`, which tries dynamic imports.
+                not_found.append(objspec)
+            else:
+                found.append((objspec, obj_path, package))
+
+        # Objects of the same package share the same loaded package.
+        packages: dict[str, Package | NamespacePackage] = {}
+        for _, _, package in found:
+            packages.setdefault(package.name, package)
+        loaded: dict[str, Module] = {}
+        executor = None
+        if packages and self._can_visit_in_parallel(workers):
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            if executor is not None:
+                for package in packages.values():
+                    self._submit_package_visits(executor, package, submodules=submodules)
+            for name, package in packages.items():
+                logger.debug("Found %s: loading", name)
+                try:
+                    loaded[name] = self._load_package(package, submodules=submodules)
+                except LoadingError:
+                    logger.exception("Could not load package %s", package)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self._visits.clear()
+            self._cached_sources.clear()
+            # Objects that were not found are loaded with `load`, which spawns inspection workers again if needed.
+            self.close()
+            self.finder.save_index()
+
+        objects: dict[str | Path, Object | Alias] = {}
+        post_loaded: set[str] = set()
+        for objspec, obj_path, package in found:
+            if (module := loaded.get(package.name)) is None:
+                continue
+            if package.name in post_loaded:
+                objects[objspec] = self.modules_collection.get_member(obj_path)
+            else:
+                objects[objspec] = self._post_load(module, obj_path)
+                post_loaded.add(package.name)
+
+        for objspec in not_found:
+            try:
+                objects[objspec] = self.load(
+                    objspec,
+                    submodules=submodules,
+                    try_relative_path=try_relative_path,
+                    find_stubs_package=find_stubs_package,
+                )
+            except ModuleNotFoundError as error:
+                logger.error("Could not find package %s: %s", objspec, error)
+            except ImportError:
+                logger.exception("Tried but could not import package %s", objspec)
+            except LoadingError:
+                # Already logged by `load`.
+                pass
+        return objects
+
+    def close(self) -> None:
+        """Stop the worker processes inspecting modules, if any.
+
+        Workers are stopped at the end of each call to [`load`][griffe.GriffeLoader.load]
+        or [`load_many`][griffe.GriffeLoader.load_many], and spawned again when needed.
+        """
+        if (pool := self.__dict__.pop("_inspection_pool", None)) is not None:
+            pool.close()
+
+    def reload(self, paths: Iterable[str | Path]) -> list[Module]:
+        """Reload modules from source files that changed, were added or were deleted.
+
+        Only the modules corresponding to the given files are visited again,
+        as well as the modules expanding exports (`__all__` values) or wildcard imports from them.
+        New versions of modules replace the previous ones in the modules collection, keeping their submodules.
+        Aliases pointing to objects of previous versions are reset so that they are resolved again
+        (lazily) to objects of new versions, then exports and wildcard imports of reloaded modules
+        are expanded again, and load events are fired for the reloaded objects.
+
+        Files that are not part of loaded packages are ignored.
+        When a module cannot be loaded again (for example because of a syntax error),
+        its previous version is kept.
+
+        Parameters:
+            paths: The paths of source files that changed, were added or were deleted.
+
+        Returns:
+            The reloaded modules.
+        """
+        # Files may have been committed, ignored or added since packages were loaded.
+        self._git_repositories = _GitRepositories()
+        loaded = {
+            filepath.absolute(): module
+            for top_module in self.modules_collection.members.values()
+            for module in _iter_modules(top_module)
+            if isinstance(filepath := module.filepath, Path)
+        }
+
+        # Find modules to reload, as well as new modules and the modules depending on reloaded ones.
+        to_reload: dict[str, Module] = {}
+        to_load: dict[Path, tuple[str, str]] = {}
+        for path in map(Path, paths):
+            if path.suffix not in {".py", ".pyi"}:
+                continue
+            path = path.absolute()  # noqa: PLW2901
+            module = loaded.get(path) or loaded.get(path.with_suffix(".pyi" if path.suffix == ".py" else ".py"))
+            if module is not None:
+                to_reload[module.path] = module
+            elif path.exists():
+                if path.stem == "__init__":
+                    name, package_dir = path.parent.name, path.parent.parent
+                else:
+                    name, package_dir = path.stem, path.parent
+                package = loaded.get(package_dir / "__init__.py") or loaded.get(package_dir / "__init__.pyi")
+                if package is not None and "." not in name:
+                    to_load[path] = (package.path, name)
+        queue = list(to_reload)
+        for module_path in queue:
+            for dependent_path in self._dependents.get(module_path, ()):
+                if dependent_path in to_reload:
+                    continue
+                try:
+                    dependent = self.modules_collection.get_member(dependent_path)
+                except KeyError:
+                    continue
+                if isinstance(dependent, Module):
+                    to_reload[dependent_path] = dependent
+                    queue.append(dependent_path)
+
+        # Reload parent modules before their submodules, so that submodules are attached to new parents.
+        reloaded: list[tuple[Module, bool]] = [
+            (module, False)
+            for old_module in sorted(to_reload.values(), key=lambda module: module.path.count("."))
+            if (module := self._reload_module(old_module)) is not None
+        ]
+        for path, (package_path, name) in to_load.items():
+            try:
+                package = self.modules_collection.get_member(package_path)
+                module = self._load_module(name, path, submodules=path.stem == "__init__", parent=package)
+            except (KeyError, LoadingError) as error:
+                logger.warning("Could not load %s: %s", path, error)
+                continue
+            package.set_member(name, module)
+            reloaded.append((package.members[name], True))
+
+        # Expand exports and wildcards again, only recursing into reloaded modules.
+        reloaded_paths = {module.path for module, _ in reloaded}
+        unchanged = {module.path for module in loaded.values()} - reloaded_paths
+        exports_seen, wildcards_seen = set(unchanged), set(unchanged)
+        for module, _ in reloaded:
+            if module.path not in exports_seen:
+                with self._profiler.measure(module.path, "exports"):
+                    self.expand_exports(module, exports_seen)
+            if module.path not in wildcards_seen:
+                with self._profiler.measure(module.path, "wildcards"):
+                    self.expand_wildcards(module, external=False, seen=wildcards_seen)
+
+        for module, submodules in reloaded:
+            with self._profiler.measure(module.path, "extensions"):
+                if module.parent is None:
+                    self.extensions.call("on_package", pkg=module, loader=self)
+                self.extensions.call("on_module", mod=module, loader=self)
+            if _hooks_onto_loads(self.extensions):
+                self._fire_load_events(module, submodules=submodules)
+        return [module for module, _ in reloaded]
+
+    def _reload_module(self, old_module: Module) -> Module | None:
+        parent = old_module.parent
+        container = self.modules_collection if parent is None else parent
+        filepath = cast("Path", old_module.filepath)
+        filepaths = [path for path in (filepath.with_suffix(".py"), filepath.with_suffix(".pyi")) if path.exists()]
+        if not filepaths:
+            logger.debug("Module %s was deleted", old_module.path)
+            _forget_objects(old_module)
+            container.del_member(old_module.name)
+            return None
+        try:
+            # Regular modules and their stubs are all loaded before touching the container,
+            # so that a broken file leaves the previous version of the module in place.
+            modules = [
+                self._load_module(old_module.name, path, submodules=False, parent=parent, collect=False)
+                for path in filepaths
+            ]
+        except LoadingError as error:
+            logger.warning("Could not reload %s, keeping its previous version: %s", old_module.path, error)
+            return None
+        module = modules[0] if len(modules) == 1 else merge_stubs(*modules)
+        _forget_objects(old_module)
+        # Deleting the previous version first prevents merging it with the new one.
+        container.del_member(old_module.name)
+        container.set_member(old_module.name, module)
+        if parent is None:
+            with self._profiler.measure(module.path, "git"):
+                module.git_info = self._git_repositories.git_info(module)
+        # Keep submodules, which are only reloaded when their own files change.
+        for name, member in old_module.members.items():
+            if not member.is_alias and member.is_module:
+                module.set_member(name, member)
+        return module
+
+    def _fire_load_events(self, obj: Object, *, submodules: bool = True) -> None:
+        module_path = obj.module.path
+        profile = self._profiler.enabled
         # Wrapping in tuple() to avoid "dictionary changed size during iteration" errors.
         for member in tuple(obj.members.values()):
+            start = perf_counter_ns() if profile else 0
             if member.is_alias:
                 self.extensions.call("on_alias", alias=member, loader=self)
+                if profile:
+                    self._profiler.add(module_path, "extensions", perf_counter_ns() - start)
+                continue
+            if not submodules and member.is_module:
                 continue
             self.extensions.call("on_object", obj=member, loader=self)
             if member.is_module:
@@ -227,6 +577,8 @@ class GriffeLoader:
                 self.extensions.call("on_attribute", attr=member, loader=self)
             elif member.is_type_alias:
                 self.extensions.call("on_type_alias", type_alias=member, loader=self)
+            if profile:
+                self._profiler.add(member.module.path, "extensions", perf_counter_ns() - start)
             self._fire_load_events(member)  # ty:ignore[invalid-argument-type]
 
     def _post_load(self, module: Module, obj_path: str) -> Object | Alias:
@@ -238,16 +590,22 @@ class GriffeLoader:
         # Packages that wildcard imports from external, non-loaded packages
         # will still have incomplete data, requiring subsequent calls to
         # `load()` and/or `resolve_aliases()`.
-        self.expand_exports(module)
-        self.expand_wildcards(module, external=False)
+        with self._profiler.measure(module.path, "exports"):
+            self.expand_exports(module)
+        with self._profiler.measure(module.path, "wildcards"):
+            self.expand_wildcards(module, external=False)
         # Populate Git information if possible.
-        module.git_info = GitInfo.from_package(module)
+        with self._profiler.measure(module.path, "git"):
+            module.git_info = self._git_repositories.git_info(module)
         # Package is loaded, we now retrieve the initially requested object,
         # fire load events, and return it.
         obj = self.modules_collection.get_member(obj_path)
-        self.extensions.call("on_package", pkg=module, loader=self)
-        self.extensions.call("on_module", mod=module, loader=self)
-        self._fire_load_events(module)
+        with self._profiler.measure(module.path, "extensions"):
+            self.extensions.call("on_package", pkg=module, loader=self)
+            self.extensions.call("on_module", mod=module, loader=self)
+        # Skip walking the whole tree when no extension hooks onto load events.
+        if _hooks_onto_loads(self.extensions):
+            self._fire_load_events(module)
         return obj
 
     def resolve_aliases(
@@ -262,16 +620,14 @@ class GriffeLoader:
         Parameters:
             implicit: When false, only try to resolve an alias if it is explicitly exported.
             external: When false, don't try to load unspecified modules to resolve aliases.
-            max_iterations: Maximum number of iterations on the loader modules collection.
+            max_iterations: Maximum number of resolution iterations.
+                Each iteration only retries aliases whose targets could have appeared since the previous one.
 
         Returns:
             The unresolved aliases and the number of iterations done.
         """
         if max_iterations is None:
             max_iterations = float("inf")  # ty:ignore[invalid-assignment]
-        prev_unresolved: set[str] = set()
-        unresolved: set[str] = set("0")  # Init to enter loop.
-        iteration = 0
         collection = self.modules_collection.members
 
         # Before resolving aliases, we try to expand wildcard imports again
@@ -280,32 +636,115 @@ class GriffeLoader:
         # and with potentially more packages loaded in the collection,
         # allowing to resolve more aliases.
         for wildcards_module in list(collection.values()):
-            self.expand_wildcards(wildcards_module, external=external)
-
+            with self._profiler.measure(wildcards_module.path, "wildcards"):
+                self.expand_wildcards(wildcards_module, external=external)
+
+        # Aliases are resolved with a worklist. The first round handles every alias
+        # found in the modules collection. Aliases that can't be resolved are indexed
+        # by the target path they're waiting on, and are only retried in the next round
+        # if the package of this target was loaded in the meantime
+        # (along with the aliases of this newly loaded package).
         load_failures: set[str] = set()
-        while unresolved and unresolved != prev_unresolved and iteration < max_iterations:  # ty:ignore[unsupported-operator]
-            prev_unresolved = unresolved - {"0"}
-            unresolved = set()
-            resolved: set[str] = set()
+        waiting: dict[str, list[Alias]] = defaultdict(list)
+        worklist = [alias for module in collection.values() for alias in self._iter_aliases(module, implicit=implicit)]
+        unresolved: set[str] = set()
+        iteration = 0
+        loaded = False
+        profile = self._profiler.enabled
+        while worklist and iteration < max_iterations:  # ty:ignore[unsupported-operator]
             iteration += 1
-            for module_name in list(collection.keys()):
-                module = collection[module_name]
-                next_resolved, next_unresolved = self.resolve_module_aliases(
-                    module,
-                    implicit=implicit,
+            packages = set(collection)
+            resolved = 0
+            for alias in worklist:
+                start = perf_counter_ns() if profile else 0
+                resolved += self._resolve_alias(
+                    alias,
+                    waiting,
+                    unresolved,
                     external=external,
                     load_failures=load_failures,
                 )
-                resolved |= next_resolved
-                unresolved |= next_unresolved
+                if profile:
+                    self._profiler.add(alias.parent.module.path, "aliases", perf_counter_ns() - start)  # ty:ignore[possibly-missing-attribute]
             logger.debug(
                 "Iteration %s finished, %s aliases resolved, still %s to go",
                 iteration,
-                len(resolved),
+                resolved,
                 len(unresolved),
             )
+            worklist = []
+            if new_packages := set(collection) - packages:
+                loaded = True
+                for target_path in [path for path in waiting if path.split(".", 1)[0] in new_packages]:
+                    worklist.extend(waiting.pop(target_path))
+                for package in new_packages:
+                    worklist.extend(self._iter_aliases(collection[package], implicit=implicit))
+            if not worklist and loaded:
+                # Loading packages can also make targets available in previously loaded packages
+                # (for example when expanding wildcard imports), so we retry every waiting alias once.
+                loaded = False
+                worklist = [alias for aliases in waiting.values() for alias in aliases]
+                waiting.clear()
         return unresolved, iteration
 
+    def _iter_aliases(self, obj: Object | Alias, *, implicit: bool, seen: set[str] | None = None) -> Iterator[Alias]:
+        seen = seen or set()
+        seen.add(obj.path)
+        for member in obj.members.values():
+            if member.is_alias:
+                if member.wildcard or member.resolved:  # ty:ignore[unresolved-attribute]
+                    continue
+                if not implicit and not member.is_exported:
+                    continue
+                yield member  # ty:ignore[invalid-yield]
+            elif member.kind in {Kind.MODULE, Kind.CLASS} and member.path not in seen:
+                yield from self._iter_aliases(member, implicit=implicit, seen=seen)
+
+    def _resolve_alias(
+        self,
+        alias: Alias,
+        waiting: dict[str, list[Alias]],
+        unresolved: set[str],
+        *,
+        external: bool | None,
+        load_failures: set[str],
+    ) -> bool:
+        # Aliases can be resolved while resolving other aliases (chains).
+        if alias.resolved:
+            unresolved.discard(alias.path)
+            return False
+        try:
+            alias.resolve_target()
+        except AliasResolutionError as error:
+            # Check if the failure is because the target comes from an external package,
+            # and decide if we should load that package to allow the alias to be resolved
+            # at the next iteration (maybe).
+            target = error.alias.target_path
+            waiting[target].append(alias)
+            unresolved.add(alias.path)
+            package = target.split(".", 1)[0]
+            obj = alias.parent
+            load_module = (
+                (external is True or (external is None and package == f"_{obj.package.name}"))  # ty:ignore[possibly-missing-attribute]
+                and package not in load_failures
+                and obj.package.path != package  # ty:ignore[possibly-missing-attribute]
+                and package not in self.modules_collection
+            )
+            if load_module:
+                logger.debug("Failed to resolve alias %s -> %s", alias.path, target)
+                try:
+                    self.load(package, try_relative_path=False)
+                except (ImportError, LoadingError) as error:
+                    logger.debug("Could not follow alias %s: %s", alias.path, error)
+                    load_failures.add(package)
+        except CyclicAliasError as error:
+            logger.debug(str(error))
+        else:
+            logger.debug("Alias %s was resolved to %s", alias.path, alias.final_target.path)
+            unresolved.discard(alias.path)
+            return True
+        return False
+
     def expand_exports(self, module: Module, seen: set | None = None) -> None:
         """Expand exports: try to recursively expand all module exports (`__all__` values).
 
@@ -331,6 +770,7 @@ class GriffeLoader:
                 except KeyError:
                     logger.debug("Cannot expand '%s', try pre-loading corresponding package", export.canonical_path)
                     continue
+                self._dependents[next_module.path].add(module.path)
                 if next_module.path not in seen:
                     self.expand_exports(next_module, seen)
                 try:
@@ -397,6 +837,7 @@ class GriffeLoader:
                         cast("Alias", member).target_path,
                     )
                     continue
+                self._dependents[target.path].add(obj.path)
 
                 # Recurse into this module, expanding wildcards there before collecting everything.
                 if target.path not in seen:
@@ -544,13 +985,13 @@ class GriffeLoader:
     def stats(self) -> Stats:
         """Compute some statistics.
 
+        The time spent in each loading phase of each module is only recorded
+        when [`profile`][griffe.GriffeLoader.profile] is enabled.
+
         Returns:
             Some statistics.
         """
-        stats = Stats(self)
-        stats.time_spent_visiting = self._time_stats["time_spent_visiting"]
-        stats.time_spent_inspecting = self._time_stats["time_spent_inspecting"]
-        return stats
+        return Stats(self)
 
     def _load_package(self, package: Package | NamespacePackage, *, submodules: bool = True) -> Module:
         top_module = self._load_module(package.name, package.path, submodules=submodules)
@@ -574,9 +1015,16 @@ class GriffeLoader:
         *,
         submodules: bool = True,
         parent: Module | None = None,
+        collect: bool = True,
     ) -> Module:
         try:
-            return self._load_module_path(module_name, module_path, submodules=submodules, parent=parent)
+            return self._load_module_path(
+                module_name,
+                module_path,
+                submodules=submodules,
+                parent=parent,
+                collect=collect,
+            )
         except SyntaxError as error:
             raise LoadingError(f"Syntax error: {error}") from error
         except ImportError as error:
@@ -593,27 +1041,114 @@ class GriffeLoader:
         *,
         submodules: bool = True,
         parent: Module | None = None,
+        collect: bool = True,
     ) -> Module:
         logger.debug("Loading path %s", module_path)
         if isinstance(module_path, list):
             module = self._create_module(module_name, module_path)
         elif self.force_inspection:
             module = self._inspect_module(module_name, module_path, parent)
+        elif (visited := self._visits.pop(module_path, None)) is not None:
+            module = self._attach_visited_module(visited, module_path, parent)
         elif module_path.suffix in {".py", ".pyi"}:
             module = self._visit_module(module_name, module_path, parent)
         elif self.allow_inspection:
             module = self._inspect_module(module_name, module_path, parent)
         else:
             raise LoadingError("Cannot load compiled module without inspection")
-        if parent is None:
+        if parent is None and collect:
             self.modules_collection.set_member(module.path, module)
         if submodules:
             self._load_submodules(module)
         return module
 
     def _load_submodules(self, module: Module) -> None:
-        for subparts, subpath in self.finder.submodules(module):
-            self._load_submodule(module, subparts, subpath)
+        submodules = self.finder.submodules(module)
+        self._submit_inspections(module, submodules)
+        try:
+            # Modules of packages loaded with `load_many` are already being visited.
+            if not self._visits and len(submodules) > 1 and self._can_visit_in_parallel(self.workers):
+                self._load_submodules_in_parallel(module, submodules)
+                return
+            for subparts, subpath in submodules:
+                self._load_submodule(module, subparts, subpath)
+        finally:
+            self._inspections.clear()
+
+    def _submit_inspections(self, module: Module, submodules: list[tuple[tuple[str, ...], Path]]) -> None:
+        # Submodules that must be inspected are submitted all at once, so that workers inspect them in parallel.
+        # The loader then retrieves results in the same order as when loading sequentially.
+        pool = self._inspection_pool
+        if pool is None or pool.workers < 2:  # noqa: PLR2004
+            return
+        for subparts, subpath in submodules:
+            if any("." in subpart for subpart in subparts) or self._is_ignored(subparts[-1]):
+                continue
+            if self.force_inspection or (self.allow_inspection and subpath.suffix not in {".py", ".pyi"}):
+                parent_path = ".".join((module.path, *subparts[:-1]))
+                path = f"{parent_path}.{subparts[-1]}"
+                if (cache := self._visits_cache) is None or self._inspection_cache_key(path, subpath) not in cache:
+                    self._inspections[path] = pool.submit(subparts[-1], subpath, parent_path)
+
+    def _can_visit_in_parallel(self, workers: int | None) -> bool:
+        if not workers or workers < 2 or self.force_inspection:  # noqa: PLR2004
+            return False
+        # Hooks triggered during visits receive AST nodes and the visitor itself,
+        # which only exist in the worker processes: we can't run them there.
+        if _hooks_onto_visits(self.extensions):
+            logger.debug("Some extensions hook onto static analysis events, visiting modules sequentially")
+            return False
+        return True
+
+    def _load_submodules_in_parallel(self, module: Module, submodules: list[tuple[tuple[str, ...], Path]]) -> None:
+        # Workers only read and visit source files. Resulting modules are then
+        # attached in the same order as when loading sequentially (finder order),
+        # so that members, stubs merging and load events stay deterministic.
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            self._submit_visits(executor, module.path, submodules)
+            try:
+                for subparts, subpath in submodules:
+                    self._load_submodule(module, subparts, subpath)
+            finally:
+                self._visits.clear()
+                self._cached_sources.clear()
+
+    def _submit_package_visits(
+        self,
+        executor: ProcessPoolExecutor,
+        package: Package | NamespacePackage,
+        *,
+        submodules: bool,
+    ) -> None:
+        # Submit visits of all the modules that `_load_package` will load.
+        paths: list[tuple[Path | list[Path], bool]] = [(package.path, submodules)]
+        if isinstance(package, Package) and package.stubs:
+            paths.append((package.stubs, submodules and package.stubs.parent != package.path.parent))
+        for path, recurse in paths:
+            modules = [] if isinstance(path, list) else [((), path)]
+            if recurse:
+                modules.extend(self.finder.submodules(Module(package.name, filepath=path)))
+            self._submit_visits(executor, package.name, modules)
+
+    def _submit_visits(
+        self,
+        executor: ProcessPoolExecutor,
+        module_path: str,
+        submodules: list[tuple[tuple[str, ...], Path]],
+    ) -> None:
+        for subparts, subpath in submodules:
+            if (
+                subpath.suffix in {".py", ".pyi"}
+                and not any("." in subpart for subpart in subparts)
+                and not self._is_cached(".".join((module_path, *subparts)), subpath)
+            ):
+                self._visits[subpath] = executor.submit(
+                    _visit_in_worker,
+                    (*module_path.split("."), *subparts),
+                    subpath,
+                    self.docstring_parser,
+                    self.docstring_options,
+                )
 
     def _load_submodule(self, module: Module, subparts: tuple[str, ...], subpath: Path) -> None:
         for subpart in subparts:
@@ -674,51 +1209,156 @@ class GriffeLoader:
             modules_collection=self.modules_collection,
         )
 
+    def _cache_key(self, module_path: str, filepath: Path, code: str) -> str:
+        return self._modules_cache.key(  # ty:ignore[possibly-missing-attribute]
+            module_path,
+            filepath,
+            code,
+            docstring_parser=self.docstring_parser,
+            docstring_options=self.docstring_options,
+            extensions=self.extensions,
+        )
+
+    def _inspection_cache_key(self, module_path: str, filepath: Path | None) -> str:
+        return self._modules_cache.inspection_key(  # ty:ignore[possibly-missing-attribute]
+            module_path,
+            filepath,
+            import_paths=self.finder.search_paths,
+            docstring_parser=self.docstring_parser,
+            docstring_options=self.docstring_options,
+            extensions=self.extensions,
+        )
+
+    @property
+    def _visits_cache(self) -> _ModulesCache | None:
+        # Cached modules are not visited again, so extensions hooking onto visits
+        # (or inspections) would miss them: we don't use the cache in that case.
+        if self._modules_cache is None or _hooks_onto_visits(self.extensions):
+            return None
+        return self._modules_cache
+
+    def _is_cached(self, module_path: str, filepath: Path) -> bool:
+        if (modules_cache := self._visits_cache) is None:
+            return False
+        try:
+            code = filepath.read_text(encoding="utf-8-sig")
+        except (OSError, UnicodeDecodeError):
+            return False
+        cache_key = self._cache_key(module_path, filepath, code)
+        if cache_key not in modules_cache:
+            return False
+        # Don't read and hash the file again when loading the module.
+        self._cached_sources[filepath] = (code, cache_key)
+        return True
+
     def _visit_module(self, module_name: str, module_path: Path, parent: Module | None = None) -> Module:
-        code = module_path.read_text(encoding="utf-8-sig")
+        path = f"{parent.path}.{module_name}" if parent else module_name
+        cache_key = None
+        if (cached_source := self._cached_sources.pop(module_path, None)) is not None:
+            code, cache_key = cached_source
+        else:
+            with self._profiler.measure(path, "reading"):
+                code = module_path.read_text(encoding="utf-8-sig")
         if self.store_source:
             self.lines_collection[module_path] = code.splitlines(keepends=False)
-        start = datetime.now(tz=timezone.utc)
-        module = visit(
+        if (modules_cache := self._visits_cache) is not None:
+            if cache_key is None:
+                cache_key = self._cache_key(path, module_path, code)
+            if (module := modules_cache.get(cache_key)) is not None:
+                logger.debug("Using cached module %s", module_path)
+                self._attach_module(module, parent)
+                return module
+        module, timings = _visit(
             module_name,
-            filepath=module_path,
-            code=code,
-            extensions=self.extensions,
-            parent=parent,
+            module_path,
+            code,
+            self.extensions,
+            parent,
             docstring_parser=self.docstring_parser,
             docstring_options=self.docstring_options,
             lines_collection=self.lines_collection,
             modules_collection=self.modules_collection,
+            names=self._names,
         )
-        elapsed = datetime.now(tz=timezone.utc) - start
-        self._time_stats["time_spent_visiting"] += elapsed.microseconds
+        for phase, duration in timings.items():
+            self._profiler.add(path, phase, duration)
+        if modules_cache is not None and cache_key is not None:
+            modules_cache.set(cache_key, module)
         return module
 
+    def _attach_module(self, module: Module, parent: Module | None) -> None:
+        # Replace the parents and collections of modules created in other processes.
+        module.parent = parent
+        module._lines_collection = self.lines_collection
+        module._modules_collection = self.modules_collection
+
+    def _attach_visited_module(self, visited: Future, module_path: Path, parent: Module | None) -> Module:
+        try:
+            module, code, timings = visited.result()
+        except SyntaxError as error:
+            raise LoadingError(f"Syntax error: {error}") from error
+        except UnicodeDecodeError as error:
+            raise LoadingError(f"UnicodeDecodeError when loading {module_path}: {error}") from error
+        except OSError as error:
+            raise LoadingError(f"OSError when loading {module_path}: {error}") from error
+        if self.store_source:
+            self.lines_collection[module_path] = code.splitlines(keepends=False)
+        self._attach_module(module, parent)
+        for phase, duration in timings.items():
+            self._profiler.add(module.path, phase, duration)
+        if (modules_cache := self._visits_cache) is not None:
+            modules_cache.set(self._cache_key(module.path, module_path, code), module)
+        return module
+
+    def _is_ignored(self, module_name: str) -> bool:
+        return any(module_name.startswith(prefix) for prefix in self.ignored_modules)
+
     def _inspect_module(self, module_name: str, filepath: Path | None = None, parent: Module | None = None) -> Module:
-        for prefix in self.ignored_modules:
-            if module_name.startswith(prefix):
-                raise ImportError(f"Ignored module '{module_name}'")
+        if self._is_ignored(module_name):
+            raise ImportError(f"Ignored module '{module_name}'")
+        path = f"{parent.path}.{module_name}" if parent else module_name
         if self.store_source and filepath and filepath.suffix in {".py", ".pyi"}:
-            self.lines_collection[filepath] = filepath.read_text(encoding="utf-8-sig").splitlines(keepends=False)
-        start = datetime.now(tz=timezone.utc)
-        try:
-            module = inspect(
+            with self._profiler.measure(path, "reading"):
+                code = filepath.read_text(encoding="utf-8-sig")
+            self.lines_collection[filepath] = code.splitlines(keepends=False)
+        cache_key = None
+        if (modules_cache := self._visits_cache) is not None:
+            cache_key = self._inspection_cache_key(path, filepath)
+            if (module := modules_cache.get(cache_key)) is not None:
+                logger.debug("Using cached inspection of module %s", path)
+                self._attach_module(module, parent)
+                return module
+        if (pool := self._inspection_pool) is not None:
+            inspection = self._inspections.pop(path, None) or pool.submit(
                 module_name,
-                filepath=filepath,
-                import_paths=self.finder.search_paths,
-                extensions=self.extensions,
-                parent=parent,
-                docstring_parser=self.docstring_parser,
-                docstring_options=self.docstring_options,
-                lines_collection=self.lines_collection,
-                modules_collection=self.modules_collection,
+                filepath,
+                parent.path if parent else None,
             )
-        except SystemExit as error:
-            raise ImportError(f"Importing '{module_name}' raised a system exit") from error
-        except Exception as error:
-            raise ImportError(f"Importing '{module_name}' raised an exception") from error
-        elapsed = datetime.now(tz=timezone.utc) - start
-        self._time_stats["time_spent_inspecting"] += elapsed.microseconds
+            module, duration = pool.result(inspection)
+            self._attach_module(module, parent)
+        else:
+            start = perf_counter_ns()
+            try:
+                module = inspect(
+                    module_name,
+                    filepath=filepath,
+                    import_paths=self.finder.search_paths,
+                    extensions=self.extensions,
+                    parent=parent,
+                    docstring_parser=self.docstring_parser,
+                    docstring_options=self.docstring_options,
+                    lines_collection=self.lines_collection,
+                    modules_collection=self.modules_collection,
+                    names=self._names,
+                )
+            except SystemExit as error:
+                raise ImportError(f"Importing '{module_name}' raised a system exit") from error
+            except Exception as error:
+                raise ImportError(f"Importing '{module_name}' raised an exception") from error
+            duration = perf_counter_ns() - start
+        self._profiler.add(path, "inspecting", duration)
+        if modules_cache is not None and cache_key is not None:
+            modules_cache.set(cache_key, module)
         return module
 
     def _get_or_create_parent_module(
@@ -760,6 +1400,100 @@ class GriffeLoader:
         ]
 
 
+def _iter_own_objects(obj: Object) -> Iterator[Object | Alias]:
+    # Objects and aliases declared in a module, without the ones declared in its submodules.
+    for member in obj.members.values():
+        if member.is_alias:
+            yield member
+        elif not member.is_module:
+            yield member
+            yield from _iter_own_objects(member)  # ty:ignore[invalid-argument-type]
+
+
+def _forget_objects(module: Module) -> None:
+    # Reset aliases pointing to objects of a module that is replaced or deleted,
+    # as well as the back-references of its own aliases,
+    # so that aliases are resolved again (lazily) to objects of the new module.
+    objects = [module, *_iter_own_objects(module)]
+    stale = {id(obj) for obj in objects}
+    for obj in objects:
+        if obj.is_alias:
+            if obj._target is None:  # ty:ignore[unresolved-attribute]
+                continue
+            try:
+                aliases = obj.final_target.aliases  # ty:ignore[unresolved-attribute]
+            except (AliasResolutionError, CyclicAliasError):
+                continue
+            for alias_path, alias in tuple(aliases.items()):
+                if alias is obj or id(alias._target) in stale:
+                    alias._target = None
+                    del aliases[alias_path]
+        else:
+            for alias in obj.aliases.values():
+                alias._target = None
+
+
+_visit_events = {
+    f"on_{kind}{event}"
+    for kind in ("", "module_", "class_", "function_", "attribute_", "type_alias_")
+    for event in ("node", "instance", "members")
+} | {"on_alias_instance"}
+
+
+_load_events = ("on_alias", "on_object", "on_module", "on_class", "on_function", "on_attribute", "on_type_alias")
+
+
+def _hooks_onto_visits(extensions: Extensions) -> bool:
+    return any(extensions.listens_to(event) for event in _visit_events)
+
+
+def _hooks_onto_loads(extensions: Extensions) -> bool:
+    return any(extensions.listens_to(event) for event in _load_events)
+
+
+def _visit(
+    module_name: str,
+    filepath: Path,
+    code: str,
+    extensions: Extensions,
+    parent: Module | None,
+    **kwargs: Any,
+) -> tuple[Module, dict[str, int]]:
+    # Same as `visit`, but measuring compilation and visit separately.
+    visitor = Visitor(module_name, filepath, code, extensions, parent, **kwargs)
+    start = perf_counter_ns()
+    top_node = visitor._compile()
+    compiled = perf_counter_ns()
+    visitor.visit(top_node)
+    return visitor.current.module, {"compiling": compiled - start, "visiting": perf_counter_ns() - compiled}
+
+
+def _visit_in_worker(
+    module_parts: tuple[str, ...],
+    filepath: Path,
+    docstring_parser: DocstringStyle | Parser | None,
+    docstring_options: DocstringOptions,
+) -> tuple[Module, str, dict[str, int]]:
+    # Parents are only used to compute paths (relative imports, etc.),
+    # so we build bare placeholders that the loader replaces with the real ones.
+    parent = None
+    for part in module_parts[:-1]:
+        parent = Module(part, parent=parent)
+    start = perf_counter_ns()
+    code = filepath.read_text(encoding="utf-8-sig")
+    read = perf_counter_ns() - start
+    module, timings = _visit(
+        module_parts[-1],
+        filepath,
+        code,
+        Extensions(),
+        parent,
+        docstring_parser=docstring_parser,
+        docstring_options=docstring_options,
+    )
+    return module, code, {"reading": read, **timings}
+
+
 def load(
     objspec: str | Path | None = None,
     /,
@@ -775,6 +1509,11 @@ def load(
     allow_inspection: bool = True,
     force_inspection: bool = False,
     store_source: bool = True,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
+    inspection_workers: int | None = None,
+    inspection_timeout: float | None = None,
+    inspection_memory_limit: int | None = None,
     find_stubs_package: bool = False,
     resolve_aliases: bool = False,
     resolve_external: bool | None = None,
@@ -831,6 +1570,11 @@ def load(
         allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
         force_inspection: Whether to force using dynamic analysis when loading data.
         store_source: Whether to store code source in the lines collection.
+        workers: The number of worker processes used to visit submodules in parallel.
+        cache_dir: A directory in which to cache visited and inspected modules.
+        inspection_workers: The number of sandboxed worker processes used to inspect modules.
+        inspection_timeout: The maximum number of seconds spent inspecting each module in worker processes.
+        inspection_memory_limit: The maximum memory size, in bytes, of each inspection worker process.
         find_stubs_package: Whether to search for stubs-only package.
             If both the package and its stubs are found, they'll be merged together.
             If only the stubs are found, they'll be used as the package itself.
@@ -853,6 +1597,11 @@ def load(
         allow_inspection=allow_inspection,
         force_inspection=force_inspection,
         store_source=store_source,
+        workers=workers,
+        cache_dir=cache_dir,
+        inspection_workers=inspection_workers,
+        inspection_timeout=inspection_timeout,
+        inspection_memory_limit=inspection_memory_limit,
     )
     result = loader.load(
         objspec,
@@ -880,6 +1629,7 @@ def load_git(
     modules_collection: ModulesCollection | None = None,
     allow_inspection: bool = True,
     force_inspection: bool = False,
+    workers: int | None = None,
     find_stubs_package: bool = False,
     resolve_aliases: bool = False,
     resolve_external: bool | None = None,
@@ -887,8 +1637,9 @@ def load_git(
 ) -> Object | Alias:
     """Load and return a module from a specific Git reference.
 
-    This function will create a temporary
-    [git worktree](https://git-scm.com/docs/git-worktree) at the requested reference
+    This function will extract the Python files found in the search paths
+    at the requested reference to a temporary directory, reading them directly
+    from the Git object database (without checking out a worktree),
     before loading `module` with [`griffe.load`][griffe.load].
 
     This function requires that the `git` executable is installed.
@@ -914,6 +1665,7 @@ def load_git(
         modules_collection: A collection of modules.
         allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
         force_inspection: Whether to force using dynamic analysis when loading data.
+        workers: The number of worker processes used to visit submodules in parallel.
         find_stubs_package: Whether to search for stubs-only package.
             If both the package and its stubs are found, they'll be merged together.
             If only the stubs are found, they'll be used as the package itself.
@@ -926,12 +1678,14 @@ def load_git(
     Returns:
         A Griffe object.
     """
-    with _tmp_worktree(repo, ref) as worktree:
-        search_paths = [worktree / path for path in search_paths or ["."]]
+    search_paths = search_paths or ["."]
+    source_paths = [*search_paths, objspec] if isinstance(objspec, Path) else search_paths
+    with _tmp_sources(repo, ref, source_paths) as worktree:
+        search_paths = [worktree / path for path in search_paths]
         if isinstance(objspec, Path):
             objspec = worktree / objspec
 
-        return load(
+        result = load(
             objspec,
             submodules=submodules,
             try_relative_path=False,
@@ -943,11 +1697,17 @@ def load_git(
             modules_collection=modules_collection,
             allow_inspection=allow_inspection,
             force_inspection=force_inspection,
+            workers=workers,
             find_stubs_package=find_stubs_package,
             resolve_aliases=resolve_aliases,
             resolve_external=resolve_external,
             resolve_implicit=resolve_implicit,
         )
+        # Extracted sources are not in a Git repository: we get Git information from the original one.
+        package = (result.parent if result.is_alias else result).package  # ty:ignore[possibly-missing-attribute]
+        if package.git_info is None:
+            package.git_info = _get_git_info(repo, ref, worktree)
+        return result
 
 
 def load_pypi(
@@ -964,6 +1724,8 @@ def load_pypi(
     modules_collection: ModulesCollection | None = None,
     allow_inspection: bool = True,
     force_inspection: bool = False,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
     find_stubs_package: bool = False,
     resolve_aliases: bool = False,
     resolve_external: bool | None = None,
@@ -985,6 +1747,8 @@ def load_pypi(
         modules_collection: A collection of modules.
         allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
         force_inspection: Whether to force using dynamic analysis when loading data.
+        workers: The number of worker processes used to visit submodules in parallel.
+        cache_dir: A directory in which to cache visited and inspected modules.
         find_stubs_package: Whether to search for stubs-only package.
             If both the package and its stubs are found, they'll be merged together.
             If only the stubs are found, they'll be used as the package itself.
@@ -1068,6 +1832,8 @@ def load_pypi(
         modules_collection=modules_collection,
         allow_inspection=allow_inspection,
         force_inspection=force_inspection,
+        workers=workers,
+        cache_dir=cache_dir,
         find_stubs_package=find_stubs_package,
         resolve_aliases=resolve_aliases,
         resolve_external=resolve_external,
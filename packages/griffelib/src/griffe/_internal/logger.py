@@ -106,6 +106,36 @@ patch_loggers(get_logger)
 """
 
 
+class _RecordsHandler(logging.Handler):
+    # Records messages logged in worker processes, to log them again in the main process.
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: list[tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.getMessage()))
+
+    def pop(self) -> list[tuple[int, str]]:
+        records, self.records = self.records, []
+        return records
+
+
+def _record_messages() -> _RecordsHandler:
+    # Only used in worker processes: messages are not emitted, they are recorded instead.
+    handler = _RecordsHandler()
+    recorder = logging.getLogger("griffe._worker")
+    recorder.propagate = False
+    recorder.setLevel(logging.DEBUG)
+    recorder.handlers = [handler]
+    logger._logger = recorder
+    return handler
+
+
+def _replay_messages(records: list[tuple[int, str]]) -> None:
+    for level, message in records:
+        logger.log(level, message)
+
+
 def get_logger(name: str = "griffe") -> Logger:
     """Create and return a new logger instance.
 
@@ -21,15 +21,18 @@ from __future__ import annotations
 
 import json
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, TypeVar
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+from weakref import WeakSet
 
 from griffe._internal.enumerations import Kind
 from griffe._internal.exceptions import AliasResolutionError, BuiltinModuleError, CyclicAliasError
 from griffe._internal.merger import merge_stubs
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
+    from griffe._internal.collections import ModulesCollection
     from griffe._internal.models import Alias, Attribute, Class, Function, Module, Object, TypeAlias
 
 _ObjType = TypeVar("_ObjType")
@@ -47,9 +50,57 @@ def _get_parts(key: str | Sequence[str]) -> Sequence[str]:
     return parts
 
 
+# Classes memoize their MRO and inherited members. To compute them, they read other objects:
+# members of the scopes and containers used to resolve their bases, and every class of their MRO.
+# Classes register themselves as dependents of these objects (or of one of their members, by name),
+# and when one of them changes (members, bases, name, parent or target),
+# the memoized data of its dependents is forgotten, recursively.
+# Unrelated changes elsewhere in the tree keep memoized data intact.
+
+
+def _depend_on(
+    dependent: Class,
+    dependencies: Iterable[tuple[Object | Alias | ModulesCollection, str | None]],
+) -> None:
+    for obj, name in dependencies:
+        if obj._dependents is None:
+            obj._dependents = {}
+        if (dependents := obj._dependents.get(name)) is None:
+            dependents = obj._dependents[name] = WeakSet()
+        dependents.add(dependent)
+
+
+def _invalidate(obj: Object | Alias | ModulesCollection, name: str | None = None) -> None:
+    # Forget memoized data of the object and of its dependents, recursively.
+    # When a name is given, only the given member changed, so we spare dependents of other members.
+    obj._forget_memoized()
+    if not obj._dependents:
+        return
+    if name is None:
+        groups = list(obj._dependents.values())
+        obj._dependents = None
+    else:
+        groups = [group for key in (None, name) if (group := obj._dependents.pop(key, None))]
+    for group in groups:
+        for dependent in list(group):
+            _invalidate(dependent)
+
+
+def _members_changed(obj: Any, name: str, old_member: Object | Alias | None) -> None:
+    _invalidate(obj, name)
+    # Members of aliases are the members of their target.
+    if not obj.is_collection and obj.is_alias:
+        with suppress(AliasResolutionError, CyclicAliasError):
+            _invalidate(obj.final_target, name)
+    if old_member is not None:
+        _invalidate(old_member)
+
+
 class GetMembersMixin:
     """Mixin class to share methods for accessing members."""
 
+    __slots__ = ()
+
     def __getitem__(self, key: str | Sequence[str]) -> Any:
         """Get a member with its name or path.
 
@@ -100,6 +151,8 @@ class GetMembersMixin:
 class DelMembersMixin:
     """Mixin class to share methods for deleting members."""
 
+    __slots__ = ()
+
     def __delitem__(self, key: str | Sequence[str]) -> None:
         """Delete a member with its name or path.
 
@@ -121,9 +174,11 @@ class DelMembersMixin:
         if len(parts) == 1:
             name = parts[0]
             try:
-                del self.members[name]  # ty:ignore[unresolved-attribute]
+                member = self.members.pop(name)  # ty:ignore[unresolved-attribute]
             except KeyError:
                 del self.inherited_members[name]  # ty:ignore[unresolved-attribute]
+            else:
+                _members_changed(self, name, member)
         else:
             del self.all_members[parts[0]][parts[1:]]  # ty:ignore[unresolved-attribute]
 
@@ -147,7 +202,8 @@ class DelMembersMixin:
         parts = _get_parts(key)
         if len(parts) == 1:
             name = parts[0]
-            del self.members[name]  # ty:ignore[unresolved-attribute]
+            member = self.members.pop(name)  # ty:ignore[unresolved-attribute]
+            _members_changed(self, name, member)
         else:
             self.members[parts[0]].del_member(parts[1:])  # ty:ignore[unresolved-attribute]
 
@@ -155,6 +211,8 @@ class DelMembersMixin:
 class SetMembersMixin:
     """Mixin class to share methods for setting members."""
 
+    __slots__ = ()
+
     def __setitem__(self, key: str | Sequence[str], value: Object | Alias) -> None:
         """Set a member with its name or path.
 
@@ -173,11 +231,13 @@ class SetMembersMixin:
         parts = _get_parts(key)
         if len(parts) == 1:
             name = parts[0]
+            member = self.members.get(name)  # ty:ignore[unresolved-attribute]
             self.members[name] = value  # ty:ignore[unresolved-attribute]
             if self.is_collection:  # ty:ignore[unresolved-attribute]
                 value._modules_collection = self  # ty:ignore[invalid-assignment]
             else:
                 value.parent = self  # ty:ignore[invalid-assignment]
+            _members_changed(self, name, member)
         else:
             self.members[parts[0]][parts[1:]] = value  # ty:ignore[unresolved-attribute]
 
@@ -216,11 +276,13 @@ class SetMembersMixin:
                     for alias in member.aliases.values():
                         with suppress(CyclicAliasError):
                             alias.target = value
+            member = self.members.get(name)  # ty:ignore[unresolved-attribute]
             self.members[name] = value  # ty:ignore[unresolved-attribute]
             if self.is_collection:  # ty:ignore[unresolved-attribute]
                 value._modules_collection = self  # ty:ignore[invalid-assignment]
             else:
                 value.parent = self  # ty:ignore[invalid-assignment]
+            _members_changed(self, name, member)
         else:
             self.members[parts[0]].set_member(parts[1:], value)  # ty:ignore[unresolved-attribute]
 
@@ -228,6 +290,8 @@ class SetMembersMixin:
 class SerializationMixin:
     """Mixin class to share methods for de/serializing objects."""
 
+    __slots__ = ()
+
     def as_json(self, *, full: bool = False, **kwargs: Any) -> str:
         """Return this object's data as a JSON string.
 
@@ -243,11 +307,13 @@ class SerializationMixin:
         return json.dumps(self, cls=JSONEncoder, full=full, **kwargs)
 
     @classmethod
-    def from_json(cls: type[_ObjType], json_string: str, **kwargs: Any) -> _ObjType:  # noqa: PYI019
+    def from_json(cls: type[_ObjType], json_string: str, *, lazy: bool = False, **kwargs: Any) -> _ObjType:  # noqa: PYI019
         """Create an instance of this class from a JSON string.
 
         Parameters:
             json_string: JSON to decode into Object.
+            lazy: Whether to decode members only when they are accessed,
+                see [`lazy_json_decoder`][griffe.lazy_json_decoder].
             **kwargs: Additional options passed to decoder.
 
         Returns:
@@ -257,18 +323,80 @@ class SerializationMixin:
             TypeError: When the json_string does not represent and object
                 of the class from which this classmethod has been called.
         """
-        from griffe._internal.encoders import json_decoder  # Avoid circular import.  # noqa: PLC0415
+        from griffe._internal.encoders import json_decoder, lazy_json_decoder  # Avoid circular import.  # noqa: PLC0415
 
-        kwargs.setdefault("object_hook", json_decoder)
-        obj = json.loads(json_string, **kwargs)
+        if lazy:
+            obj = lazy_json_decoder(json.loads(json_string, **kwargs))
+        else:
+            kwargs.setdefault("object_hook", json_decoder)
+            obj = json.loads(json_string, **kwargs)
         if not isinstance(obj, cls):
             raise TypeError(f"provided JSON object is not of type {cls}")
         return obj
 
+    def as_bytes(self) -> bytes:
+        """Return this object's data in Griffe's binary format.
+
+        The binary format is more compact and faster to load than JSON,
+        but it can only be loaded back by Griffe, see [`from_bytes`][griffe.Object.from_bytes].
+
+        Returns:
+            Binary data.
+        """
+        from griffe._internal.encoders import BinaryEncoder  # Avoid circular import.  # noqa: PLC0415
+
+        return BinaryEncoder().encode(self)
+
+    @classmethod
+    def from_bytes(cls: type[_ObjType], data: bytes, *, lazy: bool = False) -> _ObjType:  # noqa: PYI019
+        """Create an instance of this class from data in Griffe's binary format.
+
+        Parameters:
+            data: Binary data to decode into Object.
+            lazy: Whether to decode members only when they are accessed,
+                see [`binary_decoder`][griffe.binary_decoder].
+
+        Returns:
+            An Object instance.
+
+        Raises:
+            TypeError: When the data does not represent an object
+                of the class from which this classmethod has been called.
+        """
+        from griffe._internal.encoders import binary_decoder  # Avoid circular import.  # noqa: PLC0415
+
+        obj = binary_decoder(data, lazy=lazy)
+        if not isinstance(obj, cls):
+            raise TypeError(f"provided binary object is not of type {cls}")
+        return obj
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    return tuple(name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ()) if name != "__weakref__")
+
 
 class ObjectAliasMixin(GetMembersMixin, SetMembersMixin, DelMembersMixin, SerializationMixin):
     """Mixin class to share methods that appear both in objects and aliases, unchanged."""
 
+    __slots__ = ()
+
+    # Memoized data and dependents are neither pickled nor copied: they are computed again when needed.
+    _memoized: ClassVar[tuple[str, ...]] = ()
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        return None, {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if name not in self._memoized and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        for name in self._memoized:
+            setattr(self, name, None)
+        for name, value in state[1].items():
+            setattr(self, name, value)
+
     @property
     def all_members(self) -> dict[str, Object | Alias]:
         """All members (declared and inherited).
@@ -28,15 +28,16 @@ from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from griffe._internal.c3linear import c3linear_merge
-from griffe._internal.docstrings.parsers import DocstringOptions, DocstringStyle, parse
+from griffe._internal.docstrings.parsers import DocstringOptions, DocstringStyle, parse, parsed_docstrings_cache
 from griffe._internal.enumerations import Kind, ParameterKind, Parser, TypeParameterKind
 from griffe._internal.exceptions import AliasResolutionError, BuiltinModuleError, CyclicAliasError, NameResolutionError
 from griffe._internal.expressions import ExprCall, ExprName, ExprTuple
 from griffe._internal.logger import logger
-from griffe._internal.mixins import ObjectAliasMixin
+from griffe._internal.mixins import ObjectAliasMixin, _depend_on, _invalidate
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
+    from weakref import WeakSet
 
     from griffe._internal.collections import LinesCollection, ModulesCollection
     from griffe._internal.docstrings.models import DocstringSection
@@ -44,12 +45,11 @@ if TYPE_CHECKING:
     from griffe._internal.git import GitInfo
 
 
-from functools import cached_property
-
-
 class Decorator:
     """This class represents decorators."""
 
+    __slots__ = ("__weakref__", "endlineno", "lineno", "value")
+
     def __init__(self, value: str | Expr, *, lineno: int | None, endlineno: int | None) -> None:
         """Initialize the decorator.
 
@@ -90,6 +90,8 @@ class Decorator:
 class Docstring:
     """This class represents docstrings."""
 
+    __slots__ = ("__weakref__", "_parsed", "endlineno", "lineno", "parent", "parser", "parser_options", "value")
+
     def __init__(
         self,
         value: str,
@@ -143,6 +145,8 @@ class Docstring:
         [`parse`][griffe.Docstring.parse].
         """
 
+        self._parsed: list[DocstringSection] | None = None
+
     @property
     def lines(self) -> list[str]:
         """The lines of the docstring.
@@ -173,10 +177,25 @@ class Docstring:
             raise ValueError("Cannot get original docstring without line numbers")
         return "\n".join(self.parent.lines_collection[self.parent.filepath][self.lineno - 1 : self.endlineno])
 
-    @cached_property
+    @property
     def parsed(self) -> list[DocstringSection]:
-        """The docstring sections, parsed into structured data."""
-        return self.parse()
+        """The docstring sections, parsed into structured data.
+
+        Identical docstrings can share their parsed sections,
+        see [`parsed_docstrings_cache`][griffe.parsed_docstrings_cache].
+        Sections are computed once, until they are deleted with `del docstring.parsed`.
+        """
+        if self._parsed is None:
+            self._parsed = parsed_docstrings_cache.get(self)
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, sections: list[DocstringSection]) -> None:
+        self._parsed = sections
+
+    @parsed.deleter
+    def parsed(self) -> None:
+        self._parsed = None
 
     def parse(
         self,
@@ -229,6 +248,8 @@ class Parameter:  # noqa: PLW1641
     See also: [`Parameters`][griffe.Parameters].
     """
 
+    __slots__ = ("__weakref__", "annotation", "default", "docstring", "function", "kind", "name")
+
     def __init__(
         self,
         name: str,
@@ -328,6 +349,8 @@ class Parameters:
             *parameters: The initial parameters to add to the container.
         """
         self._params: list[Parameter] = list(parameters)
+        # Indices of parameters by name, computed lazily.
+        self._indices: dict[str, int] | None = None
 
     def __repr__(self) -> str:
         return f"Parameters({', '.join(repr(param) for param in self._params)})"
@@ -336,36 +359,39 @@ class Parameters:
         """Get a parameter by index or name."""
         if isinstance(name_or_index, int):
             return self._params[name_or_index]
-        name = name_or_index.lstrip("*")
-        try:
-            return next(param for param in self._params if param.name == name)
-        except StopIteration as error:
-            raise KeyError(f"parameter {name_or_index} not found") from error
+        index = self._index(name_or_index.lstrip("*"))
+        if index is None:
+            raise KeyError(f"parameter {name_or_index} not found")
+        return self._params[index]
 
     def __setitem__(self, name_or_index: int | str, parameter: Parameter) -> None:
         """Set a parameter by index or name."""
         if isinstance(name_or_index, int):
             self._params[name_or_index] = parameter
+            self._indices = None
+            return
+        name = name_or_index.lstrip("*")
+        index = self._index(name)
+        if index is None:
+            self._params.append(parameter)
+            if self._indices is not None:
+                self._indices.setdefault(parameter.name, len(self._params) - 1)
         else:
-            name = name_or_index.lstrip("*")
-            try:
-                index = next(idx for idx, param in enumerate(self._params) if param.name == name)
-            except StopIteration:
-                self._params.append(parameter)
-            else:
-                self._params[index] = parameter
+            self._params[index] = parameter
+            if parameter.name != name:
+                self._indices = None
 
     def __delitem__(self, name_or_index: int | str) -> None:
         """Delete a parameter by index or name."""
         if isinstance(name_or_index, int):
             del self._params[name_or_index]
         else:
-            name = name_or_index.lstrip("*")
-            try:
-                index = next(idx for idx, param in enumerate(self._params) if param.name == name)
-            except StopIteration as error:
-                raise KeyError(f"parameter {name_or_index} not found") from error
+            index = self._index(name_or_index.lstrip("*"))
+            if index is None:
+                raise KeyError(f"parameter {name_or_index} not found")
             del self._params[index]
+        # Following parameters were shifted.
+        self._indices = None
 
     def __len__(self):
         """The number of parameters."""
@@ -377,11 +403,7 @@ class Parameters:
 
     def __contains__(self, param_name: str):
         """Whether a parameter with the given name is present."""
-        try:
-            next(param for param in self._params if param.name == param_name.lstrip("*"))
-        except StopIteration:
-            return False
-        return True
+        return self._index(param_name.lstrip("*")) is not None
 
     def add(self, parameter: Parameter) -> None:
         """Add a parameter to the container.
@@ -395,11 +417,24 @@ class Parameters:
         if parameter.name in self:
             raise ValueError(f"parameter {parameter.name} already present")
         self._params.append(parameter)
+        if self._indices is not None:
+            self._indices[parameter.name] = len(self._params) - 1
+
+    def _index(self, name: str) -> int | None:
+        if self._indices is not None:
+            index = self._indices.get(name)
+            if index is not None and index < len(self._params) and self._params[index].name == name:
+                return index
+        # Unknown name, or renamed parameters: compute indices again.
+        self._indices = _index_by_name(self._params)
+        return self._indices.get(name)
 
 
 class TypeParameter:
     """This class represents a type parameter."""
 
+    __slots__ = ("__weakref__", "annotation", "default", "kind", "name")
+
     def __init__(
         self,
         name: str,
@@ -508,6 +543,8 @@ class TypeParameters:
             *type_parameters: The initial type parameters to add to the container.
         """
         self._type_params: list[TypeParameter] = list(type_parameters)
+        # Indices of type parameters by name, computed lazily.
+        self._indices: dict[str, int] | None = None
 
     def __repr__(self) -> str:
         return f"TypeParameters({', '.join(repr(type_param) for type_param in self._type_params)})"
@@ -516,36 +553,39 @@ class TypeParameters:
         """Get a type parameter by index or name."""
         if isinstance(name_or_index, int):
             return self._type_params[name_or_index]
-        name = name_or_index.lstrip("*")
-        try:
-            return next(param for param in self._type_params if param.name == name)
-        except StopIteration as error:
-            raise KeyError(f"type parameter {name_or_index} not found") from error
+        index = self._index(name_or_index.lstrip("*"))
+        if index is None:
+            raise KeyError(f"type parameter {name_or_index} not found")
+        return self._type_params[index]
 
     def __setitem__(self, name_or_index: int | str, type_parameter: TypeParameter) -> None:
         """Set a type parameter by index or name."""
         if isinstance(name_or_index, int):
             self._type_params[name_or_index] = type_parameter
+            self._indices = None
+            return
+        name = name_or_index.lstrip("*")
+        index = self._index(name)
+        if index is None:
+            self._type_params.append(type_parameter)
+            if self._indices is not None:
+                self._indices.setdefault(type_parameter.name, len(self._type_params) - 1)
         else:
-            name = name_or_index.lstrip("*")
-            try:
-                index = next(idx for idx, param in enumerate(self._type_params) if param.name == name)
-            except StopIteration:
-                self._type_params.append(type_parameter)
-            else:
-                self._type_params[index] = type_parameter
+            self._type_params[index] = type_parameter
+            if type_parameter.name != name:
+                self._indices = None
 
     def __delitem__(self, name_or_index: int | str) -> None:
         """Delete a type parameter by index or name."""
         if isinstance(name_or_index, int):
             del self._type_params[name_or_index]
         else:
-            name = name_or_index.lstrip("*")
-            try:
-                index = next(idx for idx, param in enumerate(self._type_params) if param.name == name)
-            except StopIteration as error:
-                raise KeyError(f"type parameter {name_or_index} not found") from error
+            index = self._index(name_or_index.lstrip("*"))
+            if index is None:
+                raise KeyError(f"type parameter {name_or_index} not found")
             del self._type_params[index]
+        # Following type parameters were shifted.
+        self._indices = None
 
     def __len__(self):
         """The number of type parameters."""
@@ -557,11 +597,7 @@ class TypeParameters:
 
     def __contains__(self, type_param_name: str):
         """Whether a type parameter with the given name is present."""
-        try:
-            next(param for param in self._type_params if param.name == type_param_name.lstrip("*"))
-        except StopIteration:
-            return False
-        return True
+        return self._index(type_param_name.lstrip("*")) is not None
 
     def add(self, type_parameter: TypeParameter) -> None:
         """Add a type parameter to the container.
@@ -575,11 +611,89 @@ class TypeParameters:
         if type_parameter.name in self:
             raise ValueError(f"type parameter {type_parameter.name} already present")
         self._type_params.append(type_parameter)
+        if self._indices is not None:
+            self._indices[type_parameter.name] = len(self._type_params) - 1
+
+    def _index(self, name: str) -> int | None:
+        if self._indices is not None:
+            index = self._indices.get(name)
+            if index is not None and index < len(self._type_params) and self._type_params[index].name == name:
+                return index
+        # Unknown name, or renamed type parameters: compute indices again.
+        self._indices = _index_by_name(self._type_params)
+        return self._indices.get(name)
+
+
+def _path_dependencies(
+    modules_collection: ModulesCollection,
+    path: str,
+) -> Iterator[tuple[ModulesCollection | Object | Alias, str | None]]:
+    # Members read to resolve a path: adding, replacing or deleting them changes what the path resolves to.
+    container: ModulesCollection | Object | Alias = modules_collection
+    for part in path.split("."):
+        if not container.is_collection and container.is_alias:
+            yield container, None
+        yield container, part
+        try:
+            container = container.members[part]
+        except (AliasResolutionError, CyclicAliasError, KeyError):
+            return
+
+
+def _scope_dependencies(cls: Class) -> Iterator[tuple[Object | Alias, str | None]]:
+    # Members read to resolve the first name of each base expression, in the scope of the class and its parents.
+    names: set[str | None] = set()
+    for base in cls.bases:
+        if not isinstance(base, str):
+            names.add(next((name.name for name in base.iterate(flat=True) if isinstance(name, ExprName)), None))
+    scope: Object | Alias | None = cls
+    while scope is not None:
+        for name in names:
+            yield scope, name
+            if name is not None and (member := scope.members.get(name)) is not None and member.is_alias:
+                yield member, None
+        scope = scope.parent
+
+
+def _index_by_name(params: Sequence[Parameter | TypeParameter]) -> dict[str, int]:
+    # When several parameters have the same name, the first one wins.
+    indices: dict[str, int] = {}
+    for index, param in enumerate(params):
+        indices.setdefault(param.name, index)
+    return indices
 
 
 class Object(ObjectAliasMixin):
     """An abstract class representing a Python object."""
 
+    # Empty containers (members, labels, etc.) are only allocated when accessed.
+    __slots__ = (
+        "__weakref__",
+        "_aliases",
+        "_dependents",
+        "_extra",
+        "_git_info",
+        "_imports",
+        "_inherited_members",
+        "_labels",
+        "_lines_collection",
+        "_members",
+        "_modules_collection",
+        "_name",
+        "_parent",
+        "_path",
+        "_source_link",
+        "_type_parameters",
+        "analysis",
+        "deprecated",
+        "docstring",
+        "endlineno",
+        "exports",
+        "lineno",
+        "public",
+        "runtime",
+    )
+
     kind: Kind
     """The object kind."""
     is_alias: bool = False
@@ -623,8 +737,16 @@ class Object(ObjectAliasMixin):
             analysis: The type of analysis used to load this object.
                 None means the object was created manually.
         """
-        self.name: str = name
-        """The object name."""
+        self._name: str = name
+        self._parent: Module | Class | None = parent
+        # Memoized path, along with the path of the parent it was computed from.
+        self._path: tuple[str, str] | None = None
+        # Memoized inherited members, along with the MRO they were computed from.
+        self._inherited_members: (
+            tuple[list[Class], set[str], list[tuple[Class, dict[str, Object | Alias]]], dict[str, Alias]] | None
+        ) = None
+        # Classes whose memoized data depend on this object, see `griffe._internal.mixins._depend_on`.
+        self._dependents: dict[str | None, WeakSet[Class]] | None = None
 
         self.lineno: int | None = lineno
         """The starting line number of the object.
@@ -648,32 +770,12 @@ class Object(ObjectAliasMixin):
         # TODO: Maybe move these into `Class` and `Function`.
         # Then always return them in `Class` and `Function`'s `as_dict` methods,
         # and remove the conditional in the `_load_class` and `_load_function` decoders.
-        self.type_parameters: TypeParameters = type_parameters or TypeParameters()
-        """The object type parameters."""
-
-        self.parent: Module | Class | None = parent
-        """The parent of the object (none if top module)."""
-
-        self.members: dict[str, Object | Alias] = {}
-        """The object members (modules, classes, functions, attributes, type aliases).
-
-        See also: [`inherited_members`][griffe.Object.inherited_members],
-        [`get_member`][griffe.Object.get_member],
-        [`set_member`][griffe.Object.set_member],
-        [`filter_members`][griffe.Object.filter_members].
-        """
-
-        self.labels: set[str] = set()
-        """The object labels (`property`, `dataclass`, etc.).
-
-        See also: [`has_labels`][griffe.Object.has_labels]."""
-
-        self.imports: dict[str, str] = {}
-        """The other objects imported by this object.
-
-        Keys are the names within the object (`from ... import ... as AS_NAME`),
-        while the values are the actual names of the objects (`from ... import REAL_NAME as ...`).
-        """
+        self._type_parameters: TypeParameters | None = type_parameters or None
+        self._members: dict[str, Object | Alias] | None = None
+        self._labels: set[str] | None = None
+        self._imports: dict[str, str] | None = None
+        self._aliases: dict[str, Alias] | None = None
+        self._extra: dict[str, dict[str, Any]] | None = None
 
         self.exports: list[str | ExprName] | None = None
         """The names of the objects exported by this (module) object through the `__all__` variable.
@@ -692,9 +794,6 @@ class Object(ObjectAliasMixin):
         See also: [`GriffeLoader.expand_exports`][griffe.GriffeLoader.expand_exports].
         """
 
-        self.aliases: dict[str, Alias] = {}
-        """The aliases pointing to this object."""
-
         self.runtime: bool = runtime
         """Whether this object is available at runtime.
 
@@ -702,9 +801,6 @@ class Object(ObjectAliasMixin):
         are not available at runtime.
         """
 
-        self.extra: dict[str, dict[str, Any]] = defaultdict(dict)
-        """Namespaced dictionaries storing extra metadata for this object, used by extensions."""
-
         self.public: bool | None = None
         """Whether this object is public."""
 
@@ -729,6 +825,86 @@ class Object(ObjectAliasMixin):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.name!r}, {self.lineno!r}, {self.endlineno!r})"
 
+    @property
+    def type_parameters(self) -> TypeParameters:
+        """The object type parameters."""
+        if self._type_parameters is None:
+            self._type_parameters = TypeParameters()
+        return self._type_parameters
+
+    @type_parameters.setter
+    def type_parameters(self, type_parameters: TypeParameters) -> None:
+        self._type_parameters = type_parameters
+
+    @property
+    def members(self) -> dict[str, Object | Alias]:
+        """The object members (modules, classes, functions, attributes, type aliases).
+
+        See also: [`inherited_members`][griffe.Object.inherited_members],
+        [`get_member`][griffe.Object.get_member],
+        [`set_member`][griffe.Object.set_member],
+        [`filter_members`][griffe.Object.filter_members].
+        """
+        if self._members is None:
+            self._members = {}
+        return self._members
+
+    @members.setter
+    def members(self, members: dict[str, Object | Alias]) -> None:
+        self._members = members
+        _invalidate(self)
+
+    @property
+    def labels(self) -> set[str]:
+        """The object labels (`property`, `dataclass`, etc.).
+
+        See also: [`has_labels`][griffe.Object.has_labels].
+        """
+        if self._labels is None:
+            self._labels = set()
+        return self._labels
+
+    @labels.setter
+    def labels(self, labels: set[str]) -> None:
+        self._labels = labels
+
+    @property
+    def imports(self) -> dict[str, str]:
+        """The other objects imported by this object.
+
+        Keys are the names within the object (`from ... import ... as AS_NAME`),
+        while the values are the actual names of the objects (`from ... import REAL_NAME as ...`).
+        """
+        if self._imports is None:
+            self._imports = {}
+        return self._imports
+
+    @imports.setter
+    def imports(self, imports: dict[str, str]) -> None:
+        self._imports = imports
+
+    @property
+    def aliases(self) -> dict[str, Alias]:
+        """The aliases pointing to this object."""
+        if self._aliases is None:
+            self._aliases = {}
+        return self._aliases
+
+    @aliases.setter
+    def aliases(self, aliases: dict[str, Alias]) -> None:
+        self._aliases = aliases
+
+    @property
+    def extra(self) -> dict[str, dict[str, Any]]:
+        """Namespaced dictionaries storing extra metadata for this object, used by extensions."""
+        if self._extra is None:
+            self._extra = defaultdict(dict)
+        return self._extra
+
+    @extra.setter
+    def extra(self, extra: dict[str, dict[str, Any]]) -> None:
+        self._extra = extra
+
     # Prevent using `__len__`.
     def __bool__(self) -> bool:
         """An object is always true-ish."""
@@ -842,20 +1018,41 @@ class Object(ObjectAliasMixin):
 
         See also: [`members`][griffe.Object.members].
         """
+        return dict(self._inherited_members_map())
+
+    def _inherited_members_map(self) -> dict[str, Alias]:
+        # Memoized inherited members, not to be mutated.
         if not isinstance(self, Class):
             return {}
         try:
-            mro = self.mro()
+            mro = self._mro()
         except ValueError as error:
             logger.debug(error)
             return {}
+        # Members can be changed in place, without going through `set_member` or `del_member`,
+        # so we compare them with the ones we saw last time (objects compare by identity).
+        cache = self._inherited_members
+        if (
+            cache is not None
+            and cache[0] is mro
+            and self.members.keys() == cache[1]
+            and all(base.members == members for base, members in cache[2])
+        ):
+            return cache[3]
         inherited_members = {}
-        for base in reversed(mro):
-            for name, member in base.members.items():
+        snapshots = [(base, dict(base.members)) for base in mro[1:]]
+        for _, members in reversed(snapshots):
+            for name, member in members.items():
                 if name not in self.members:
                     inherited_members[name] = Alias(name, member, parent=self, inherited=True)
+        self._inherited_members = (mro, set(self.members), snapshots, inherited_members)
         return inherited_members
 
+    _memoized = ("_dependents", "_inherited_members", "_path")
+
+    def _forget_memoized(self) -> None:
+        self._inherited_members = None
+
     @property
     def is_module(self) -> bool:
         """Whether this object is a module.
@@ -1121,6 +1318,27 @@ class Object(ObjectAliasMixin):
         except ValueError:
             return self.filepath
 
+    @property
+    def name(self) -> str:
+        """The object name."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._path = None
+        _invalidate(self)
+
+    @property
+    def parent(self) -> Module | Class | None:
+        """The parent of the object (none if top module)."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Module | Class | None) -> None:
+        self._parent = value
+        _invalidate(self)
+
     @property
     def path(self) -> str:
         """The dotted path of this object.
@@ -1145,9 +1363,16 @@ class Object(ObjectAliasMixin):
 
         See also: [`path`][griffe.Object.path].
         """
-        if self.parent is None:
-            return self.name
-        return f"{self.parent.path}.{self.name}"
+        if self._parent is None:
+            return self._name
+        # Paths of parents are memoized too: as long as the parent path is the same string,
+        # our own memoized path is valid.
+        parent_path = self._parent.path
+        if self._path is not None and self._path[0] is parent_path:
+            return self._path[1]
+        path = f"{parent_path}.{self._name}"
+        self._path = (parent_path, path)
+        return path
 
     @property
     def modules_collection(self) -> ModulesCollection:
@@ -1261,6 +1486,8 @@ class Object(ObjectAliasMixin):
         Parameters:
             full: Whether to return full info, or just base info.
             **kwargs: Additional serialization options.
+                With `lazy_members=True`, members are returned as objects instead of dictionaries,
+                for the caller to serialize them one at a time.
 
         Returns:
             A dictionary.
@@ -1275,8 +1502,9 @@ class Object(ObjectAliasMixin):
             base["public"] = self.public
         if self.exports is not None:
             base["exports"] = [str(export) for export in self.exports]
-        if self.imports:
-            base["imports"] = self.imports
+        # Read containers without allocating empty ones.
+        if self._imports:
+            base["imports"] = self._imports
         if self.deprecated is not None:
             base["deprecated"] = self.deprecated
         if self.lineno is not None:
@@ -1285,12 +1513,17 @@ class Object(ObjectAliasMixin):
             base["endlineno"] = self.endlineno
         if self.docstring:
             base["docstring"] = self.docstring
-        if self.type_parameters:
-            base["type_parameters"] = [type_param.as_dict(**kwargs) for type_param in self.type_parameters]
-        if self.labels:
-            base["labels"] = self.labels
-        if self.members:
-            base["members"] = {name: member.as_dict(full=full, **kwargs) for name, member in self.members.items()}
+        if self._type_parameters:
+            base["type_parameters"] = [type_param.as_dict(**kwargs) for type_param in self._type_parameters]
+        if self._labels:
+            base["labels"] = self._labels
+        if self._members:
+            if kwargs.get("lazy_members"):
+                # Members are kept as objects, to be serialized one at a time by the caller
+                # (see `JSONEncoder`), instead of building the whole tree of dictionaries.
+                base["members"] = dict(self._members)
+            else:
+                base["members"] = {name: member.as_dict(full=full, **kwargs) for name, member in self._members.items()}
         if self.analysis:
             base["analysis"] = self.analysis
         if self._git_info is not None:
@@ -1363,6 +1596,26 @@ class Alias(ObjectAliasMixin):
     See also: [`ModulesCollection`][griffe.ModulesCollection].
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_dependents",
+        "_inherited_members",
+        "_name",
+        "_parent",
+        "_passed_through",
+        "_path",
+        "_target",
+        "alias_endlineno",
+        "alias_lineno",
+        "analysis",
+        "deprecated",
+        "inherited",
+        "public",
+        "runtime",
+        "target_path",
+        "wildcard_imported",
+    )
+
     def __init__(
         self,
         name: str,
@@ -1391,8 +1644,13 @@ class Alias(ObjectAliasMixin):
             analysis: The type of analysis used to load this alias.
                 None means the alias was created manually.
         """
-        self.name: str = name
-        """The alias name."""
+        self._name: str = name
+        # Memoized path, along with the path of the parent it was computed from.
+        self._path: tuple[str, str] | None = None
+        # Memoized inherited members, along with the inherited members of the target they were computed from.
+        self._inherited_members: tuple[dict[str, Alias], dict[str, Alias]] | None = None
+        # Classes whose memoized data depend on this alias, see `griffe._internal.mixins._depend_on`.
+        self._dependents: dict[str | None, WeakSet[Class]] | None = None
 
         self.alias_lineno: int | None = lineno
         """The starting line number of the alias."""
@@ -1487,6 +1745,17 @@ class Alias(ObjectAliasMixin):
         except (AliasResolutionError, CyclicAliasError):
             return False
 
+    @property
+    def name(self) -> str:
+        """The alias name."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._path = None
+        _invalidate(self)
+
     @property
     def parent(self) -> Module | Class | Alias | None:
         """The parent of this alias."""
@@ -1495,6 +1764,7 @@ class Alias(ObjectAliasMixin):
     @parent.setter
     def parent(self, value: Module | Class | Alias) -> None:
         self._parent = value
+        _invalidate(self)
         self._update_target_aliases()
 
     @property
@@ -1503,7 +1773,12 @@ class Alias(ObjectAliasMixin):
 
         See also: [`canonical_path`][griffe.Alias.canonical_path].
         """
-        return f"{self.parent.path}.{self.name}"  # ty:ignore[unresolved-attribute]
+        parent_path = self._parent.path  # ty:ignore[unresolved-attribute]
+        if self._path is not None and self._path[0] is parent_path:
+            return self._path[1]
+        path = f"{parent_path}.{self._name}"
+        self._path = (parent_path, path)
+        return path
 
     @property
     def modules_collection(self) -> ModulesCollection:
@@ -1543,16 +1818,25 @@ class Alias(ObjectAliasMixin):
 
         See also: [`members`][griffe.Alias.members].
         """
-        final_target = self.final_target
+        target_inherited_members = self.final_target._inherited_members_map()
+        if self._inherited_members is not None and self._inherited_members[0] is target_inherited_members:
+            return dict(self._inherited_members[1])
 
         # We recreate aliases to maintain a correct hierarchy,
         # and therefore correct paths. The path of an alias member
         # should be the path of the alias plus the member's name,
         # not the original member's path.
-        return {
+        inherited_members = {
             name: Alias(name, target=member, parent=self, inherited=True)
-            for name, member in final_target.inherited_members.items()
+            for name, member in target_inherited_members.items()
         }
+        self._inherited_members = (target_inherited_members, inherited_members)
+        return dict(inherited_members)
+
+    _memoized = ("_dependents", "_inherited_members", "_path")
+
+    def _forget_memoized(self) -> None:
+        self._inherited_members = None
 
     def as_json(self, *, full: bool = False, **kwargs: Any) -> str:
         """Return this target's data as a JSON string.
@@ -2102,6 +2386,7 @@ class Alias(ObjectAliasMixin):
             raise CyclicAliasError([self.target_path])
         self._target = value
         self.target_path = value.path
+        _invalidate(self)
         if self.parent is not None:
             self._target.aliases[self.path] = self
 
@@ -2253,6 +2538,8 @@ class Module(Object):
 
     kind = Kind.MODULE
 
+    __slots__ = ("_filepath", "overloads")
+
     def __init__(self, *args: Any, filepath: Path | list[Path] | None = None, **kwargs: Any) -> None:
         """Initialize the module.
 
@@ -2376,6 +2663,8 @@ class Class(Object):
 
     kind = Kind.CLASS
 
+    __slots__ = ("_bases", "_mro_cache", "decorators", "keywords", "overloads")
+
     def __init__(
         self,
         *args: Any,
@@ -2395,12 +2684,9 @@ class Class(Object):
         """
         super().__init__(*args, **kwargs)
 
-        self.bases: list[Expr | str] = list(bases) if bases else []
-        """The class bases.
-
-        See also: [`resolved_bases`][griffe.Class.resolved_bases],
-        [`mro`][griffe.Class.mro].
-        """
+        self._bases: list[Expr | str] = list(bases) if bases else []
+        # Memoized MRO (starting with the class itself), along with the bases it was computed from.
+        self._mro_cache: tuple[list[tuple[Class, list[Expr | str]]], list[Class]] | None = None
 
         self.decorators: list[Decorator] = decorators or []
         """The class decorators."""
@@ -2411,6 +2697,20 @@ class Class(Object):
         self.overloads: dict[str, list[Function]] = defaultdict(list)
         """The overloaded signatures declared in this class."""
 
+    @property
+    def bases(self) -> list[Expr | str]:
+        """The class bases.
+
+        See also: [`resolved_bases`][griffe.Class.resolved_bases],
+        [`mro`][griffe.Class.mro].
+        """
+        return self._bases
+
+    @bases.setter
+    def bases(self, value: list[Expr | str]) -> None:
+        self._bases = value
+        _invalidate(self)
+
     @property
     def parameters(self) -> Parameters:
         """The parameters of this class' `__init__` method, if any.
@@ -2451,29 +2751,59 @@ class Class(Object):
         See also: [`bases`][griffe.Class.bases],
         [`mro`][griffe.Class.mro].
         """
+        return self._resolve_bases([])
+
+    def _resolve_bases(
+        self,
+        dependencies: list[tuple[ModulesCollection | Object | Alias, str | None]],
+    ) -> list[Object]:
+        # Resolve bases, collecting the members that were read to resolve them.
+        modules_collection = self.modules_collection
         resolved_bases = []
         for base in self.bases:
             base_path = base if isinstance(base, str) else base.canonical_path
+            dependencies.extend(_path_dependencies(modules_collection, base_path))
             try:
-                resolved_base = self.modules_collection.get_member(base_path)
+                resolved_base = modules_collection.get_member(base_path)
                 if resolved_base.is_alias:
-                    resolved_base = resolved_base.final_target
+                    alias, resolved_base = resolved_base, resolved_base.final_target
+                    # The chain is resolved and has no cycles: we can walk it again.
+                    while alias.is_alias:
+                        dependencies.append((alias, None))
+                        alias = alias._target
             except (AliasResolutionError, CyclicAliasError, KeyError):
                 logger.debug("Base class %s is not loaded, or not static, it cannot be resolved", base_path)
             else:
                 resolved_bases.append(resolved_base)
         return resolved_bases
 
+    _memoized = ("_dependents", "_inherited_members", "_mro_cache", "_path")
+
+    def _forget_memoized(self) -> None:
+        self._inherited_members = None
+        self._mro_cache = None
+
     def _mro(self, seen: tuple[str, ...] = ()) -> list[Class]:
+        # Bases can be changed in place, without going through the `bases` setter,
+        # here or in any class of the MRO.
+        if self._mro_cache is not None and all(cls._bases == bases for cls, bases in self._mro_cache[0]):
+            return self._mro_cache[1]
         seen = (*seen, self.path)
-        bases: list[Class] = [base for base in self.resolved_bases if base.is_class]  # ty:ignore[invalid-assignment]
+        dependencies: list[tuple[ModulesCollection | Object | Alias, str | None]] = list(_scope_dependencies(self))
+        bases: list[Class] = [base for base in self._resolve_bases(dependencies) if base.is_class]  # ty:ignore[invalid-assignment]
         if not bases:
-            return [self]
-        for base in bases:
-            if base.path in seen:
-                cycle = " -> ".join(seen) + f" -> {base.path}"
-                raise ValueError(f"Cannot compute C3 linearization, inheritance cycle detected: {cycle}")
-        return [self, *c3linear_merge(*[base._mro(seen) for base in bases], bases)]
+            mro = [self]
+        else:
+            for base in bases:
+                if base.path in seen:
+                    cycle = " -> ".join(seen) + f" -> {base.path}"
+                    raise ValueError(f"Cannot compute C3 linearization, inheritance cycle detected: {cycle}")
+            mro = [self, *c3linear_merge(*[base._mro(seen) for base in bases], bases)]
+        # Inherited members depend on all the members of every class in the MRO.
+        dependencies.extend((base, None) for base in mro[1:])
+        _depend_on(self, dependencies)
+        self._mro_cache = ([(cls, list(cls._bases)) for cls in mro], mro)
+        return mro
 
     def mro(self) -> list[Class]:
         """Return a list of classes in order corresponding to Python's MRO.
@@ -2505,6 +2835,8 @@ class Function(Object):
 
     kind = Kind.FUNCTION
 
+    __slots__ = ("decorators", "overloads", "parameters", "returns")
+
     def __init__(
         self,
         *args: Any,
@@ -2675,6 +3007,8 @@ class Attribute(Object):
 
     kind = Kind.ATTRIBUTE
 
+    __slots__ = ("annotation", "deleter", "setter", "value")
+
     def __init__(
         self,
         *args: Any,
@@ -2724,6 +3058,8 @@ class TypeAlias(Object):
 
     kind = Kind.TYPE_ALIAS
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         *args: Any,
@@ -2753,3 +3089,10 @@ class TypeAlias(Object):
         base = super().as_dict(**kwargs)
         base["value"] = self.value
         return base
+
+
+def _iter_modules(module: Module) -> Iterator[Module]:
+    yield module
+    for member in module.members.values():
+        if not member.is_alias and member.is_module:
+            yield from _iter_modules(member)  # ty:ignore[invalid-argument-type]
@@ -20,16 +20,59 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
 from griffe._internal.enumerations import Kind
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griffe._internal.loader import GriffeLoader
     from griffe._internal.models import Alias, Object
 
 
+_phases = (
+    "reading",
+    "compiling",
+    "visiting",
+    "inspecting",
+    "extensions",
+    "exports",
+    "wildcards",
+    "aliases",
+    "git",
+)
+
+
+class _Profiler:
+    # Durations of loading phases, in nanoseconds, by module path then by phase.
+    # Phases can be nested: expanding wildcards or resolving aliases can load other packages,
+    # and these durations are then counted in both phases.
+    # When disabled, only durations of visits and inspections are recorded,
+    # as they are measured once per module anyway (sometimes in worker processes).
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self.timings: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, module_path: str, phase: str, duration: int) -> None:
+        self.timings[module_path][phase] += duration
+
+    @contextmanager
+    def measure(self, module_path: str, phase: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.timings[module_path][phase] += perf_counter_ns() - start
+
+
 class Stats:
     """Load statistics for a Griffe loader."""
 
@@ -75,14 +118,37 @@ class Stats:
         self.lines = sum(len(lines) for lines in loader.lines_collection.values())
         """Total number of lines."""
 
-        self.time_spent_visiting = 0
-        """Time spent visiting modules."""
+        self.time_spent_by_module: dict[str, dict[str, int]] = {
+            module_path: {phase: duration // 1000 for phase, duration in timings.items()}
+            for module_path, timings in loader._profiler.timings.items()
+        }
+        """Time spent in each loading phase (reading, compiling, visiting, etc.), by module path, in microseconds."""
+
+        self.time_spent_by_phase: dict[str, int] = dict.fromkeys(_phases, 0)
+        """Time spent in each loading phase, across all modules, in microseconds."""
+        for timings in self.time_spent_by_module.values():
+            for phase, duration in timings.items():
+                self.time_spent_by_phase[phase] = self.time_spent_by_phase.get(phase, 0) + duration
 
-        self.time_spent_inspecting = 0
-        """Time spent inspecting modules."""
+        self.time_spent_visiting = self.time_spent_by_phase["compiling"] + self.time_spent_by_phase["visiting"]
+        """Time spent visiting modules, in microseconds."""
+
+        self.time_spent_inspecting = self.time_spent_by_phase["inspecting"]
+        """Time spent inspecting modules, in microseconds."""
 
         self.time_spent_serializing = 0
-        """Time spent serializing objects."""
+        """Time spent serializing objects, in microseconds."""
+
+        self.time_spent_by_extension: dict[str, dict[str, dict[str, int]]] = {
+            extension: {
+                event: {"calls": calls, "time": duration // 1000} for event, (calls, duration) in events.items()
+            }
+            for extension, events in loader.extensions.timings.items()
+        }
+        """Number of calls and time spent (in microseconds) in hooks, by extension then by event.
+
+        Only recorded when [`Extensions.profile`][griffe.Extensions.profile] is enabled.
+        """
 
         for module in top_modules:
             self._itercount(module)
@@ -143,8 +209,11 @@ class Stats:
         visit_time = self.time_spent_visiting / 1000
         inspect_time = self.time_spent_inspecting / 1000
         total_time = visit_time + inspect_time
-        visit_percent = visit_time / total_time * 100
-        inspect_percent = inspect_time / total_time * 100
+        try:
+            visit_percent = visit_time / total_time * 100
+            inspect_percent = inspect_time / total_time * 100
+        except ZeroDivisionError:
+            visit_percent = inspect_percent = 0
 
         force_inspection = self.loader.force_inspection
         visited_modules = 0 if force_inspection else regular
@@ -170,7 +239,66 @@ class Stats:
         )
 
         serialize_time = self.time_spent_serializing / 1000
-        serialize_time_per_module = serialize_time / modules
+        try:
+            serialize_time_per_module = serialize_time / modules
+        except ZeroDivisionError:
+            serialize_time_per_module = 0
         lines.append(f"Time spent serializing: {serialize_time}ms, {serialize_time_per_module:.02f}ms/module")
 
+        lines.append("")
+        lines.append("Time spent by phase")
+        for phase, duration in self.time_spent_by_phase.items():
+            lines.append(f"  {phase.capitalize()}: {duration / 1000}ms")
+
+        if self.time_spent_by_extension:
+            lines.append("")
+            lines.append("Time spent in extensions")
+            for extension, events in sorted(
+                self.time_spent_by_extension.items(),
+                key=lambda item: sum(timing["time"] for timing in item[1].values()),
+                reverse=True,
+            ):
+                calls = sum(timing["calls"] for timing in events.values())
+                duration = sum(timing["time"] for timing in events.values())
+                lines.append(f"  {extension}: {duration / 1000}ms, {calls} calls")
+                for event, timing in sorted(events.items(), key=lambda item: item[1]["time"], reverse=True):
+                    lines.append(f"    {event}: {timing['time'] / 1000}ms, {timing['calls']} calls")
+
+        if slowest := self.slowest_modules():
+            lines.append("")
+            lines.append(f"Slowest modules ({len(slowest)})")
+            for module_path, duration in slowest:
+                lines.append(f"  {module_path}: {duration / 1000}ms")
+
         return "\n".join(lines)
+
+    def slowest_modules(self, number: int = 10) -> list[tuple[str, int]]:
+        """Return the modules which took the most time to load.
+
+        Parameters:
+            number: The maximum number of modules to return.
+
+        Returns:
+            Module paths and the total time spent loading them, slowest first.
+        """
+        totals = {module_path: sum(timings.values()) for module_path, timings in self.time_spent_by_module.items()}
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:number]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary, serializable as JSON.
+
+        Returns:
+            A dictionary of statistics.
+        """
+        return {
+            "packages": self.packages,
+            "lines": self.lines,
+            "objects_by_kind": {kind.value: number for kind, number in self.by_kind.items()},
+            "modules_by_extension": dict(self.modules_by_extension),
+            "time_spent_visiting": self.time_spent_visiting,
+            "time_spent_inspecting": self.time_spent_inspecting,
+            "time_spent_serializing": self.time_spent_serializing,
+            "time_spent_by_phase": self.time_spent_by_phase,
+            "time_spent_by_module": self.time_spent_by_module,
+            "time_spent_by_extension": self.time_spent_by_extension,
+        }
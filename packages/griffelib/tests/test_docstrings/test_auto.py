@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# Tests for the [automatic style detection][griffe.docstrings.auto].
+
+from __future__ import annotations
+
+from itertools import permutations
+
+import pytest
+
+from griffe import Docstring, DocstringSectionKind, Parser, infer_docstring_style, parsers
+
+google = "Summary.\n\nParameters:\n    x: The value.\n\nReturns:\n    A value."
+numpy = "Summary.\n\nParameters\n----------\nx : int\n    The value.\n\nReturns\n-------\nint\n    A value."
+sphinx = "Summary.\n\n:param x: The value.\n:return: A value."
+
+
+@pytest.mark.parametrize(
+    ("value", "style"),
+    [(google, Parser.google), (numpy, Parser.numpy), (sphinx, Parser.sphinx), ("Summary.\n\nText.", None)],
+)
+@pytest.mark.parametrize("method", ["heuristics", "max_sections"])
+def test_infer_docstring_style(value: str, style: Parser | None, method: str) -> None:
+    """Infer the style of docstrings.
+
+    Parameters:
+        value: The docstring value.
+        style: The expected style.
+        method: The detection method.
+    """
+    inferred, sections = infer_docstring_style(Docstring(value), method=method)  # ty:ignore[invalid-argument-type]
+    if style is None:
+        assert inferred == (None if method == "heuristics" else Parser.sphinx)
+    else:
+        assert inferred == style
+    if method == "max_sections":
+        assert sections
+        assert sections[0].kind is DocstringSectionKind.text
+        assert len(sections) == (1 if style is None else 3)
+
+
+def test_max_sections_prefers_first_style_on_ties() -> None:
+    """Return the first style in order when parsers find the same number of sections."""
+    order = [Parser.numpy, Parser.google]
+    inferred, _ = infer_docstring_style(Docstring("Summary.\n\nText:"), method="max_sections", style_order=order)
+    assert inferred is Parser.numpy
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Summary.\n\nText.",
+        "Summary.\n\nNote: Important\n    Body of the note.\n",
+        "Summary.\n\nNote:\n    Body of the note.\n",
+        "Summary.\n\nParameters\n--\nx : int\n    Foo.\n",
+        "Summary.\n\nParameters\n-\nx : int\n    Foo.\n",
+        "Summary.\n\n:param x: Foo.\n",
+        "Summary: not a section.\n\nText - with dashes.",
+    ],
+)
+@pytest.mark.parametrize("style_order", list(permutations([Parser.sphinx, Parser.google, Parser.numpy])))
+def test_max_sections_agrees_with_parsing_by_every_style(value: str, style_order: tuple[Parser, ...]) -> None:
+    """Return the style finding the most sections, even for docstrings that look like plain text.
+
+    Parameters:
+        value: The docstring value.
+        style_order: The order of styles to try.
+    """
+    expected_style, expected_sections = None, None
+    for style in style_order:
+        sections = parsers[style](Docstring(value))
+        if expected_sections is None or len(sections) > len(expected_sections):
+            expected_style, expected_sections = style, sections
+    inferred, sections = infer_docstring_style(Docstring(value), method="max_sections", style_order=list(style_order))
+    assert inferred is expected_style
+    assert len(sections) == len(expected_sections)  # ty:ignore[invalid-argument-type]
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: ISC
+#
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# Tests for the batch docstring parsing API.
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe import ExprName, JSONEncoder, parse_all, temporary_visited_package
+
+if TYPE_CHECKING:
+    from griffe import Module
+
+_code = '''
+"""Module docstring."""
+
+class Thing:
+    """A thing."""
+
+def func(thing: Thing) -> int:
+    """Do something.
+
+    Parameters:
+        thing: The thing.
+        missing: Not a parameter.
+
+    Returns:
+        A number.
+    """
+'''
+
+
+def _parsed(module: Module) -> str:
+    return json.dumps([obj.docstring.parsed for obj in (module, module["Thing"], module["func"])], cls=JSONEncoder)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_all_docstrings(workers: int | None, caplog: pytest.LogCaptureFixture) -> None:
+    """Parse all docstrings of a module, sequentially or in parallel, and check warnings are logged."""
+    caplog.set_level(logging.WARNING)
+    with temporary_visited_package("package", {"__init__.py": _code}, docstring_parser="google") as module:
+        assert parse_all(module, workers=workers) == 3
+        assert all(obj.docstring._parsed is not None for obj in (module, module["Thing"], module["func"]))
+        assert any("'missing' does not appear in the function signature" in message for message in caplog.messages)
+        annotation = module["func"].docstring.parsed[1].value[0].annotation
+        assert isinstance(annotation, ExprName)
+        assert annotation.parent is module
+        assert annotation.resolved is module["Thing"]
+
+
+def test_parallel_parsing_gives_same_results() -> None:
+    """Parse docstrings in parallel and check results are the same as when parsing sequentially."""
+    with (
+        temporary_visited_package("package", {"__init__.py": _code}) as sequential,
+        temporary_visited_package("package", {"__init__.py": _code}) as parallel,
+    ):
+        parse_all(sequential, "google")
+        parse_all(parallel, "google", workers=2)
+        assert _parsed(sequential) == _parsed(parallel)
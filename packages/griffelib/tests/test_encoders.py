@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import json
 import sys
+from functools import partial
 from pathlib import Path
 
 import pytest
@@ -27,12 +28,17 @@ from jsonschema import ValidationError, validate
 
 from griffe import (
     Attribute,
+    BinaryEncoder,
     Class,
     Function,
     GriffeLoader,
+    JSONEncoder,
     Kind,
     Module,
     Object,
+    binary_decoder,
+    json_decoder,
+    lazy_json_decoder,
     temporary_inspected_package,
     temporary_visited_module,
 )
@@ -229,3 +235,147 @@ def test_json_schema_for_pep695_generics() -> None:
         with open("docs/schema.json", encoding="utf8") as f:  # noqa: PTH123
             schema = json.load(f)
         validate(data, schema)
+
+
+@pytest.mark.parametrize("full", [True, False])
+def test_streaming_json_matches_dictionaries(full: bool, tmp_path: Path) -> None:
+    """Streaming objects to a file produces the same JSON as serializing their dictionaries.
+
+    Parameters:
+        full: Whether to dump full data.
+        tmp_path: Pytest fixture.
+    """
+    module = GriffeLoader().load("griffe")
+    dump_options = {"indent": 2, "sort_keys": True}
+    output = tmp_path / "griffe.json"
+    with output.open("w", encoding="utf8") as file:
+        json.dump(module, file, cls=JSONEncoder, full=full, **dump_options)
+    expected = json.dumps(module.as_dict(full=full), cls=JSONEncoder, full=full, **dump_options)
+    assert output.read_text(encoding="utf8") == expected
+
+
+def test_binary_format_round_trips() -> None:
+    """Loading back binary data gives the same tree as the original one."""
+    loader = GriffeLoader()
+    module = loader.load("griffe")
+    dump_options = {"indent": 2, "sort_keys": True}
+    data = module.as_bytes()
+    assert len(data) < len(module.as_json(full=False))
+    reloaded = Module.from_bytes(data)
+    assert reloaded.as_json(full=False, **dump_options) == module.as_json(full=False, **dump_options)
+    assert reloaded.as_json(full=True, **dump_options) == module.as_json(full=True, **dump_options)
+
+    # Names in expressions are attached to their scope again, to allow resolving them.
+    assert reloaded["_internal.models.Class"].bases[0].canonical_path == "griffe._internal.models.Object"
+
+    # Won't work if the data doesn't represent the type requested.
+    with pytest.raises(TypeError, match="provided binary object is not of type"):
+        Function.from_bytes(data)
+
+
+def test_binary_format_keeps_members_of_functions() -> None:
+    """Nested functions, imports and docstrings are loaded back as they were."""
+    with temporary_visited_module(
+        """
+        def func(a: int = 0) -> list[str]:
+            '''First line.
+                Indented line.
+            '''
+            import os.path
+            def inner(): ...
+        """,
+    ) as module:
+        reloaded = Module.from_bytes(module.as_bytes())
+        assert reloaded.as_json(full=True) == module.as_json(full=True)
+        assert reloaded["func"].docstring.value == module["func"].docstring.value
+
+
+def test_binary_format_keeps_names_in_exports() -> None:
+    """Names in `__all__` values are loaded back as names, attached to their module."""
+    with temporary_visited_module(
+        """
+        from os import path
+        from package import submodule
+        __all__ = ["x", path, *submodule.__all__]
+        x = 0
+        """,
+    ) as module:
+        reloaded = Module.from_bytes(module.as_bytes())
+        assert reloaded.exports == module.exports
+        assert isinstance(reloaded.exports[0], str)
+        assert reloaded.exports[1].parent is reloaded
+        assert reloaded.exports[1].canonical_path == "os.path"
+        assert reloaded.exports[2].canonical_path == "package.submodule.__all__"
+
+
+def test_binary_encoder_handles_dictionaries() -> None:
+    """Dictionaries of packages, as dumped by the CLI, are encoded and decoded."""
+    with temporary_visited_module("x: int = 1") as module:
+        reloaded = binary_decoder(BinaryEncoder().encode({"module": module}))
+        assert list(reloaded) == ["module"]
+        assert reloaded["module"].as_json() == module.as_json()
+
+
+def test_binary_decoder_rejects_invalid_data() -> None:
+    """Data not produced by the binary encoder is rejected."""
+    with pytest.raises(ValueError, match="not in Griffe's binary format"):
+        binary_decoder(b"{}")
+    with pytest.raises(ValueError, match="not in Griffe's binary format"):
+        binary_decoder(b"GRIFFE")
+
+
+# YORE: EOL 3.12: Remove block.
+# YORE: EOL 3.11: Remove line.
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="Python less than 3.12 does not have PEP 695 generics")
+def test_binary_format_pep695_generics() -> None:
+    """Test binary serialization and de-serialization of PEP 695 generics."""
+    with temporary_visited_module(
+        """
+        class Class[X: Exception]: pass
+        def func[**P, T, *R](arg: T, *args: P.args, **kwargs: P.kwargs) -> tuple[*R]: pass
+        type TA[T: (int, str)] = dict[str, T]
+        """,
+    ) as module:
+        reloaded = Module.from_bytes(module.as_bytes())
+        assert reloaded.as_json(full=True) == module.as_json(full=True)
+
+
+@pytest.mark.parametrize("serialization_format", ["json", "binary"])
+def test_lazy_decoding(serialization_format: str) -> None:
+    """Members are decoded only when accessed, and give the same tree.
+
+    Parameters:
+        serialization_format: The serialization format.
+    """
+    module = GriffeLoader().load("griffe")
+    if serialization_format == "json":
+        reloaded = Module.from_json(module.as_json(), lazy=True)
+    else:
+        reloaded = Module.from_bytes(module.as_bytes(), lazy=True)
+
+    # Accessing a member only decodes this member (and not its siblings).
+    assert reloaded.get_member("_internal.models.Class").path == "griffe._internal.models.Class"
+    assert isinstance(dict.__getitem__(reloaded.members, "_internal"), Module)
+    assert not isinstance(dict.__getitem__(reloaded.members, "__main__"), Object)
+    assert "__main__" in reloaded.members
+
+    # Iterating on members decodes them all.
+    assert reloaded.as_json(full=True) == module.as_json(full=True)
+
+
+def test_lazy_json_decoder_handles_dictionaries() -> None:
+    """Dictionaries of packages, as dumped by the CLI, are decoded lazily."""
+    with temporary_visited_module("class A:\n    x: int = 1") as module:
+        reloaded = lazy_json_decoder(json.loads(json.dumps({"module": module}, cls=JSONEncoder)))
+        assert reloaded["module"]["A.x"].annotation.name == "int"
+        assert reloaded["module"].as_json() == module.as_json()
+
+
+def test_json_decoder_interns_names_and_paths() -> None:
+    """Share equal names and paths between decoded objects."""
+    code = "from collections.abc import Mapping\nclass A:\n    from collections.abc import Mapping"
+    with temporary_visited_module(code) as module:
+        data = module.as_json(full=True)
+    reloaded = json.loads(data, object_hook=partial(json_decoder, names={}))
+    assert reloaded.imports["Mapping"] is reloaded["A"].imports["Mapping"]
+    assert reloaded["Mapping"].target_path is reloaded["A.Mapping"].target_path
@@ -33,6 +33,7 @@ from griffe import (
     ObjectNode,
     load_extensions,
     sys_path,
+    temporary_pypackage,
     temporary_visited_module,
     temporary_visited_package,
 )
@@ -325,3 +326,59 @@ def test_load_events() -> None:
         "on_type_alias",
     ]
     assert set(events) == set(extension.records)
+
+
+def test_only_calling_overridden_hooks() -> None:
+    """Only call hooks overridden by extensions, including hooks set on instances and custom events."""
+    calls = []
+
+    class ClassExtension(Extension):
+        def on_class(self, *, cls: Class, **kwargs: Any) -> None:  # noqa: ARG002
+            calls.append(("on_class", cls.name))
+
+    class CustomExtension:
+        def on_custom(self, **kwargs: Any) -> None:
+            calls.append(("on_custom", kwargs["value"]))
+
+    instance_extension = Extension()
+    instance_extension.on_function = lambda *, func, **kwargs: calls.append(("on_function", func.name))  # ty:ignore[invalid-assignment]
+
+    extensions = load_extensions(ClassExtension, instance_extension)
+    assert extensions.listens_to("on_class")
+    assert extensions.listens_to("on_function")
+    assert not extensions.listens_to("on_attribute")
+    assert not extensions.listens_to("on_custom")
+    extensions.add(CustomExtension())  # ty:ignore[invalid-argument-type]
+    assert extensions.listens_to("on_custom")
+
+    with temporary_visited_package("package", {"__init__.py": "class A: ...\ndef f(): ..."}, extensions=extensions):
+        pass
+    extensions.call("on_custom", value=1)
+    assert calls == [("on_class", "A"), ("on_function", "f"), ("on_custom", 1)]
+
+
+def test_profiling_extension_hooks() -> None:
+    """Record number of calls and time spent in hooks of each extension."""
+
+    class ClassExtension(Extension):
+        def on_class(self, *, cls: Class, **kwargs: Any) -> None:
+            pass
+
+    name = f"{ClassExtension.__module__}.{ClassExtension.__qualname__}"
+    modules = {"__init__.py": "class A: ...\nclass B: ..."}
+    with temporary_pypackage("package", modules) as tmp_package:
+        extensions = load_extensions(ClassExtension)
+        GriffeLoader(extensions=extensions, search_paths=[tmp_package.tmpdir]).load("package")
+        assert extensions.timings == {}
+
+        extensions.profile = True
+        loader = GriffeLoader(extensions=extensions, search_paths=[tmp_package.tmpdir])
+        loader.load("package")
+
+    calls, duration = extensions.timings[name]["on_class"]
+    assert calls == 2
+    assert duration >= 0
+    assert "on_package" in extensions.timings["griffe._internal.extensions.dataclasses.DataclassesExtension"]
+    stats = loader.stats()
+    assert stats.time_spent_by_extension[name]["on_class"]["calls"] == 2
+    assert f"  {name}: " in stats.as_text()
@@ -19,12 +19,14 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
 from griffe import Module, ModuleFinder, NamespacePackage, Package, temporary_pypackage
+from griffe._internal import finder as finder_module
 from griffe._internal.finder import _handle_editable_module, _handle_pth_file
 
 
@@ -340,3 +342,103 @@ def test_not_finding_namespace_package_twice() -> None:
             os.chdir(old)
         assert isinstance(found, NamespacePackage)
         assert len(found.path) == 1
+
+
+def test_reusing_persisted_directory_contents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Contents of directories are persisted, and scanned again only when directories change."""
+    index_path = tmp_path / "finder.pickle"
+    with temporary_pypackage("pkg", ["mod.py", "sub/mod.py"]) as tmp_package:
+        # Pretend the directories were modified a while ago, so that their contents are persisted.
+        for directory in (tmp_package.tmpdir, tmp_package.path, tmp_package.path / "sub"):
+            os.utime(directory, ns=(0, 0))
+        finder = ModuleFinder(search_paths=[tmp_package.tmpdir], index_path=index_path)
+        package = finder.find_package("pkg")
+        expected = [path for _, path in finder.submodules(Module("pkg", filepath=package.path))]  # ty:ignore[invalid-argument-type]
+        finder.save_index()
+        assert index_path.exists()
+
+        def scandir(path: str) -> None:
+            raise AssertionError(f"{path} was scanned again")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(os, "scandir", scandir)
+            finder = ModuleFinder(search_paths=[tmp_package.tmpdir], index_path=index_path)
+            package = finder.find_package("pkg")
+            found = [path for _, path in finder.submodules(Module("pkg", filepath=package.path))]  # ty:ignore[invalid-argument-type]
+        assert found == expected
+
+        # Adding a module changes the directory modification time, invalidating its persisted contents.
+        (tmp_package.path / "new.py").touch()
+        finder = ModuleFinder(search_paths=[tmp_package.tmpdir], index_path=index_path)
+        found = [path for _, path in finder.submodules(Module("pkg", filepath=package.path))]  # ty:ignore[invalid-argument-type]
+        assert tmp_package.path / "new.py" in found
+
+
+def test_pruning_deleted_directories_from_persisted_contents(tmp_path: Path) -> None:
+    """Persisted contents of deleted directories are removed from the index."""
+    index_path = tmp_path / "finder.pickle"
+    with temporary_pypackage("pkg", ["mod.py", "sub/mod.py"]) as tmp_package:
+        subdirectory = tmp_package.path / "sub"
+        for directory in (tmp_package.tmpdir, tmp_package.path, subdirectory):
+            os.utime(directory, ns=(0, 0))
+        finder = ModuleFinder(search_paths=[tmp_package.tmpdir], index_path=index_path)
+        module = Module("pkg", filepath=finder.find_package("pkg").path)  # ty:ignore[invalid-argument-type]
+        finder.submodules(module)
+        finder.save_index()
+        assert subdirectory in ModuleFinder(index_path=index_path)._index
+
+        shutil.rmtree(subdirectory)
+        finder = ModuleFinder(search_paths=[tmp_package.tmpdir], index_path=index_path)
+        finder.submodules(module)
+        finder.save_index()
+        assert subdirectory not in ModuleFinder(index_path=index_path)._index
+
+
+def test_caching_parsed_pth_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Parsed `.pth` files are reused by finders, until they change."""
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    directory = tmp_path / "src"
+    directory.mkdir()
+    pth_file = site_packages / "hello.pth"
+    pth_file.write_text(f"{directory}\n", encoding="utf8")
+    # Pretend the file was written a while ago, so that its parsed contents are cached.
+    os.utime(pth_file, ns=(0, 0))
+    assert directory in ModuleFinder(search_paths=[site_packages]).search_paths
+
+    def handle_pth_file(path: Path, editable_modules: list[Path] | None = None) -> None:  # noqa: ARG001
+        raise AssertionError(f"{path} was parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(finder_module, "_handle_pth_file", handle_pth_file)
+        assert directory in ModuleFinder(search_paths=[site_packages]).search_paths
+
+    # Changing the file invalidates its parsed contents.
+    other_directory = tmp_path / "other"
+    other_directory.mkdir()
+    pth_file.write_text(f"{other_directory}\n", encoding="utf8")
+    search_paths = ModuleFinder(search_paths=[site_packages]).search_paths
+    assert other_directory in search_paths
+    assert directory not in search_paths
+
+
+def test_persisting_pth_files_parsed_by_other_finders(tmp_path: Path) -> None:
+    """Parsed `.pth` files reused from other finders of the process are persisted in the index."""
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    pth_file = site_packages / "hello.pth"
+    pth_file.write_text(f"{tmp_path}\n", encoding="utf8")
+    for path in (site_packages, pth_file):
+        os.utime(path, ns=(0, 0))
+    index_path = tmp_path / "finder.pickle"
+    ModuleFinder(search_paths=[site_packages], index_path=index_path).save_index()
+
+    # Persist contents of directories only, as if the `.pth` file was parsed by a finder without index.
+    finder = ModuleFinder(index_path=index_path)
+    finder._pth_files.clear()
+    finder._index_changed = True
+    finder.save_index()
+
+    finder = ModuleFinder(search_paths=[site_packages], index_path=index_path)
+    finder.save_index()
+    assert pth_file in ModuleFinder(index_path=index_path)._pth_files
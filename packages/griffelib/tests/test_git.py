@@ -20,11 +20,12 @@ from __future__ import annotations
 
 import shutil
 from subprocess import run
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from griffe import Module, load_git
+from griffe import GriffeLoader, Module, load_git
+from griffe._internal import git
 from tests import FIXTURES_DIR
 
 if TYPE_CHECKING:
@@ -53,6 +54,19 @@ def _copy_contents(src: Path, dst: Path) -> None:
             shutil.copy(src_path, dst_path)
 
 
+def _git_output(repo: Path, *args: str) -> str:
+    """Run a Git command in a repository and return its output.
+
+    Parameters:
+        repo: the repository
+        *args: the Git command arguments
+
+    Returns:
+        The standard output of the command.
+    """
+    return run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True, encoding="utf8").stdout
+
+
 @pytest.fixture
 def git_repo(tmp_path: Path, gitconfig: GitConfig) -> Path:  # noqa: ARG001
     """Fixture that creates a git repo with multiple tagged versions.
@@ -99,6 +113,19 @@ def test_load_git(git_repo: Path) -> None:
     assert v2.attributes["__version__"].value == "'0.2.0'"
 
 
+def test_load_git_without_worktree(git_repo: Path) -> None:
+    """Test that loading a Git reference does not create worktrees or branches.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    branches = _git_output(git_repo, "branch")
+    load_git(MODULE_NAME, ref="v0.1.0", repo=git_repo)
+    worktrees = _git_output(git_repo, "worktree", "list")
+    assert len(worktrees.splitlines()) == 1
+    assert _git_output(git_repo, "branch") == branches
+
+
 def test_load_git_errors(git_repo: Path) -> None:
     """Test that we get informative errors for various invalid inputs.
 
@@ -108,13 +135,53 @@ def test_load_git_errors(git_repo: Path) -> None:
     with pytest.raises(OSError, match="Not a git repository"):
         load_git(MODULE_NAME, ref="v0.2.0", repo="not-a-repo")
 
-    with pytest.raises(RuntimeError, match="Could not create git worktree"):
+    with pytest.raises(RuntimeError, match="Could not read git reference"):
         load_git(MODULE_NAME, ref="invalid-tag", repo=git_repo)
 
     with pytest.raises(ImportError, match="ModuleNotFoundError: No module named 'not_a_real_module'"):
         load_git("not_a_real_module", ref="v0.2.0", repo=git_repo)
 
 
+def test_git_info_is_shared_by_packages_of_a_repository(git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that Git facts are fetched once per repository.
+
+    Parameters:
+        git_repo: temporary git repo
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    git_repo.joinpath("other_module.py").write_text("x = 0", encoding="utf8")
+    git_repo.joinpath("untracked_module.py").write_text("y = 0", encoding="utf8")
+    run(["git", "-C", str(git_repo), "add", "other_module.py"], check=True)
+    run(["git", "-C", str(git_repo), "commit", "-m", "other module"], check=True)
+    run(["git", "-C", str(git_repo), "remote", "add", "origin", "git@github.com:owner/my-repo.git"], check=True)
+    git_repo.joinpath(".gitignore").write_text("untracked_module.py", encoding="utf8")
+    commit_hash = _git_output(git_repo, "rev-parse", "HEAD").strip()
+
+    commands = []
+
+    def _git(*args: str, **kwargs: Any) -> str:
+        commands.append(args)
+        return original_git(*args, **kwargs)
+
+    original_git = git._git
+    monkeypatch.setattr(git, "_git", _git)
+    loader = GriffeLoader(search_paths=[git_repo])
+    my_module = loader.load(MODULE_NAME)
+    other_module = loader.load("other_module")
+    untracked_module = loader.load("untracked_module")
+    assert my_module.git_info is other_module.git_info
+    assert my_module.git_info.remote_url == "https://github.com/owner/my-repo"  # ty:ignore[possibly-missing-attribute]
+    assert my_module.git_info.commit_hash == commit_hash  # ty:ignore[possibly-missing-attribute]
+    assert untracked_module.git_info is None
+    assert len(commands) == 3
+
+    # Git facts are fetched again when reloading modules.
+    git_repo.joinpath("other_module.py").write_text("x = 1", encoding="utf8")
+    run(["git", "-C", str(git_repo), "commit", "-am", "change other module"], check=True)
+    [other_module] = loader.reload([git_repo / "other_module.py"])
+    assert other_module.git_info.commit_hash == _git_output(git_repo, "rev-parse", "HEAD").strip()  # ty:ignore[possibly-missing-attribute]
+
+
 def test_git_failures(tmp_path: Path) -> None:
     """Test failures to use Git."""
     pytest.importorskip("griffecli")
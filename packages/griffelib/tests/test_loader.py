@@ -19,14 +19,18 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import sys
 from textwrap import dedent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import pytest
 
 from griffe import (
     ExprName,
+    Extension,
     GriffeLoader,
+    load_extensions,
     temporary_inspected_package,
     temporary_pyfile,
     temporary_pypackage,
@@ -36,7 +40,7 @@ from griffe import (
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from griffe import Alias
+    from griffe import Alias, Function
 
 
 def test_has_docstrings_does_not_try_to_resolve_alias() -> None:
@@ -552,3 +556,310 @@ def test_deferred_finder(tmp_path: Path) -> None:
     l1_result = l1.load("ns")
     l2_result = l2.load("ns")
     assert l1_result.as_dict() == l2_result.as_dict()
+
+
+def test_visiting_submodules_in_parallel() -> None:
+    """Load the same data when visiting submodules in worker processes."""
+    modules = {
+        "__init__.py": "from .a import f\n__all__ = ['f']",
+        "a.py": "def f(x: int) -> int:\n    '''Docstring.'''\n    return x",
+        "b.py": "from . import a\nclass B: ...",
+        "sub/__init__.py": "from ..a import f as g",
+        "sub/c.py": "from .. import b\nc: int = 0",
+        "broken.py": "def (",
+    }
+    with temporary_pypackage("package", modules) as tmp_package:
+        sequential_loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        parallel_loader = GriffeLoader(search_paths=[tmp_package.tmpdir], workers=2)
+        sequential = sequential_loader.load("package")
+        parallel = parallel_loader.load("package")
+        assert "broken" not in parallel.members
+        assert parallel.as_json(full=True) == sequential.as_json(full=True)
+        assert parallel["sub.c"].modules_collection is parallel_loader.modules_collection
+        assert parallel["sub.c"].lines == sequential["sub.c"].lines
+        assert parallel_loader.resolve_aliases() == sequential_loader.resolve_aliases()
+
+
+def test_loading_many_packages_at_once() -> None:
+    """Load several packages in a shared pool of workers, expanding wildcards across them."""
+    with (
+        temporary_pypackage("package_a", {"__init__.py": "from package_b.mod import *", "a.py": "a = 0"}) as pkg_a,
+        temporary_pypackage("package_b", {"mod.py": "def f(): ...\nclass C: ..."}) as pkg_b,
+    ):
+        loader = GriffeLoader(search_paths=[pkg_a.tmpdir, pkg_b.tmpdir], allow_inspection=False)
+        objects = loader.load_many(["package_a", "package_a.a", "package_b", "missing"], workers=2)
+        assert set(objects) == {"package_a", "package_a.a", "package_b"}
+        assert objects["package_a.a"] is objects["package_a"]["a"]
+        assert objects["package_a"]["a"].modules_collection is loader.modules_collection
+        # Package B was not loaded yet when package A was visited, yet the wildcard import was expanded.
+        assert set(objects["package_a"].members) == {"a", "f", "C"}
+        assert objects["package_a"]["f"].target is objects["package_b"]["mod.f"]
+
+
+def test_inspecting_modules_in_sandboxed_workers() -> None:
+    """Load modules by inspecting them in worker processes, isolating failures."""
+    modules = {
+        "__init__.py": "from .a import f",
+        "a.py": "def f(x: int = 0) -> int:\n    '''Docstring.'''\n    return x",
+        "b.py": "class B:\n    '''Docstring.'''",
+        "crash.py": "import os\nos._exit(1)",
+        "slow.py": "import time\ntime.sleep(60)",
+    }
+    with temporary_pypackage("sandboxed_package", modules) as tmp_package:
+        loader = GriffeLoader(
+            search_paths=[tmp_package.tmpdir],
+            force_inspection=True,
+            inspection_workers=2,
+            inspection_timeout=5,
+        )
+        package = loader.load("sandboxed_package")
+        assert "sandboxed_package" not in sys.modules
+        assert "crash" not in package.members
+        assert "slow" not in package.members
+        assert package["b"].parent is package
+        assert package["b"].modules_collection is loader.modules_collection
+        assert package["b.B"].docstring.value == "Docstring."
+        assert package["a.f"].lineno == 1
+        # Workers are stopped at the end of loading.
+        assert not any(process.name == "griffe-inspection-worker" for process in multiprocessing.active_children())
+
+
+def test_importing_modules_not_found_on_disk_in_sandboxed_workers() -> None:
+    """Import modules that are not found on disk in worker processes too."""
+    module_name = next(name for name in sorted(sys.builtin_module_names) if name not in sys.modules)
+    loader = GriffeLoader(inspection_workers=1)
+    module = loader.load(module_name)
+    assert module.path == module_name
+    assert module_name not in sys.modules
+
+
+def test_saving_finder_index_once_per_load(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Persist the contents of scanned directories once, at the end of loading.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+        monkeypatch: Pytest fixture.
+    """
+    for name in ("package1", "package2"):
+        tmp_path.joinpath(name).mkdir()
+        tmp_path.joinpath(name, "__init__.py").write_text("from .module import x", encoding="utf8")
+        tmp_path.joinpath(name, "module.py").write_text("x = 0", encoding="utf8")
+    loader = GriffeLoader(search_paths=[tmp_path], cache_dir=tmp_path / "cache")
+    saves = []
+    monkeypatch.setattr(loader.finder, "save_index", lambda: saves.append(True))
+    loader.load_many(["package1", "package2"])
+    assert len(saves) == 1
+
+
+def test_caching_visited_modules(tmp_path: Path) -> None:
+    """Reuse cached modules when their sources did not change."""
+    cache_dir = tmp_path / "cache"
+    modules = {"__init__.py": "from .a import f", "a.py": "def f():\n    '''Docstring.'''", "b.py": "b = 0"}
+    with temporary_pypackage("package", modules) as tmp_package:
+        package = GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir).load("package")
+        assert len(list(cache_dir.rglob("*.pickle"))) == 3
+
+        cached_loader = GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir)
+        cached_package = cached_loader.load("package")
+        assert cached_package.as_json(full=True) == package.as_json(full=True)
+        assert cached_package["a"].parent is cached_package
+        assert cached_package["a"].lines_collection is cached_loader.lines_collection
+        assert cached_package["a.f"].source == "def f():\n    '''Docstring.'''"
+
+        tmp_package.path.joinpath("b.py").write_text("b = 1", encoding="utf8")
+        modified_package = GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir).load("package")
+        assert modified_package["b.b"].value == "1"
+        assert len(list(cache_dir.rglob("*.pickle"))) == 4
+
+        GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir, docstring_parser="google").load("package")
+        assert len(list(cache_dir.rglob("*.pickle"))) == 7
+
+
+def test_not_caching_modules_for_extensions_hooking_onto_visits(tmp_path: Path) -> None:
+    """Visit or inspect modules again when extensions must see them being built."""
+    cache_dir = tmp_path / "cache"
+
+    class RecordFunctions(Extension):
+        def __init__(self) -> None:
+            self.functions: list[str] = []
+
+        def on_function_instance(self, *, func: Function, **kwargs: Any) -> None:  # noqa: ARG002
+            self.functions.append(func.path)
+
+    with temporary_pypackage("cpkg", {"__init__.py": "def f(): ..."}) as tmp_package:
+        for force_inspection in (False, False, True, True):
+            extension = RecordFunctions()
+            loader = GriffeLoader(
+                search_paths=[tmp_package.tmpdir],
+                cache_dir=cache_dir,
+                extensions=load_extensions(extension),
+                force_inspection=force_inspection,
+            )
+            loader.load("cpkg")
+            assert extension.functions == ["cpkg.f"]
+
+
+def test_caching_inspected_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse cached inspected modules without inspecting them again."""
+    cache_dir = tmp_path / "cache"
+    modules = {"__init__.py": "", "a.py": "def f(x: int) -> int: ..."}
+    with temporary_pypackage("cached_inspected_package", modules) as tmp_package:
+        package = GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir, force_inspection=True).load(
+            "cached_inspected_package",
+        )
+        assert len(list(cache_dir.rglob("*.pickle"))) == 2
+
+        def inspect(*args: Any, **kwargs: Any) -> NoReturn:  # noqa: ARG001
+            raise AssertionError("Cached modules must not be inspected")
+
+        monkeypatch.setattr("griffe._internal.loader.inspect", inspect)
+        cached_loader = GriffeLoader(search_paths=[tmp_package.tmpdir], cache_dir=cache_dir, force_inspection=True)
+        cached_package = cached_loader.load("cached_inspected_package")
+        assert cached_package.as_json(full=True) == package.as_json(full=True)
+        assert cached_package["a"].parent is cached_package
+        assert cached_package["a"].modules_collection is cached_loader.modules_collection
+
+        # Inspections depend on import paths.
+        monkeypatch.undo()
+        GriffeLoader(
+            search_paths=[tmp_package.tmpdir, tmp_path],
+            cache_dir=cache_dir,
+            force_inspection=True,
+        ).load("cached_inspected_package")
+        assert len(list(cache_dir.rglob("*.pickle"))) == 4
+
+
+def test_resolving_aliases_waiting_on_external_packages() -> None:
+    """Resolve aliases whose targets appear in packages loaded during resolution."""
+    with (
+        temporary_pypackage(
+            "pkg_a",
+            {"__init__.py": "from pkg_b import x\nfrom pkg_a.mod import z", "mod.py": "z = 0"},
+        ) as pkg_a,
+        temporary_pypackage("pkg_b", {"__init__.py": "from pkg_c import y as x"}) as pkg_b,
+        temporary_pypackage("pkg_c", {"__init__.py": "y = 1\nfrom pkg_d import w"}) as pkg_c,
+    ):
+        loader = GriffeLoader(search_paths=[pkg_a.tmpdir, pkg_b.tmpdir, pkg_c.tmpdir])
+        package = loader.load("pkg_a")
+        unresolved, iterations = loader.resolve_aliases(external=True, implicit=True)
+        assert package["x"].resolved
+        assert package["x"].final_target.path == "pkg_c.y"
+        assert package["z"].resolved
+        assert unresolved == {"pkg_c.w"}
+        assert iterations > 1
+
+
+def test_reloading_changed_modules() -> None:
+    """Reload changed modules, their dependents and new modules, keeping the rest."""
+    modules = {
+        "__init__.py": "from .a import *\nfrom .b import g",
+        "a.py": "__all__ = ['f']\ndef f(): ...",
+        "b.py": "def g(): ...",
+        "c.py": "c = 0",
+    }
+    with temporary_pypackage("package", modules) as tmp_package:
+        loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        package = loader.load("package")
+        loader.resolve_aliases(implicit=True)
+        old_b = package["b"]
+        old_c = package["c"]
+        assert package["g"].target is old_b["g"]
+
+        tmp_package.path.joinpath("a.py").write_text("__all__ = ['h']\ndef h(): ...", encoding="utf8")
+        tmp_package.path.joinpath("b.py").write_text("def g(x): ...", encoding="utf8")
+        tmp_package.path.joinpath("d.py").write_text("d = 1", encoding="utf8")
+        reloaded = loader.reload(
+            [tmp_package.path / "a.py", tmp_package.path / "b.py", tmp_package.path / "d.py", "README.md"],
+        )
+
+        package = loader.modules_collection["package"]
+        assert {module.path for module in reloaded} == {"package", "package.a", "package.b", "package.d"}
+        assert package["c"] is old_c
+        assert "f" not in package.members
+        assert package["h"].target_path == "package.a.h"
+        assert package["g"].target is package["b.g"]
+        assert package["g"].parameters[0].name == "x"
+        assert "package.g" not in old_b["g"].aliases
+        assert package["d.d"].value == "1"
+
+
+def test_reloading_deleted_and_broken_modules() -> None:
+    """Remove deleted modules and keep previous versions of broken ones."""
+    with temporary_pypackage("package", {"__init__.py": "", "a.py": "a = 0", "b.py": "b = 0"}) as tmp_package:
+        loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        package = loader.load("package")
+        old_b = package["b"]
+
+        tmp_package.path.joinpath("a.py").unlink()
+        tmp_package.path.joinpath("b.py").write_text("def (", encoding="utf8")
+        assert loader.reload([tmp_package.path / "a.py", tmp_package.path / "b.py"]) == []
+        assert "a" not in package.members
+        assert package["b"] is old_b
+
+
+def test_reloading_top_level_modules_with_stubs(tmp_path: Path) -> None:
+    """Reload both a top-level module and its stubs, keeping the previous version if one of them is broken.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+    """
+    module_path = tmp_path / "module.py"
+    stubs_path = tmp_path / "module.pyi"
+    module_path.write_text("def f(x): ...", encoding="utf8")
+    stubs_path.write_text("def f(x: int) -> None: ...", encoding="utf8")
+    loader = GriffeLoader(search_paths=[tmp_path])
+    old_module = loader.load("module")
+
+    stubs_path.write_text("def (", encoding="utf8")
+    assert loader.reload([module_path, stubs_path]) == []
+    assert loader.modules_collection["module"] is old_module
+
+    module_path.write_text("def f(x): ...\ndef g(): ...", encoding="utf8")
+    stubs_path.write_text("def f(x: str) -> None: ...", encoding="utf8")
+    assert [module.path for module in loader.reload([module_path, stubs_path])] == ["module"]
+    module = loader.modules_collection["module"]
+    assert module is not old_module
+    assert module.filepath == module_path
+    assert str(module["f"].parameters["x"].annotation) == "str"
+    assert "g" in module.members
+
+
+def test_profiling_loading_phases() -> None:
+    """Record the time spent in each loading phase, by module."""
+    modules = {"__init__.py": "from .a import *\nfrom .b import g", "a.py": "def f(): ...", "b.py": "def g(): ..."}
+    with temporary_pypackage("package", modules) as tmp_package:
+        loader = GriffeLoader(search_paths=[tmp_package.tmpdir], profile=True)
+        loader.load("package")
+        loader.resolve_aliases(implicit=True)
+        stats = loader.stats()
+
+        # Without profiling, only visits are measured.
+        unprofiled_loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        unprofiled_loader.load("package")
+        unprofiled_loader.resolve_aliases(implicit=True)
+        assert set(unprofiled_loader.stats().time_spent_by_module["package"]) == {"compiling", "visiting"}
+
+    assert set(stats.time_spent_by_module) >= {"package", "package.a", "package.b"}
+    assert {"reading", "compiling", "visiting"} <= set(stats.time_spent_by_module["package.a"])
+    assert {"exports", "wildcards", "git", "aliases", "extensions"} <= set(stats.time_spent_by_module["package"])
+    assert stats.time_spent_visiting == stats.time_spent_by_phase["compiling"] + stats.time_spent_by_phase["visiting"]
+    assert [module for module, _ in stats.slowest_modules(2)] == [module for module, _ in stats.slowest_modules()[:2]]
+    assert stats.as_dict()["time_spent_by_phase"] == stats.time_spent_by_phase
+    assert "Slowest modules" in stats.as_text()
+
+
+def test_sharing_interned_paths_between_modules() -> None:
+    """Share equal import paths and exports between the modules of a same loader."""
+    modules = {
+        "__init__.py": "__all__ = ['a', 'b']",
+        "a.py": "from collections.abc import Mapping\n__all__ = ['Mapping']",
+        "b.py": "from collections.abc import Mapping\n__all__ = ['Mapping']",
+    }
+    with temporary_pypackage("interning_package", modules) as tmp_package:
+        loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        package = loader.load("interning_package")
+        path_a = package["a"].imports["Mapping"]
+        path_b = package["b"].imports["Mapping"]
+        assert path_a == "collections.abc.Mapping"
+        assert path_a is path_b
+        assert package["a"].exports[0] is package["b"].exports[0]
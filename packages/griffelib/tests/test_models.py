@@ -19,14 +19,17 @@
 from __future__ import annotations
 
 import sys
+import weakref
 from copy import deepcopy
 from textwrap import dedent
 
 import pytest
 
 from griffe import (
+    Alias,
     Attribute,
     Class,
+    Decorator,
     Docstring,
     Function,
     GriffeLoader,
@@ -39,6 +42,7 @@ from griffe import (
     TypeParameterKind,
     TypeParameters,
     module_vtree,
+    parsed_docstrings_cache,
     temporary_inspected_module,
     temporary_pypackage,
     temporary_visited_module,
@@ -555,6 +559,66 @@ def test_delete_parameters() -> None:
     assert len(parameters) == 0
 
 
+def test_get_parameters_by_name_after_changes() -> None:
+    """Parameters are found by name after being added, replaced, renamed or deleted."""
+    parameters = Parameters(Parameter("a"), Parameter("b"), Parameter("args", kind=ParameterKind.var_positional))
+    assert parameters["*args"] is parameters[2]
+    del parameters["a"]
+    assert parameters["b"] is parameters[0]
+    assert parameters["args"] is parameters[1]
+    parameters[0] = Parameter("c")
+    assert "b" not in parameters
+    assert parameters["c"] is parameters[0]
+    parameters.add(Parameter("d"))
+    assert parameters["d"] is parameters[2]
+    with pytest.raises(KeyError):
+        parameters["a"]
+    parameters[0].name = "z"
+    assert "z" in parameters
+    assert parameters["z"] is parameters[0]
+    assert "c" not in parameters
+
+
+def test_parameters_have_no_instance_dictionary() -> None:
+    """Parameters and type parameters only store their slots, and still support weak references."""
+    for parameter in (Parameter("x"), TypeParameter("T", kind=TypeParameterKind.type_var)):
+        assert not hasattr(parameter, "__dict__")
+        assert weakref.ref(parameter)() is parameter
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Module("module"),
+        Class("cls"),
+        Function("func"),
+        Attribute("attr"),
+        Alias("alias", "module.attr"),
+        Docstring("Docstring."),
+        Decorator("decorator", lineno=1, endlineno=1),
+    ],
+)
+def test_models_have_no_instance_dictionary(obj: object) -> None:
+    """Models only store their slots, and still support weak references."""
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.undeclared = True  # ty:ignore[unresolved-attribute]
+    assert weakref.ref(obj)() is obj
+
+
+def test_allocating_empty_containers_lazily() -> None:
+    """Empty containers of objects are allocated on first access, and extra data still works."""
+    func = Function("func")
+    assert func._members is None
+    assert func._extra is None
+    func.extra["my_extension"]["key"] = "value"
+    assert func.extra == {"my_extension": {"key": "value"}}
+    assert "labels" not in func.as_dict()
+    assert func._labels is None
+    func.labels.add("property")
+    assert func.as_dict()["labels"] == {"property"}
+
+
 def test_not_resolving_attribute_value_to_itself() -> None:
     """Attribute values with same name don't resolve to themselves."""
     with temporary_visited_module(
@@ -676,3 +740,201 @@ def test_annotation_resolution() -> None:
         assert module["C.func"].resolve("T") == "module.C[T]"
         with pytest.raises(NameResolutionError):
             module["C.func"].resolve("Y")
+
+
+def test_updating_cached_paths() -> None:
+    """Paths are updated when objects are renamed or moved."""
+    module = Module("module")
+    cls = Class("A")
+    module.set_member("A", cls)
+    attr = Attribute("attr")
+    cls.set_member("attr", attr)
+    alias = Alias("B", cls)
+    module.set_member("B", alias)
+    assert attr.path == "module.A.attr"
+    assert alias.path == "module.B"
+
+    module.name = "renamed"
+    assert cls.path == "renamed.A"
+    assert attr.path == "renamed.A.attr"
+    assert attr.canonical_path == "renamed.A.attr"
+    assert alias.path == "renamed.B"
+    assert alias.canonical_path == "renamed.A"
+
+    other = Module("other")
+    other.set_member("A", cls)
+    assert attr.path == "other.A.attr"
+    alias.name = "C"
+    assert alias.path == "renamed.C"
+
+
+def test_invalidating_cached_mro_and_inherited_members() -> None:
+    """MRO and inherited members are recomputed when the tree changes."""
+    code = """
+    class A:
+        def a(self): ...
+
+    class B:
+        def b(self): ...
+
+    class C(A):
+        def c(self): ...
+    """
+    with temporary_visited_module(code) as module:
+        assert [base.name for base in module["C"].mro()] == ["A"]
+        assert set(module["C"].inherited_members) == {"a"}
+        assert module["C"].inherited_members["a"] is module["C"].inherited_members["a"]
+
+        module["A"].set_member("x", Attribute("x"))
+        assert set(module["C"].inherited_members) == {"a", "x"}
+
+        module["A"].del_member("x")
+        assert set(module["C"].inherited_members) == {"a"}
+
+        module["C"].bases = ["module.B", "module.A"]
+        assert [base.name for base in module["C"].mro()] == ["B", "A"]
+        assert set(module["C"].inherited_members) == {"a", "b"}
+
+        # Bases can be changed in place.
+        module["C"].bases.remove("module.B")
+        assert [base.name for base in module["C"].mro()] == ["A"]
+        assert set(module["C"].inherited_members) == {"a"}
+
+
+def test_keeping_cached_mro_and_inherited_members_on_unrelated_changes() -> None:
+    """MRO and inherited members stay memoized when unrelated objects change."""
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": "",
+            "base.py": "class Base:\n    def a(self): ...\nclass Other: ...",
+            "derived.py": "from package.base import Base\nclass Derived(Base): ...",
+        },
+    ) as package:
+        derived = package["derived.Derived"]
+        inherited = derived.inherited_members["a"]
+        assert derived.mro() == [package["base.Base"]]
+
+        package["base.Other"].set_member("x", Attribute("x"))
+        package.set_member("unrelated", Module("unrelated"))
+        Module("other").set_member("Base", Class("Base"))
+        assert derived.inherited_members["a"] is inherited
+
+        # Changes to classes of the MRO, or to the objects used to resolve bases, are not unrelated.
+        package["base.Base"].set_member("b", Attribute("b"))
+        assert set(derived.inherited_members) == {"a", "b"}
+        assert derived.inherited_members["a"] is not inherited
+        package["base"].set_member("Base", Class("Base"))
+        assert derived.mro() == [package["base.Base"]]
+        assert not derived.inherited_members
+
+        # Copies don't share memoized data or dependents with the original tree.
+        copied = deepcopy(package)
+        copied["base.Base"].set_member("c", Attribute("c"))
+        assert set(copied["derived.Derived"].inherited_members) == {"c"}
+        assert not derived.inherited_members
+
+
+def test_updating_mro_and_inherited_members_on_in_place_changes() -> None:
+    """MRO and inherited members are updated when bases or members of the MRO are changed in place."""
+    with temporary_visited_package(
+        "package",
+        {"__init__.py": "class A:\n    def a(self): ...\nclass C: ...\nclass D(C): ..."},
+    ) as package:
+        a, c, d = package["A"], package["C"], package["D"]
+        assert d.mro() == [c]
+        assert not d.inherited_members
+
+        c.bases.append("package.A")
+        assert d.mro() == [c, a]
+        assert set(d.inherited_members) == {"a"}
+
+        c.members["b"] = Attribute("b", parent=c)
+        assert set(d.inherited_members) == {"a", "b"}
+        del c.members["b"]
+        assert set(d.inherited_members) == {"a"}
+        d.members["a"] = Attribute("a", parent=d)
+        assert not d.inherited_members
+
+
+def test_sharing_parsed_sections_of_identical_docstrings() -> None:
+    """Parse identical docstrings once, unless their parents have different signatures."""
+    parsed_docstrings_cache.clear()
+    parsed_docstrings_cache.maxsize = 2
+    code = """
+        class A:
+            def f(self, x):
+                '''Summary.
+
+                Parameters:
+                    x: The value.
+                '''
+
+        class B(A):
+            def f(self, x):
+                '''Summary.
+
+                Parameters:
+                    x: The value.
+                '''
+
+        class C(A):
+            def f(self, y):
+                '''Summary.
+
+                Parameters:
+                    x: The value.
+                '''
+    """
+    try:
+        with temporary_visited_module(dedent(code), docstring_parser="google") as module:
+            parsed_a = module["A.f"].docstring.parsed
+            assert module["B.f"].docstring.parsed is parsed_a
+            assert module["C.f"].docstring.parsed is not parsed_a
+        assert (parsed_docstrings_cache.hits, parsed_docstrings_cache.misses) == (1, 2)
+
+        parsed_docstrings_cache.maxsize = 1
+        with temporary_visited_module('"""Other."""', docstring_parser="google") as module:
+            assert module.docstring.parsed
+        assert len(parsed_docstrings_cache) == 1
+        with temporary_visited_module(dedent(code), docstring_parser="google") as module:
+            assert module["A.f"].docstring.parsed is not parsed_a
+    finally:
+        parsed_docstrings_cache.maxsize = 0
+        parsed_docstrings_cache.clear()
+
+
+def test_not_sharing_parsed_sections_holding_expressions() -> None:
+    """Parse identical docstrings again when their sections hold expressions bound to their scope."""
+    parsed_docstrings_cache.clear()
+    parsed_docstrings_cache.maxsize = 16
+    code = """
+        class A:
+            class Item: ...
+            def get(self) -> Item:
+                '''Summary.
+
+                Returns:
+                    The item.
+                '''
+
+        class B:
+            class Item: ...
+            def get(self) -> Item:
+                '''Summary.
+
+                Returns:
+                    The item.
+                '''
+    """
+    try:
+        with temporary_visited_module(dedent(code), docstring_parser="google") as module:
+            parsed_a = module["A.get"].docstring.parsed
+            parsed_b = module["B.get"].docstring.parsed
+            assert parsed_b is not parsed_a
+            assert parsed_a[1].value[0].annotation.canonical_path == "module.A.Item"
+            assert parsed_b[1].value[0].annotation.canonical_path == "module.B.Item"
+        assert len(parsed_docstrings_cache) == 0
+    finally:
+        parsed_docstrings_cache.maxsize = 0
+        parsed_docstrings_cache.clear()
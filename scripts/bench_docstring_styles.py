@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# Script to measure the throughput of docstring style inference, in docstrings per second.
+# Usage: `python scripts/bench_docstring_styles.py [PACKAGE...]` (default: `griffe`).
+
+from __future__ import annotations
+
+import logging
+import sys
+from time import perf_counter
+
+from griffe import Alias, Docstring, Object, infer_docstring_style, load
+
+
+def _docstrings(obj: Object | Alias) -> list[Docstring]:
+    if obj.is_alias:
+        return []
+    docstrings = [obj.docstring] if obj.docstring else []
+    for member in obj.members.values():
+        docstrings.extend(_docstrings(member))
+    return docstrings
+
+
+def main(packages: list[str]) -> None:
+    """Infer styles of all docstrings in the given packages, with each detection method."""
+    logging.disable(logging.WARNING)
+    docstrings = [docstring for package in packages for docstring in _docstrings(load(package))]
+    print(f"{len(docstrings)} docstrings")
+    for method in ("heuristics", "max_sections"):
+        start = perf_counter()
+        for docstring in docstrings:
+            infer_docstring_style(docstring, method=method)
+        elapsed = perf_counter() - start
+        print(f"{method}: {len(docstrings) / elapsed:.0f} docstrings/s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["griffe"])
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: ISC
+
+# Copyright (c) 2021, Timothée Mazzucotelli and contributors
+
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# Script to measure the memory retained by loaded packages, in bytes per object.
+# Usage: `python scripts/bench_memory.py [PACKAGE...]` (default: `griffe`).
+
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+import tracemalloc
+
+from griffe import GriffeLoader, Object
+
+
+def _count(obj: Object) -> int:
+    return 1 + sum(_count(member) for member in obj.members.values() if not member.is_alias)  # ty:ignore[invalid-argument-type]
+
+
+def main(packages: list[str]) -> None:
+    """Load the given packages without their sources, and report the memory they retain."""
+    logging.disable(logging.WARNING)
+    gc.collect()
+    tracemalloc.start()
+    loader = GriffeLoader(store_source=False)
+    loaded = [loader.load(package) for package in packages]
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = sum(_count(package) for package in loaded)  # ty:ignore[invalid-argument-type]
+    print(f"{objects} objects")
+    print(f"retained: {retained / 1024:.0f} KiB ({retained / objects:.0f} bytes/object)")
+    print(f"peak: {peak / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["griffe"])